@@ -4,12 +4,26 @@ Streamlit Web Application
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
+import sys
+import time
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.incremental import MANIFEST_FILE, apply_updates, pending_updates, read_manifest
+from src.query import DistrictIndex
+from src.gap_analysis import PRIORITY_THRESHOLDS
+from src.scoring import DEFAULT_WEIGHTS, ScoringEngine
+from src.optimizer import SLIDER_BUDGETS, OptimizerService, frontier_lookup
+from src.aggregates import compute_aggregates
+from src.export import EXPORT_FORMATS, ExportCache
+from src import figures
+from src.tiling import TileIndex, build_tiles, load_tiles
+from src.simulation import BUDGET_CAPS, NUM_PLANS, QUARTERS, THROUGHPUTS, what_if
+from src.storage import APP_TABLES, data_version, load_app_tables, read_table
+from src.profiling import DEFAULT_EXPORT_FILE, create_profiler, export_path
+from src.serving import SERVED_TABLES, attach, ensure_published, serve_path
+
 # ============================================================================
 # PAGE CONFIGURATION
 # ============================================================================
@@ -213,27 +227,190 @@ st.markdown("""
 # DATA LOADING
 # ============================================================================
 
-@st.cache_data
-def load_data():
-    """Load all processed datasets"""
-    DATA_PATH = Path("data/processed")
+DATA_PATH = Path("data/processed")
+
+# Shared-memory snapshot folder (LMC_SERVE), or None to load per process
+SERVE_PATH = serve_path()
+
+@st.cache_data(max_entries=2)
+def load_data(tables_version):
+    """Load all processed datasets (Parquet when converted, CSV otherwise), once per tables_version"""
+    # Read the manifest version first: tables written after it already contain its updates
+    base_version = read_manifest(DATA_PATH)['version']
     
-    gap_df = pd.read_csv(DATA_PATH / "district_gap_analysis.csv")
-    state_df = pd.read_csv(DATA_PATH / "state_gap_analysis.csv")
-    camps_df = pd.read_csv(DATA_PATH / "mobile_camp_locations.csv")
-    scenarios_df = pd.read_csv(DATA_PATH / "optimization_scenarios.csv")
-    phased_df = pd.read_csv(DATA_PATH / "phased_deployment_plan.csv")
+    gap_df, state_df, camps_df, scenarios_df, phased_df = load_app_tables(DATA_PATH)
     
-    return gap_df, state_df, camps_df, scenarios_df, phased_df
+    return gap_df, state_df, camps_df, scenarios_df, phased_df, base_version
+
+@st.cache_resource(max_entries=2)
+def attach_tables(version):
+    """Read-only views of a published snapshot, shared by all sessions"""
+    return attach(version, SERVE_PATH)
+
+def load_shared(meta):
+    """load_data() from the shared-memory snapshot described by meta (see ensure_published)"""
+    frames = attach_tables(meta['version'])
+    return tuple(frames[name] for name in APP_TABLES) + (meta['base_version'],)
+
+@st.cache_resource(max_entries=2)
+def load_updates(_gap_df, _state_df, _updates, tables_version, manifest_version):
+    """Gap and state tables patched with pending updates, one read-only copy shared by all sessions"""
+    return apply_updates(_gap_df, _state_df, _updates)
+
+def manifest_mtime():
+    """Modification time of the change manifest (0 if there is none)"""
+    path = DATA_PATH / MANIFEST_FILE
+    return path.stat().st_mtime if path.exists() else 0
+
+@st.cache_data(max_entries=2)
+def read_frontier(frontier_version):
+    """Precomputed coverage-vs-budget frontier (None until python -m src.optimizer --frontier)"""
+    try:
+        return read_table('pareto_frontier', DATA_PATH)
+    except FileNotFoundError:
+        return None
+
+def load_frontier():
+    """read_frontier(), or the shared copy when serving"""
+    if SERVE_PATH is not None:
+        meta = ensure_published(DATA_PATH, SERVE_PATH, SERVED_TABLES)
+        return attach_tables(meta['version']).get('pareto_frontier')
+    return read_frontier(data_version(DATA_PATH, ['pareto_frontier']))
+
+@st.cache_data
+def load_aggregates(_gap_df, _state_df, _camps_df, data_key):
+    """Headline metrics and top-N tables (recomputed when data_key changes)"""
+    return compute_aggregates(_gap_df, _state_df, _camps_df)
+
+@st.cache_resource
+def get_district_index(_gap_df, data_key):
+    """Query indexes over the district table (rebuilt when data_key changes)"""
+    return DistrictIndex(_gap_df)
+
+@st.cache_resource
+def get_scoring_engine(_gap_df, data_key):
+    """Priority score components of the district table (rebuilt when data_key changes)"""
+    return ScoringEngine(_gap_df)
+
+@st.cache_resource
+def get_optimizer(camps_df):
+    """Optimizer service shared by all sessions (one per camp table)"""
+    return OptimizerService(camps_df)
+
+@st.cache_resource
+def get_export_cache():
+    """Export bytes shared by all sessions"""
+    return ExportCache()
+
+def export_buttons(label, df, file_stem, export_key):
+    """
+    Format picker and download button serialising df only on request
+
+    export_key identifies the filtered view; prepared exports are reused
+    until the data version changes.
+    """
+    name = export_key[0]
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        fmt = st.selectbox("Export format", list(EXPORT_FORMATS), key=f"{name}_format",
+                           label_visibility="collapsed")
+    
+    cache = get_export_cache()
+    key = (data_key, export_key, fmt)
+    data = cache.get(key)
+    with col2:
+        if data is None and st.button(f"⚙️ Prepare {label}", key=f"{name}_prepare"):
+            with timed(f"export:{name}"):
+                data = cache.export(key, df, fmt)
+        if data is not None:
+            mime, extension = EXPORT_FORMATS[fmt]
+            st.download_button(f"📥 {label}", data, f"{file_stem}{extension}", mime=mime,
+                               key=f"{name}_download")
+
+@st.cache_resource
+def get_tile_index(_camps_df, data_key):
+    """Map tiles (python -m src.tiling), or camp-only tiles built on the fly"""
+    tiles = load_tiles(DATA_PATH)
+    if tiles is None:
+        tiles = build_tiles(_camps_df)
+    return TileIndex(tiles)
+
+@st.cache_data
+def run_what_if(_camps_df, data_key, num_plans, quarters, budget_caps, throughputs):
+    """Best simulated plans and the best schedule (per data version and settings)"""
+    return what_if(_camps_df, num_plans, quarters, budget_caps, throughputs)
+
+@st.cache_resource
+def get_figure_cache():
+    """Built figures shared by all sessions"""
+    return figures.FigureCache()
+
+def plot(name, params, builder, *args, **kwargs):
+    """Render a figure, rebuilt only when the data version or params change"""
+    with timed(f"figure:{name}"):
+        fig = get_figure_cache().get_or_build((data_key, name, params), builder, *args, **kwargs)
+        st.plotly_chart(fig, use_container_width=True)
+
+@st.cache_resource
+def get_profiler():
+    """Section timings shared by all sessions (no-op unless LMC_PROFILE is set)"""
+    return create_profiler()
 
-# Load data
+def timed(name):
+    """Profiler section of the current page"""
+    return profiler.section(scope, name)
+
+def interaction():
+    """Keyed widget changed since this session's previous rerun ('load' on the first)"""
+    values = {key: value for key, value in st.session_state.items() if not key.startswith('_')}
+    previous = st.session_state.get('_profile_widgets')
+    st.session_state['_profile_widgets'] = values
+    if previous is None:
+        return 'load'
+    # Widgets first rendered in this rerun are not the trigger
+    changed = sorted(key for key, value in values.items() if key in previous and previous[key] != value)
+    if 'page' in changed:
+        return 'page'
+    return changed[0] if changed else 'rerun'
+
+profiler = get_profiler()
+scope = 'app'
+rerun_start = time.perf_counter()
+
+# Load data (again whenever the pipeline rewrites the tables)
 try:
-    gap_df, state_df, camps_df, scenarios_df, phased_df = load_data()
+    with timed('load_data'):
+        if SERVE_PATH is not None:
+            meta = ensure_published(DATA_PATH, SERVE_PATH, SERVED_TABLES)
+            tables_version = meta['version']
+            gap_df, state_df, camps_df, scenarios_df, phased_df, base_version = load_shared(meta)
+        else:
+            tables_version = data_version(DATA_PATH, APP_TABLES)
+            gap_df, state_df, camps_df, scenarios_df, phased_df, base_version = load_data(tables_version)
     DATA_LOADED = True
 except Exception as e:
     st.error(f"❌ Error loading data: {e}")
     st.stop()
 
+# Changes when a data file is rewritten or an update is applied
+with timed('data_version'):
+    data_key = (data_version(DATA_PATH, APP_TABLES + ['pareto_frontier', 'map_tiles'], [MANIFEST_FILE]),
+                base_version)
+
+# Pick up incremental monthly updates without a full reload (the loaded
+# frames are used as they are when the tables already contain every update)
+if manifest_mtime():
+    manifest = read_manifest(DATA_PATH)
+    updates = pending_updates(manifest, base_version)
+    if updates:
+        with timed('load_updates'):
+            gap_df, state_df = load_updates(gap_df, state_df, updates, tables_version, manifest['version'])
+
+with timed('district_index'):
+    district_index = get_district_index(gap_df, data_key)
+with timed('aggregates'):
+    aggregates = load_aggregates(gap_df, state_df, camps_df, data_key)
+
 # ============================================================================
 # SIDEBAR NAVIGATION
 # ============================================================================
@@ -251,18 +428,22 @@ st.sidebar.markdown("---")
 page = st.sidebar.radio(
     "Navigate to:",
     ["🏠 Dashboard", "🗺️ Interactive Map", "📊 Gap Analysis", 
-     "🎯 Mobile Camps", "💰 Resource Optimizer", "📅 Deployment Plan"],
-    index=0
+     "🎯 Mobile Camps", "💰 Resource Optimizer", "📅 Deployment Plan"]
+    + (["🩺 Diagnostics"] if profiler.enabled else []),
+    index=0,
+    key='page'
 )
+scope = page
+page_start = time.perf_counter()
 
 st.sidebar.markdown("---")
 
 # Quick stats in sidebar
 st.sidebar.markdown("### 📊 Quick Stats")
-total_districts = len(gap_df)
-total_unreached = gap_df['unreached_population'].sum()
-total_camps = len(camps_df)
-total_budget = camps_df['total_cost'].sum() / 10**7
+total_districts = aggregates['total_districts']
+total_unreached = aggregates['total_unreached']
+total_camps = aggregates['total_camps']
+total_budget = aggregates['total_budget_crores']
 
 st.sidebar.metric("Districts", f"{total_districts:,}")
 st.sidebar.metric("Unreached", f"{total_unreached/10**7:.1f} Cr")
@@ -289,11 +470,9 @@ if page == "🏠 Dashboard":
     col1, col2, col3, col4 = st.columns(4)
     
     # Calculate national metrics
-    national_coverage = (gap_df['total_enrolment'].sum() / 
-                        gap_df['population_2025'].sum() * 100)
-    total_unreached = gap_df['unreached_population'].sum()
-    critical_districts = len(gap_df[gap_df['priority_level'] == 'CRITICAL'])
-    est_budget = camps_df['total_cost'].sum() / 10**7
+    national_coverage = aggregates['national_coverage']
+    critical_districts = aggregates['critical_districts']
+    est_budget = aggregates['total_budget_crores']
     
     with col1:
         st.markdown(f"""
@@ -327,7 +506,7 @@ if page == "🏠 Dashboard":
         <div class='metric-card'>
             <h3 class='metric-value'>₹{est_budget:.0f} Cr</h3>
             <p class='metric-label'>Est. Budget</p>
-            <p class='metric-delta'>{len(camps_df)} mobile camps</p>
+            <p class='metric-delta'>{aggregates['total_camps']} mobile camps</p>
         </div>
         """, unsafe_allow_html=True)
     
@@ -338,63 +517,23 @@ if page == "🏠 Dashboard":
     
     with col1:
         st.markdown("### 📊 Top 10 States by Unreached Population")
-        top_states = state_df.nlargest(10, 'unreached')
-        fig = px.bar(
-            top_states,
-            x='unreached',
-            y='state',
-            orientation='h',
-            color='coverage_rate',
-            color_continuous_scale='RdYlGn',
-            labels={'unreached': 'Unreached Population', 'state': 'State'}
-        )
-        fig.update_layout(
-            height=400,
-            showlegend=False,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        plot('top_states', None, figures.top_states_bar, aggregates['top_states'])
     
     with col2:
         st.markdown("### 🎯 Priority Distribution")
-        priority_counts = gap_df['priority_level'].value_counts()
-        colors = {'CRITICAL': '#dc2626', 'HIGH': '#f97316', 
-                 'MEDIUM': '#eab308', 'LOW': '#22c55e'}
-        fig = px.pie(
-            values=priority_counts.values,
-            names=priority_counts.index,
-            color=priority_counts.index,
-            color_discrete_map=colors
-        )
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        plot('priority_pie', None, figures.priority_pie, aggregates['priority_counts'])
     
     st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
     
     # Top Priority Districts Table
     st.markdown("### 🚨 Top 20 Priority Districts")
-    top_20 = gap_df.nlargest(20, 'priority_score')[
-        ['state', 'district', 'population_2025', 'coverage_rate', 
-         'unreached_population', 'priority_level']
-    ].copy()
-    
-    # Format numbers
-    top_20['population_2025'] = top_20['population_2025'].apply(lambda x: f"{x:,.0f}")
-    top_20['coverage_rate'] = top_20['coverage_rate'].apply(lambda x: f"{x:.1f}%")
-    top_20['unreached_population'] = top_20['unreached_population'].apply(lambda x: f"{x:,}")
+    top_20 = aggregates['top_districts']
     
     st.dataframe(top_20, use_container_width=True, height=400)
     
     # Download button
-    csv = gap_df.to_csv(index=False)
-    st.download_button(
-        label="📥 Download Complete Gap Analysis (CSV)",
-        data=csv,
-        file_name="last_mile_connect_gap_analysis.csv",
-        mime="text/csv"
-    )
+    export_buttons("Download Complete Gap Analysis", gap_df,
+                   "last_mile_connect_gap_analysis", ('gap_analysis',))
 
 # ============================================================================
 # PAGE 2: INTERACTIVE MAP
@@ -409,34 +548,52 @@ elif page == "🗺️ Interactive Map":
     """, unsafe_allow_html=True)
     
     # Filters
-    col1, col2, col3 = st.columns(3)
+    col1, col2 = st.columns(2)
     
     with col1:
-        show_camps = st.checkbox("Show Mobile Camps", value=True)
+        show_camps = st.checkbox("Show Mobile Camps", value=True, key='map_show_camps')
     with col2:
-        priority_filter = st.multiselect(
-            "Filter by Priority",
-            ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW'],
-            default=['CRITICAL', 'HIGH']
-        )
-    with col3:
         state_select = st.selectbox(
             "Focus on State",
-            ['All States'] + sorted(gap_df['state'].unique().tolist())
+            ['All States'] + sorted(gap_df['state'].unique().tolist()),
+            key='map_state'
         )
     
-    # Filter data
-    filtered_df = gap_df.copy()
-    if priority_filter:
-        filtered_df = filtered_df[filtered_df['priority_level'].isin(priority_filter)]
-    if state_select != 'All States':
-        filtered_df = filtered_df[filtered_df['state'] == state_select]
-    
-    # Create visualization (simplified - no actual map due to time)
+    # Map: pre-aggregated grid cells of the selected zoom inside the viewport
     st.markdown("### 📍 Priority Districts Map")
-    st.info("🗺️ Interactive Folium map would be displayed here with:\n- Choropleth by coverage rate\n- Markers for mobile camps\n- Click-to-view district details")
+    tile_index = get_tile_index(camps_df, data_key)
+    zoom = st.select_slider("Zoom", options=tile_index.zoom_levels,
+                            value=tile_index.zoom_levels[len(tile_index.zoom_levels) // 2],
+                            key='map_zoom')
+    
+    map_state = None if state_select == 'All States' else state_select
+    with timed('tile_query'):
+        bounds = tile_index.bounds(map_state)
+        pincode_cells = tile_index.query('pincodes', zoom, map_state, bounds)
+        camp_cells = tile_index.query('camps', zoom, map_state, bounds) if show_camps else None
+    plot('map', (zoom, map_state, show_camps), figures.coverage_map,
+         pincode_cells, camp_cells, zoom, bounds)
+    
+    if 'pincodes' not in tile_index.layers:
+        st.caption("Coverage layer not built yet: run `python -m src.tiling` "
+                   "(needs pincode_enrolment.csv and pincode coordinates)")
+    else:
+        st.caption(f"{len(pincode_cells):,} coverage cells · grid of all priorities")
+    
+    # District table: the priority filter applies here, the map shows every cell
+    priority_filter = st.multiselect(
+        "Filter by Priority",
+        ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW'],
+        default=['CRITICAL', 'HIGH'],
+        key='map_priority'
+    )
+    
+    # Filter data (memoised row positions, no copy of the full table)
+    with timed('district_filter'):
+        filtered_df = gap_df.iloc[district_index.filter(
+            priority_filter, None if state_select == 'All States' else state_select
+        )]
     
-    # Show filtered data instead
     st.markdown(f"### Showing {len(filtered_df)} districts")
     
     # Quick stats
@@ -465,22 +622,13 @@ elif page == "📊 Gap Analysis":
     </div>
     """, unsafe_allow_html=True)
     
-    tab1, tab2 = st.tabs(["State Level", "District Level"])
+    tab1, tab2, tab3 = st.tabs(["State Level", "District Level", "Priority Scoring"])
     
     with tab1:
         st.markdown("### State-wise Coverage Analysis")
         
         # State comparison chart
-        fig = px.bar(
-            state_df.nlargest(15, 'unreached'),
-            x='state',
-            y=['enrolled', 'unreached'],
-            barmode='stack',
-            labels={'value': 'Population', 'variable': 'Category'},
-            color_discrete_sequence=['#10b981', '#ef4444']
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        plot('state_stack', None, figures.state_stack_bar, state_df)
         
         # State table
         st.dataframe(
@@ -493,14 +641,10 @@ elif page == "📊 Gap Analysis":
         st.markdown("### District-wise Analysis")
         
         # Search
-        search = st.text_input("🔍 Search districts", "")
+        search = st.text_input("🔍 Search districts", "", key='gap_search')
         
-        display_df = gap_df.copy()
-        if search:
-            display_df = display_df[
-                display_df['district'].str.contains(search, case=False) |
-                display_df['state'].str.contains(search, case=False)
-            ]
+        with timed('district_search'):
+            display_df = gap_df.iloc[district_index.search(search)] if search else gap_df
         
         st.markdown(f"Showing {len(display_df)} of {len(gap_df)} districts")
         
@@ -512,8 +656,54 @@ elif page == "📊 Gap Analysis":
         )
         
         # Export
-        csv = display_df.to_csv(index=False)
-        st.download_button("📥 Export Filtered Data", csv, "filtered_gap_analysis.csv")
+        export_buttons("Export Filtered Data", display_df, "filtered_gap_analysis",
+                       ('filtered_gap_analysis', search.lower()))
+    
+    with tab3:
+        st.markdown("### Priority Weights and Thresholds")
+        st.caption("Priority score = unreached weight x (unreached / max unreached) + gap weight x (gap % / 100)")
+        
+        engine = get_scoring_engine(gap_df, data_key)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            unreached_weight = st.slider("Unreached population weight", 0, 100, int(DEFAULT_WEIGHTS[0]), 5,
+                                         key='score_unreached_weight')
+            gap_weight = st.slider("Coverage gap weight", 0, 100, int(DEFAULT_WEIGHTS[1]), 5,
+                                   key='score_gap_weight')
+        with col2:
+            critical_below = st.slider("CRITICAL below coverage (%)", 0, 100, int(PRIORITY_THRESHOLDS[0]),
+                                       key='score_critical_below')
+            high_below = st.slider("HIGH below coverage (%)", 0, 100, int(PRIORITY_THRESHOLDS[1]),
+                                   key='score_high_below')
+            medium_below = st.slider("MEDIUM below coverage (%)", 0, 100, int(PRIORITY_THRESHOLDS[2]),
+                                     key='score_medium_below')
+        
+        weights = (unreached_weight, gap_weight)
+        thresholds = sorted((critical_below, high_below, medium_below))
+        
+        start = time.perf_counter()
+        with timed('rescore'):
+            ranked_df = engine.apply(gap_df.assign(previous_rank=gap_df['priority_rank']), weights, thresholds)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        st.caption(f"Re-ranked {len(ranked_df):,} districts in {elapsed_ms:.1f} ms")
+        
+        counts = engine.level_counts(thresholds)
+        baseline = gap_df['priority_level'].value_counts().reindex(counts.index, fill_value=0)
+        for col, level in zip(st.columns(len(counts)), counts.index):
+            with col:
+                st.metric(level, f"{counts[level]:,}", f"{counts[level] - baseline[level]:+,}")
+        
+        ranked_df['rank_change'] = ranked_df['previous_rank'] - ranked_df['priority_rank']
+        st.dataframe(
+            ranked_df[['priority_rank', 'rank_change', 'state', 'district', 'coverage_rate',
+                       'unreached_population', 'priority_score', 'priority_level']].head(100),
+            use_container_width=True,
+            height=500
+        )
+        
+        export_buttons("Export Re-ranked Districts", ranked_df, "reranked_gap_analysis",
+                       ('reranked_gap_analysis', weights, tuple(thresholds)))
 
 # ============================================================================
 # PAGE 4: MOBILE CAMPS
@@ -546,34 +736,30 @@ elif page == "🎯 Mobile Camps":
     with col1:
         selected_state = st.selectbox(
             "Filter by State",
-            ['All States'] + sorted(camps_df['state'].unique().tolist())
+            ['All States'] + sorted(camps_df['state'].unique().tolist()),
+            key='camps_state'
         )
     with col2:
         selected_priority = st.multiselect(
             "Filter by Priority",
             ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW'],
-            default=['CRITICAL', 'HIGH']
+            default=['CRITICAL', 'HIGH'],
+            key='camps_priority'
         )
     
     # Filter camps
-    filtered_camps = camps_df.copy()
-    if selected_state != 'All States':
-        filtered_camps = filtered_camps[filtered_camps['state'] == selected_state]
-    if selected_priority:
-        filtered_camps = filtered_camps[filtered_camps['camp_priority'].isin(selected_priority)]
+    with timed('camp_filter'):
+        filtered_camps = camps_df.copy()
+        if selected_state != 'All States':
+            filtered_camps = filtered_camps[filtered_camps['state'] == selected_state]
+        if selected_priority:
+            filtered_camps = filtered_camps[filtered_camps['camp_priority'].isin(selected_priority)]
     
     st.markdown(f"### Showing {len(filtered_camps)} camps")
     
     # Camp distribution chart
-    fig = px.bar(
-        filtered_camps.groupby('camp_priority').size().reset_index(name='count'),
-        x='camp_priority',
-        y='count',
-        color='camp_priority',
-        color_discrete_map={'CRITICAL': '#dc2626', 'HIGH': '#f97316', 
-                           'MEDIUM': '#eab308', 'LOW': '#22c55e'}
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    plot('camp_priority', (selected_state, frozenset(selected_priority)),
+         figures.camp_priority_bar, filtered_camps)
     
     # Camp list
     st.dataframe(
@@ -584,8 +770,8 @@ elif page == "🎯 Mobile Camps":
     )
     
     # Download
-    csv = filtered_camps.to_csv(index=False)
-    st.download_button("📥 Download Camp List", csv, "mobile_camps.csv")
+    export_buttons("Download Camp List", filtered_camps, "mobile_camps",
+                   ('mobile_camps', selected_state, frozenset(selected_priority)))
 
 # ============================================================================
 # PAGE 5: RESOURCE OPTIMIZER
@@ -608,48 +794,87 @@ elif page == "💰 Resource Optimizer":
     col1, col2 = st.columns(2)
     
     with col1:
-        fig = px.bar(
-            scenarios_df,
-            x='Scenario',
-            y='Coverage',
-            color='Scenario',
-            labels={'Coverage': 'Expected Coverage (Citizens)'}
-        )
-        fig.update_layout(showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
+        plot('scenario_coverage', None, figures.scenario_bar, scenarios_df,
+             'Coverage', 'Expected Coverage (Citizens)')
     
     with col2:
-        fig = px.bar(
-            scenarios_df,
-            x='Scenario',
-            y='Cost (Cr)',
-            color='Scenario',
-            labels={'Cost (Cr)': 'Total Cost (Crores)'}
-        )
-        fig.update_layout(showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
+        plot('scenario_cost', None, figures.scenario_bar, scenarios_df,
+             'Cost (Cr)', 'Total Cost (Crores)')
     
     # Recommended scenario
     st.success("✅ **Recommended**: BALANCED scenario offers optimal coverage per rupee spent")
     
-    # Custom optimizer (simplified)
+    # Custom optimizer
     st.markdown("---")
-    st.markdown("### 🎛️ Custom Budget Calculator")
-    
-    budget_input = st.slider("Available Budget (Crores)", 100, 1500, 500, 50)
-    
-    # Simple estimation
-    avg_cost_per_camp = camps_df['total_cost'].mean() / 10**7
-    estimated_camps = int(budget_input / avg_cost_per_camp)
-    estimated_coverage = estimated_camps * camps_df['coverage_population'].mean()
+    st.markdown("### 🎛️ Custom Budget Optimizer")
     
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Est. Camps", f"{estimated_camps}")
+        budget_input = st.slider("Available Budget (Crores)", min(SLIDER_BUDGETS),
+                                 max(SLIDER_BUDGETS), 500, SLIDER_BUDGETS.step, key='opt_budget')
     with col2:
-        st.metric("Est. Coverage", f"{estimated_coverage/10**6:.1f}M")
+        timeline_input = st.select_slider("Timeline (months)", options=[6, 12, 18, 24], value=12,
+                                          key='opt_timeline')
     with col3:
-        st.metric("Cost per Camp", f"₹{avg_cost_per_camp:.2f} Cr")
+        priority_input = st.multiselect(
+            "Camp Priority",
+            options=['CRITICAL', 'HIGH', 'MEDIUM', 'LOW'],
+            default=['CRITICAL', 'HIGH', 'MEDIUM', 'LOW'],
+            key='opt_priority'
+        )
+    enforce_timeline = st.checkbox(
+        "Each camp must finish within the timeline",
+        value=False,
+        help="Otherwise camps run in parallel and the timeline is reported only",
+        key='opt_enforce_timeline'
+    )
+    
+    optimizer = get_optimizer(camps_df)
+    # Solve the other slider steps in the background
+    optimizer.warm_up(timeline_input, priority_input, enforce_timeline)
+    with timed('optimizer_solve'):
+        result, selected_camps = optimizer.solve(budget_input, timeline_input, priority_input,
+                                                 enforce_timeline)
+    
+    if result['num_camps'] == 0:
+        st.warning("⚠️ No camps fit this budget, timeline and priority selection")
+    else:
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Camps", f"{result['num_camps']}")
+        with col2:
+            st.metric("Coverage", f"{result['total_coverage']/10**6:.2f}M")
+        with col3:
+            st.metric("Cost", f"₹{result['total_cost_crores']:.2f} Cr",
+                      f"{result['budget_utilization_pct']:.1f}% of budget", delta_color="off")
+        with col4:
+            st.metric("Cost per Enrollment", f"₹{result['cost_per_enrollment']:.2f}")
+        
+        st.caption(
+            f"Estimated timeline: {result['estimated_timeline_months']} months · "
+            f"Greedy selection: {result['greedy_coverage']:,} citizens "
+            f"({result['optimality_gap_pct']:.3f}% below the {result['gap_reference']}) · "
+            f"Within {result['bound_gap_pct']:.3f}% of the LP bound"
+        )
+        if not result['optimal']:
+            st.warning(f"Optimality not proven (solver: {result['method']}, {result['status']}); "
+                       f"showing the best selection found")
+        
+        st.dataframe(
+            selected_camps[['camp_id', 'state', 'district', 'coverage_population',
+                            'estimated_days', 'camp_priority', 'total_cost']],
+            use_container_width=True
+        )
+    
+    # Full coverage-vs-budget curve
+    frontier = load_frontier()
+    if frontier is not None:
+        st.markdown("### 📈 Coverage vs Budget Frontier")
+        point = frontier_lookup(frontier, budget_input)
+        
+        plot('frontier', budget_input, figures.frontier_curve, frontier, point,
+             f"₹{budget_input} Cr")
+        st.caption("All camps, parallel deployment (no priority or timeline filter)")
 
 # ============================================================================
 # PAGE 6: DEPLOYMENT PLAN
@@ -669,28 +894,10 @@ elif page == "📅 Deployment Plan":
     st.dataframe(phased_df, use_container_width=True)
     
     # Cumulative progress chart
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=phased_df['Quarter'],
-        y=phased_df['Cumulative_Coverage'],
-        mode='lines+markers',
-        name='Cumulative Coverage',
-        line=dict(color='#2563eb', width=3),
-        fill='tozeroy'
-    ))
-    
-    fig.update_layout(
-        title="Cumulative Coverage Growth",
-        xaxis_title="Quarter",
-        yaxis_title="Coverage (Citizens)",
-        height=400
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    plot('cumulative_coverage', None, figures.cumulative_coverage, phased_df)
     
     # Phase details
-    for idx, row in phased_df.iterrows():
+    for row in phased_df.to_dict('records'):
         with st.expander(f"📍 {row['Quarter']} - {row['Num_Camps']} camps"):
             col1, col2, col3 = st.columns(3)
             with col1:
@@ -700,6 +907,86 @@ elif page == "📅 Deployment Plan":
             with col3:
                 st.metric("States", row['States_Covered'])
 
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    st.markdown("### 🔬 What-If Simulation")
+    st.caption("Alternative phasings (camp order, quarterly budget cap, camp throughput) "
+               "simulated together; unspent budget rolls over to the next quarter")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        budget_caps = st.multiselect("Quarterly budget caps (₹ Crores)",
+                                     [50, 75, 100, 125, 150, 200, 250], default=BUDGET_CAPS,
+                                     key='sim_budget_caps')
+        throughputs = st.multiselect("Camp throughput (enrolments/day)",
+                                     [300, 400, 500, 600, 800], default=THROUGHPUTS,
+                                     key='sim_throughputs')
+    with col2:
+        quarters = st.slider("Quarters", min_value=2, max_value=12, value=QUARTERS, key='sim_quarters')
+        num_plans = st.select_slider("Plans simulated", options=[500, 1000, 2000, 5000, 10000],
+                                     value=NUM_PLANS, key='sim_plans')
+
+    if not budget_caps or not throughputs:
+        st.info("Select at least one budget cap and one throughput.")
+    else:
+        with timed('what_if'):
+            best_df, schedule_df = run_what_if(camps_df, data_key, num_plans, quarters,
+                                               tuple(sorted(budget_caps)), tuple(sorted(throughputs)))
+
+        st.markdown("#### 🏆 Best Plans")
+        st.dataframe(best_df, use_container_width=True, hide_index=True)
+
+        st.markdown("#### 📅 Best Plan Schedule")
+        st.dataframe(schedule_df, use_container_width=True, hide_index=True)
+        plot('what_if_coverage', (num_plans, quarters, tuple(sorted(budget_caps)), tuple(sorted(throughputs))),
+             figures.cumulative_coverage, schedule_df)
+
+# ============================================================================
+# DIAGNOSTICS (only listed when LMC_PROFILE is set)
+# ============================================================================
+
+elif page == "🩺 Diagnostics":
+    st.markdown("""
+    <div class='app-header'>
+        <h1>🩺 Diagnostics</h1>
+        <p>Section and rerun latency across all sessions since the server started</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    summary = profiler.summary()
+    reruns = summary[summary['section'] == 'rerun']
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Reruns", f"{int(reruns['calls'].sum()):,}")
+    with col2:
+        st.metric("Slowest page p95", f"{reruns['p95_ms'].max():.0f} ms" if len(reruns) else "-")
+    with col3:
+        st.metric("Sections", f"{len(summary):,}")
+    
+    st.markdown("### ⏱️ Reruns by Page and Widget Interaction")
+    st.dataframe(summary[summary['section'].str.startswith(('rerun', 'interaction:'))],
+                 use_container_width=True, hide_index=True)
+    
+    st.markdown("### 🔍 Sections")
+    scopes = st.multiselect("Scope", sorted(summary['scope'].unique()), key='diag_scopes')
+    sections = summary[~summary['section'].str.startswith(('rerun', 'interaction:'))]
+    if scopes:
+        sections = sections[sections['scope'].isin(scopes)]
+    st.dataframe(sections, use_container_width=True, hide_index=True)
+    
+    col1, col2, col3 = st.columns(3)
+    target = export_path() or DEFAULT_EXPORT_FILE
+    with col1:
+        if st.button("💾 Write JSON", key='diag_json'):
+            st.success(f"✅ Saved: {profiler.export(target.with_suffix('.json'))}")
+    with col2:
+        if st.button("💾 Write Prometheus", key='diag_prom'):
+            st.success(f"✅ Saved: {profiler.export(target.with_suffix('.prom'))}")
+    with col3:
+        if st.button("🗑️ Reset", key='diag_reset'):
+            profiler.reset()
+    st.caption("Set LMC_PROFILE_FILE to export automatically (.prom: Prometheus text, otherwise JSON)")
+
 # ============================================================================
 # FOOTER
 # ============================================================================
@@ -712,3 +999,11 @@ st.markdown("""
     <p>Built with Streamlit | © 2026 | <a href='#'>Documentation</a> | <a href='#'>GitHub</a></p>
 </div>
 """, unsafe_allow_html=True)
+
+# Page body and whole rerun, per page and per triggering widget
+if profiler.enabled:
+    now = time.perf_counter()
+    profiler.record(page, 'page_body', now - page_start)
+    profiler.record(page, 'rerun', now - rerun_start)
+    profiler.record(page, f"interaction:{interaction()}", now - rerun_start)
+    profiler.maybe_export()
@@ -0,0 +1,4 @@
+"""
+LAST MILE CONNECT - Benchmarks
+Synthetic data generators and timing scripts for the data pipeline.
+"""
@@ -0,0 +1,70 @@
+"""
+LAST MILE CONNECT - Ingestion Benchmark
+Throughput of src.ingestion from 1 to N worker processes on synthetic shards:
+
+    python -m benchmarks.bench_ingestion --shards 12 --rows 200000 --max-workers 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from src.ingestion import ingest_raw
+from benchmarks.synthetic import write_raw_shards
+
+
+def assert_same_outputs(expected, actual):
+    """Parallel output must equal the single-process output"""
+    for name, df in expected.items():
+        pd.testing.assert_frame_equal(
+            df.reset_index(drop=True), actual[name].reset_index(drop=True), check_dtype=False
+        )
+
+
+def run(shards, rows, max_workers, chunksize):
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Generating {shards} shards x {rows:,} rows per dataset...")
+        total_rows = write_raw_shards(tmp, shards=shards, rows_per_shard=rows)
+
+        results = []
+        baseline = None
+        for workers in range(1, max_workers + 1):
+            start = time.perf_counter()
+            outputs = ingest_raw(tmp, chunksize=chunksize, workers=workers)
+            elapsed = time.perf_counter() - start
+
+            if baseline is None:
+                baseline = (outputs, elapsed)
+            else:
+                assert_same_outputs(baseline[0], outputs)
+
+            results.append({
+                'workers': workers,
+                'seconds': round(elapsed, 2),
+                'rows_per_sec': int(total_rows / elapsed),
+                'speedup': round(baseline[1] / elapsed, 2),
+            })
+            print(f"   workers={workers}: {elapsed:.2f}s ({total_rows / elapsed:,.0f} rows/s)")
+
+    return pd.DataFrame(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark parallel raw ingestion")
+    parser.add_argument("--shards", type=int, default=12, help="Shards per dataset")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per shard")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1,
+                        help="Largest worker count to time")
+    parser.add_argument("--chunksize", type=int, default=250_000, help="Rows per chunk")
+    args = parser.parse_args(argv)
+
+    results = run(args.shards, args.rows, args.max_workers, args.chunksize)
+    print("\n📊 INGESTION SCALING:")
+    print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
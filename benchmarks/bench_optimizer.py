@@ -0,0 +1,80 @@
+"""
+LAST MILE CONNECT - Budget Optimizer Benchmark
+Greedy ROI selection (notebook 05) against the exact knapsack solvers of
+src.optimizer on synthetic candidate camps, from 200 to 20k camps:
+
+    python -m benchmarks.bench_optimizer --sizes 200 1000 5000 20000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.optimizer import (
+    CRORE, fractional_bound, greedy_selection, knapsack_exact_dp, knapsack_milp,
+)
+from benchmarks.synthetic import camp_table
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def check_selection(selected, costs, budget):
+    assert len(np.unique(selected)) == len(selected), "camp selected twice"
+    assert costs[selected].sum() <= budget, "budget exceeded"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark camp budget optimisation")
+    parser.add_argument("--sizes", type=int, nargs='+', default=[200, 1000, 5000, 20000],
+                        help="Candidate camp counts")
+    parser.add_argument("--budget-share", type=float, default=0.3,
+                        help="Budget as a share of the cost of all candidates")
+    parser.add_argument("--skip-milp", action='store_true', help="Only run greedy and DP")
+    parser.add_argument("--time-limit", type=float, default=30, help="MILP time limit (s)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    print(f"{'Camps':>7} {'Budget (Cr)':>12} {'Solver':>7} {'Time (s)':>9} "
+          f"{'Coverage':>14} {'Gap vs best %':>14} {'Gap to LP %':>12}")
+
+    for n_camps in args.sizes:
+        camps_df = camp_table(n_camps, seed=args.seed)
+        costs = camps_df['total_cost'].to_numpy(dtype=float)
+        values = camps_df['coverage_population'].to_numpy(dtype=float)
+        budget = float(np.floor(costs.sum() * args.budget_share))
+        bound = fractional_bound(costs, values, budget)
+
+        runs = {}
+        runs['greedy'] = timed(greedy_selection, costs, values, budget)
+        greedy_coverage = values[runs['greedy'][0]].sum()
+        (selected, status), elapsed = timed(knapsack_exact_dp, costs, values, budget, greedy_coverage)
+        runs['dp'] = (selected, elapsed)
+        if status != 'optimal':
+            print(f"   ⚠️  DP gave up at {n_camps:,} camps ({status})")
+        if not args.skip_milp:
+            (selected, status), elapsed = timed(knapsack_milp, costs, values, budget,
+                                                time_limit=args.time_limit)
+            runs['milp'] = (selected, elapsed)
+            if status != 'optimal':
+                print(f"   ⚠️  MILP not proven optimal at {n_camps:,} camps ({status})")
+
+        coverage = {name: values[selected].sum() for name, (selected, _) in runs.items()}
+        best = max(coverage.values())
+        for name, (selected, elapsed) in runs.items():
+            check_selection(selected, costs, budget)
+            # No feasible selection can beat the LP relaxation
+            assert coverage[name] <= bound + 1e-6
+            print(f"{n_camps:>7,} {budget / CRORE:>12,.1f} {name:>7} {elapsed:>9.3f} "
+                  f"{coverage[name]:>14,.0f} {(best - coverage[name]) / best * 100:>14.4f} "
+                  f"{(bound - coverage[name]) / bound * 100:>12.4f}")
+
+    print("\n✅ All selections feasible and within the LP bound")
+
+
+if __name__ == "__main__":
+    main()
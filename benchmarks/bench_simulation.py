@@ -0,0 +1,82 @@
+"""
+LAST MILE CONNECT - Deployment Simulation Benchmark
+Batch plan simulation of src.simulation against a plan-by-plan loop, on
+synthetic candidate camps (results must match):
+
+    python -m benchmarks.bench_simulation --camps 200 --plans 5000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.simulation import (
+    DAYS_PER_QUARTER, best_plans, camp_costs, generate_plans, simulate_plans,
+)
+from benchmarks.synthetic import camp_table
+
+
+def simulate_loop(coverage, plans, p):
+    """One plan, camp by camp and quarter by quarter"""
+    quarters = plans.quarters
+    throughput = plans.throughput[p]
+    released = 0.0
+    spent = 0.0
+    position = 0
+    starts = []
+    cumulative = np.zeros(quarters)
+    for q in range(quarters):
+        released += plans.caps[p, q]
+        while position < len(coverage):
+            camp = plans.order[p, position]
+            _, cost = camp_costs(coverage[camp], throughput)
+            if spent + cost > released:
+                break
+            spent += cost
+            starts.append((camp, q))
+            position += 1
+        for camp, start in starts:
+            enrolled = min(coverage[camp], throughput * DAYS_PER_QUARTER * (q - start + 1))
+            cumulative[q] += enrolled
+    return cumulative
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark batch deployment simulation")
+    parser.add_argument("--camps", type=int, default=200, help="Candidate camps")
+    parser.add_argument("--plans", type=int, default=5000, help="Plans simulated")
+    parser.add_argument("--quarters", type=int, default=4)
+    parser.add_argument("--check", type=int, default=200,
+                        help="Plans re-simulated by the loop (timing is extrapolated)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    camps_df = camp_table(args.camps, seed=args.seed)
+    coverage = camps_df['coverage_population'].to_numpy(dtype=float)
+    budget = camp_costs(coverage, 500)[1].sum() / (2 * args.quarters) / 10**7
+    plans = generate_plans(camps_df, args.plans, args.quarters,
+                           budget_caps=[budget * 0.8, budget, budget * 1.2], seed=args.seed)
+
+    start = time.perf_counter()
+    results = simulate_plans(camps_df, plans)
+    best = best_plans(plans, results)
+    batch_time = time.perf_counter() - start
+
+    checked = np.random.default_rng(args.seed).choice(len(plans), min(args.check, len(plans)),
+                                                      replace=False)
+    start = time.perf_counter()
+    for p in checked:
+        expected = simulate_loop(coverage, plans, p)
+        assert np.allclose(results['cumulative_coverage'][p], expected), f"plan {p} differs"
+    loop_time = (time.perf_counter() - start) / len(checked) * len(plans)
+
+    print(f"{args.plans:,} plans x {args.camps:,} camps x {args.quarters} quarters")
+    print(f"   Batch: {batch_time:.2f}s   Loop (extrapolated): {loop_time:.2f}s   "
+          f"Speed-up: {loop_time / batch_time:.0f}x")
+    print(f"   {len(checked)} plans match the loop")
+    print(best.head().to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+LAST MILE CONNECT - Uncertainty Benchmark
+Monte Carlo bands of src.uncertainty on synthetic camps, for several worker
+counts (results must not depend on the number of workers):
+
+    python -m benchmarks.bench_uncertainty --camps 2000 --draws 100000 --workers 1 4 8
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from src.uncertainty import monte_carlo
+from benchmarks.synthetic import camp_table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Monte Carlo uncertainty bands")
+    parser.add_argument("--camps", type=int, default=2000, help="Candidate camps")
+    parser.add_argument("--draws", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, nargs='+', default=[1, 4])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    camps_df = camp_table(args.camps, seed=args.seed)
+    print(f"{args.draws:,} draws x {args.camps:,} camps")
+
+    reference = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        camp_bands, scenario_bands = monte_carlo(camps_df, num_draws=args.draws,
+                                                 workers=workers, seed=args.seed)
+        elapsed = time.perf_counter() - start
+        print(f"   {workers:>3} workers: {elapsed:.2f}s")
+
+        if reference is None:
+            reference = (camp_bands, scenario_bands)
+        else:
+            pd.testing.assert_frame_equal(camp_bands, reference[0])
+            pd.testing.assert_frame_equal(scenario_bands, reference[1])
+
+    print("   Bands identical across worker counts")
+    print(reference[1].to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
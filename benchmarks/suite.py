@@ -0,0 +1,309 @@
+"""
+LAST MILE CONNECT - Benchmark Suite
+Times the pipeline and app hot paths on synthetic data at multiples of
+today's data size, stores the results as JSON and flags regressions against
+a baseline run:
+
+- ingest: notebook-01 aggregations (src.ingestion, one worker)
+- gap: notebook-02 gap computation (build_gap_analysis)
+- features / cluster: notebook-03 pincode features and camp clustering
+- optimize: optimize_camp_deployment for every scenario
+- app_*: district index, filters, search, headline aggregates and priority
+  re-scoring of the Streamlit pages
+
+    python -m benchmarks.suite --scales 1 10 --output benchmarks/results/current.json
+    python -m benchmarks.suite --scales 1 --baseline benchmarks/results/baseline.json
+
+Generated data is written to --data-dir (reused by later runs) or a
+temporary directory.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import sklearn
+
+from src.aggregates import compute_aggregates
+from src.clustering import cluster_camps
+from src.features import build_clustering_data, filter_priority_locations
+from src.gap_analysis import PRIORITY_LEVELS, build_gap_analysis
+from src.ingestion import ingest_raw
+from src.optimizer import SCENARIOS, optimize_camp_deployment
+from src.query import DistrictIndex
+from src.scoring import ScoringEngine
+from benchmarks.synthetic import (
+    SCALES, STATES, camp_table, census_table, district_names, district_summary_table,
+    pincode_tables, scaled_size, write_raw_shards,
+)
+
+RESULTS_PATH = Path("benchmarks/results")
+
+CASES = ['ingest', 'gap', 'features', 'cluster', 'optimize',
+         'app_index', 'app_filter', 'app_search', 'app_aggregate', 'app_rescore']
+
+# A case regresses when its median time exceeds the baseline by this share
+# and by at least MIN_DELTA seconds (ignores noise on sub-millisecond cases)
+TOLERANCE = 0.25
+MIN_DELTA = 0.005
+
+SEARCH_TERMS = ['pradesh', 'district 01', 'kerala', 'xyz']
+RESCORE_WEIGHTS = [(60, 40), (50, 50), (80, 20), (30, 70)]
+
+
+class ScaleData:
+    """Synthetic inputs of one scale, generated on first use"""
+
+    def __init__(self, scale, root, seed=42):
+        self.scale = scale
+        self.seed = seed
+        self.size = scaled_size(scale)
+        self.root = Path(root) / f"scale_{scale:g}_seed_{seed}"
+        self.districts = district_names(self.size['districts_per_state'])
+
+    @cached_property
+    def raw_path(self):
+        raw_path = self.root / "raw"
+        done = raw_path / ".complete"
+        if not done.exists():
+            print(f"   generating {self.size['shards']} x {self.size['rows_per_shard']:,} rows per dataset...")
+            write_raw_shards(raw_path, shards=self.size['shards'], rows_per_shard=self.size['rows_per_shard'],
+                             seed=self.seed, districts_per_state=self.size['districts_per_state'],
+                             pincodes_per_district=self.size['pincodes_per_district'])
+            done.touch()
+        return raw_path
+
+    @cached_property
+    def raw_rows(self):
+        return self.size['shards'] * self.size['rows_per_shard'] * 3
+
+    @cached_property
+    def district_summary(self):
+        return district_summary_table(self.seed, self.districts)
+
+    @cached_property
+    def census_df(self):
+        return census_table(self.seed, self.districts)
+
+    @cached_property
+    def gap(self):
+        return build_gap_analysis(self.district_summary, self.census_df)
+
+    @cached_property
+    def pincodes(self):
+        return pincode_tables(self.size['pincodes_per_district'], self.seed, self.districts)
+
+    @cached_property
+    def priority_data(self):
+        pincode_df, pincode_geo = self.pincodes
+        return filter_priority_locations(build_clustering_data(pincode_df, self.gap[0], pincode_geo))
+
+    @cached_property
+    def camps_df(self):
+        return camp_table(self.size['camps'], self.seed, self.districts)
+
+
+# ============================================================================
+# CASES
+# ============================================================================
+
+def setup_case(case, data, cluster_method):
+    """
+    Callable timed for one case and the number of input rows it processes
+    """
+    if case == 'ingest':
+        raw_path = data.raw_path
+        return (lambda: ingest_raw(raw_path, workers=1)), data.raw_rows
+
+    if case == 'gap':
+        summary, census_df = data.district_summary, data.census_df
+        return (lambda: build_gap_analysis(summary, census_df)), len(summary)
+
+    if case == 'features':
+        pincode_df, pincode_geo = data.pincodes
+        gap_df = data.gap[0]
+        return (lambda: filter_priority_locations(build_clustering_data(pincode_df, gap_df, pincode_geo))), \
+            len(pincode_df)
+
+    if case == 'cluster':
+        priority_data, n_camps = data.priority_data, data.size['camps']
+        return (lambda: cluster_camps(priority_data, n_camps, method=cluster_method)), len(priority_data)
+
+    if case == 'optimize':
+        camps_df = data.camps_df
+
+        def run():
+            for params in SCENARIOS.values():
+                optimize_camp_deployment(camps_df, params['budget_crores'], params['timeline_months'],
+                                         params['priority_filter'], verbose=False)
+        return run, len(camps_df)
+
+    gap_df, state_df = data.gap
+    if case == 'app_index':
+        return (lambda: DistrictIndex(gap_df)), len(gap_df)
+
+    if case == 'app_filter':
+        index = DistrictIndex(gap_df)
+        selections = [(levels, state) for levels in ([], PRIORITY_LEVELS[:1], PRIORITY_LEVELS[:2])
+                      for state in [None] + STATES]
+
+        def run():
+            # Uncached path: the app memoises repeated selections
+            for levels, state in selections:
+                gap_df.iloc[index._filter(frozenset(levels) or None, state)]
+        return run, len(gap_df)
+
+    if case == 'app_search':
+        index = DistrictIndex(gap_df)
+
+        def run():
+            for text in SEARCH_TERMS:
+                gap_df.iloc[index._search(text)]
+        return run, len(gap_df)
+
+    if case == 'app_aggregate':
+        camps_df = data.camps_df
+        return (lambda: compute_aggregates(gap_df, state_df, camps_df)), len(gap_df)
+
+    if case == 'app_rescore':
+        engine = ScoringEngine(gap_df)
+
+        def run():
+            for weights in RESCORE_WEIGHTS:
+                engine.apply(gap_df, weights)
+        return run, len(gap_df)
+
+    raise ValueError(f"Unknown case: {case}")
+
+
+def time_case(func, repeat):
+    """Wall time of repeat calls"""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run_suite(scales, cases=CASES, repeat=3, data_dir=None, seed=42, cluster_method='minibatch'):
+    """
+    Time every case at every scale
+
+    Returns:
+    --------
+    results : list of dict
+        case, scale, rows, repeat, min_s, median_s, max_s
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(data_dir) if data_dir else Path(tmp)
+        results = []
+        for scale in scales:
+            data = ScaleData(scale, root, seed)
+            print(f"\n📏 Scale {scale:g}x: {len(data.districts):,} districts, "
+                  f"{data.size['camps']:,} camps, {data.raw_rows:,} raw rows")
+            for case in cases:
+                func, rows = setup_case(case, data, cluster_method)
+                times = time_case(func, repeat)
+                results.append({
+                    'case': case, 'scale': scale, 'rows': int(rows), 'repeat': repeat,
+                    'min_s': round(min(times), 6), 'median_s': round(float(np.median(times)), 6),
+                    'max_s': round(max(times), 6),
+                })
+                print(f"   {case:<14} {np.median(times):>10.4f}s  ({rows:,} rows)")
+    return results
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'sklearn': sklearn.__version__,
+    }
+
+
+# ============================================================================
+# REGRESSIONS
+# ============================================================================
+
+def compare(results, baseline, tolerance=TOLERANCE, min_delta=MIN_DELTA):
+    """
+    Median times against a baseline run
+
+    Returns:
+    --------
+    comparison : DataFrame
+        case, scale, baseline_s, current_s, ratio and regression, for the
+        (case, scale) pairs present in both runs
+    """
+    current = pd.DataFrame(results)[['case', 'scale', 'median_s']]
+    previous = pd.DataFrame(baseline['results'])[['case', 'scale', 'median_s']]
+    comparison = previous.merge(current, on=['case', 'scale'], suffixes=('_baseline', '_current'))
+    comparison.columns = ['case', 'scale', 'baseline_s', 'current_s']
+    comparison['ratio'] = (comparison['current_s'] / comparison['baseline_s']).round(3)
+    comparison['regression'] = (
+        (comparison['current_s'] > comparison['baseline_s'] * (1 + tolerance)) &
+        (comparison['current_s'] - comparison['baseline_s'] > min_delta)
+    )
+    return comparison
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline and app hot paths")
+    parser.add_argument("--scales", type=float, nargs='+', default=SCALES[:1],
+                        help=f"Multiples of today's data size (e.g. {' '.join(map(str, SCALES))})")
+    parser.add_argument("--cases", nargs='+', choices=CASES, default=CASES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cluster-method", default='minibatch', choices=['kmeans', 'minibatch'])
+    parser.add_argument("--data-dir", type=Path, help="Keep generated data here for later runs")
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH / "current.json")
+    parser.add_argument("--baseline", type=Path, help="Earlier --output to compare against")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="Allowed slowdown as a share of the baseline median")
+    args = parser.parse_args(argv)
+
+    scales = [int(scale) if float(scale).is_integer() else scale for scale in args.scales]
+    results = run_suite(scales, args.cases, args.repeat, args.data_dir, args.seed, args.cluster_method)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps({
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment(),
+        'seed': args.seed,
+        'cluster_method': args.cluster_method,
+        'results': results,
+    }, indent=1))
+    print(f"\n✅ Saved: {args.output}")
+
+    if args.baseline:
+        comparison = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        print(f"\n📊 AGAINST BASELINE ({args.baseline}):")
+        print(comparison.to_string(index=False))
+        regressions = comparison[comparison['regression']]
+        if len(regressions):
+            print(f"\n❌ {len(regressions)} regression(s) over {args.tolerance:.0%}")
+            sys.exit(1)
+        print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+LAST MILE CONNECT - Synthetic Data
+UIDAI-like raw shards, census, pincode and camp tables for benchmarks (no
+real data required), at multiples of today's data size (SCALES).
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.ingestion import DATASETS
+
+STATES = [
+    'Uttar Pradesh', 'Bihar', 'Maharashtra', 'West Bengal', 'Madhya Pradesh',
+    'Rajasthan', 'Tamil Nadu', 'Karnataka', 'Gujarat', 'Andhra Pradesh',
+    'Odisha', 'Telangana', 'Kerala', 'Jharkhand', 'Assam', 'Punjab',
+    'Chhattisgarh', 'Haryana', 'Delhi', 'Jammu And Kashmir'
+]
+
+# Today's data (1x): ~5M raw rows over the three datasets, 700 districts
+# (20 states x 35), ~19k pincodes and 200 camps; other scales multiply every count
+BASE_SIZE = {
+    'shards': 4,
+    'rows_per_shard': 400_000,
+    'districts_per_state': 35,
+    'pincodes_per_district': 27,
+    'camps': 200,
+}
+SCALES = [1, 10, 100]
+
+# Generator defaults: the 1x shape
+DISTRICTS_PER_STATE = BASE_SIZE['districts_per_state']
+PINCODES_PER_DISTRICT = BASE_SIZE['pincodes_per_district']
+
+
+def scaled_size(scale):
+    """
+    BASE_SIZE multiplied by scale
+
+    Shards are added rather than grown, and districts rather than pincodes
+    per district, so per-file and per-district sizes stay realistic.
+    """
+    shards = max(1, round(BASE_SIZE['shards'] * scale))
+    total_rows = BASE_SIZE['shards'] * BASE_SIZE['rows_per_shard'] * scale
+    return {
+        'shards': shards,
+        'rows_per_shard': max(1000, round(total_rows / shards)),
+        'districts_per_state': max(1, round(BASE_SIZE['districts_per_state'] * scale)),
+        'pincodes_per_district': BASE_SIZE['pincodes_per_district'],
+        'camps': max(10, round(BASE_SIZE['camps'] * scale)),
+    }
+
+
+def raw_shard(rows, seed, months=range(3, 13), year=2025, duplicate_fraction=0.02,
+              dataset='enrolment', districts_per_state=DISTRICTS_PER_STATE,
+              pincodes_per_district=PINCODES_PER_DISTRICT):
+    """
+    One raw shard with the same columns as the UIDAI CSVs
+
+    Names come with the stray whitespace / casing that ingestion normalises,
+    and a fraction of rows is repeated to exercise deduplication.
+    """
+    rng = np.random.default_rng(seed)
+    months = np.asarray(list(months))
+
+    state_idx = rng.integers(0, len(STATES), rows)
+    district_idx = rng.integers(0, districts_per_state, rows)
+    pincode_idx = rng.integers(0, pincodes_per_district, rows)
+
+    states = np.array([name.upper() if i % 3 == 0 else f" {name}" for i, name in enumerate(STATES)])
+    day = rng.integers(1, 29, rows)
+    month = months[rng.integers(0, len(months), rows)]
+
+    df = pd.DataFrame({
+        'date': pd.Series(day).astype(str).str.zfill(2) + '-' +
+                pd.Series(month).astype(str).str.zfill(2) + f'-{year}',
+        'state': states[state_idx],
+        'district': pd.Series(district_idx).map(lambda d: f"district {d:03d}").values,
+        'pincode': 100000 + state_idx * 10000 + district_idx * 100 + pincode_idx,
+    })
+    df['district'] = df['district'] + ' ' + pd.Series(state_idx).astype(str).values
+
+    for col in DATASETS[dataset]:
+        df[col] = rng.poisson(8, rows)
+
+    n_dupes = int(rows * duplicate_fraction)
+    if n_dupes:
+        df = pd.concat([df, df.sample(n_dupes, random_state=seed)], ignore_index=True)
+    return df
+
+
+def write_raw_shards(root, shards=8, rows_per_shard=100_000, seed=42,
+                     districts_per_state=DISTRICTS_PER_STATE,
+                     pincodes_per_district=PINCODES_PER_DISTRICT):
+    """
+    Write enrolment/, biometric/ and demographic/ shards under root
+
+    Returns:
+    --------
+    total_rows : int
+        Rows written across all shards
+    """
+    root = Path(root)
+    total_rows = 0
+    for d, dataset in enumerate(DATASETS):
+        folder = root / dataset
+        folder.mkdir(parents=True, exist_ok=True)
+        for shard in range(shards):
+            df = raw_shard(rows_per_shard, seed + 1000 * d + shard, dataset=dataset,
+                           districts_per_state=districts_per_state,
+                           pincodes_per_district=pincodes_per_district)
+            df.to_csv(folder / f"{dataset}_{shard:03d}.csv", index=False)
+            total_rows += len(df)
+    return total_rows
+
+
+def district_names(districts_per_state=DISTRICTS_PER_STATE):
+    """(state, district) pairs matching the normalised names of raw_shard()"""
+    return [
+        (state, f"District {d:03d} {s}")
+        for s, state in enumerate(STATES)
+        for d in range(districts_per_state)
+    ]
+
+
+def census_table(seed=0, districts=None):
+    """Census 2011 table (CENSUS_FILE layout) for the synthetic districts"""
+    rng = np.random.default_rng(seed)
+    names = district_names() if districts is None else districts
+    census_df = pd.DataFrame(names, columns=['state', 'district'])
+    census_df['population_2011'] = rng.integers(150_000, 4_000_000, len(census_df))
+    return census_df
+
+
+def district_summary_table(seed=0, districts=None):
+    """district_summary.csv-like enrolment totals for the synthetic districts"""
+    from src.ingestion import SUMMARY_COLUMNS
+
+    rng = np.random.default_rng(seed)
+    names = district_names() if districts is None else districts
+    summary = pd.DataFrame(names, columns=['state', 'district'])
+    n = len(summary)
+    for col in SUMMARY_COLUMNS:
+        summary[col] = rng.integers(50_000, 2_000_000, n)
+    summary['total_enrolment'] = summary[['age_0_5', 'age_5_17', 'age_18_greater']].sum(axis=1)
+    return summary
+
+
+def gap_table(seed=0, districts=None):
+    """district_gap_analysis-like table for the synthetic districts"""
+    rng = np.random.default_rng(seed)
+    names = district_names() if districts is None else districts
+    gap_df = pd.DataFrame(names, columns=['state', 'district'])
+    n = len(gap_df)
+    gap_df['population_2025'] = rng.integers(200_000, 5_000_000, n)
+    gap_df['total_enrolment'] = (gap_df['population_2025'] * rng.uniform(0.4, 1.0, n)).astype(int)
+    gap_df['coverage_rate'] = (gap_df['total_enrolment'] / gap_df['population_2025'] * 100).round(2)
+    gap_df['unreached_population'] = gap_df['population_2025'] - gap_df['total_enrolment']
+    gap_df['priority_level'] = np.select(
+        [gap_df['coverage_rate'] < 70, gap_df['coverage_rate'] < 85, gap_df['coverage_rate'] < 95],
+        ['CRITICAL', 'HIGH', 'MEDIUM'], 'LOW'
+    )
+    return gap_df
+
+
+def pincode_tables(pincodes_per_district=PINCODES_PER_DISTRICT, seed=0, districts=None):
+    """
+    pincode_enrolment-like table and pincode coordinates
+
+    Pincodes of a district are scattered around a district centre inside
+    India's bounding box.
+    """
+    rng = np.random.default_rng(seed)
+    names = district_names() if districts is None else districts
+    n_districts = len(names)
+
+    district_idx = np.repeat(np.arange(n_districts), pincodes_per_district)
+    n = len(district_idx)
+    pincode_df = pd.DataFrame({
+        'state': [names[i][0] for i in district_idx],
+        'district': [names[i][1] for i in district_idx],
+        'pincode': 100000 + np.arange(n),
+        'total_enrolment': rng.poisson(300, n),
+    })
+
+    centre_lat = rng.uniform(8.5, 32.0, n_districts)
+    centre_lon = rng.uniform(69.0, 94.0, n_districts)
+    pincode_geo = pd.DataFrame({
+        'pincode': pincode_df['pincode'],
+        'latitude': centre_lat[district_idx] + rng.normal(0, 0.2, n),
+        'longitude': centre_lon[district_idx] + rng.normal(0, 0.2, n),
+    })
+    return pincode_df, pincode_geo
+
+
+def camp_table(n_camps, seed=0, districts=None):
+    """mobile_camp_locations-like table of n_camps candidate camps"""
+    from src.clustering import classify_camp_priorities, estimate_costs
+
+    rng = np.random.default_rng(seed)
+    names = district_names() if districts is None else districts
+    district_idx = rng.integers(0, len(names), n_camps)
+
+    camps_df = pd.DataFrame({
+        'latitude': rng.uniform(8.5, 32.0, n_camps),
+        'longitude': rng.uniform(69.0, 94.0, n_camps),
+        'camp_id': np.arange(1, n_camps + 1),
+        'state': [names[i][0] for i in district_idx],
+        'district': [names[i][1] for i in district_idx],
+        'coverage_population': rng.lognormal(9.5, 1.2, n_camps).astype(int) + 100,
+    })
+    camps_df = camps_df.sort_values('coverage_population', ascending=False).reset_index(drop=True)
+    camps_df['priority_rank'] = range(1, n_camps + 1)
+    camps_df['camp_priority'] = classify_camp_priorities(camps_df['priority_rank'], n_camps)
+    return estimate_costs(camps_df)
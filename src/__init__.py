@@ -0,0 +1,4 @@
+"""
+LAST MILE CONNECT - Source Code Modules
+Reusable data, analysis and serving components shared by the notebooks and the web application.
+"""
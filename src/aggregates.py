@@ -0,0 +1,63 @@
+"""
+LAST MILE CONNECT - Headline Aggregates
+Metrics and top-N tables shown by the sidebar and the Dashboard page.
+
+Computed once per data version (see src.storage.data_version) instead of on
+every Streamlit rerun.
+"""
+
+CRORE = 10**7
+
+TOP_STATES = 10
+TOP_DISTRICTS = 20
+
+TOP_DISTRICT_COLUMNS = ['state', 'district', 'population_2025', 'coverage_rate',
+                        'unreached_population', 'priority_level']
+
+
+def format_top_districts(top_districts):
+    """Display strings for the top districts table"""
+    top_districts = top_districts.copy()
+    top_districts['population_2025'] = top_districts['population_2025'].map('{:,.0f}'.format)
+    top_districts['coverage_rate'] = top_districts['coverage_rate'].map('{:.1f}%'.format)
+    top_districts['unreached_population'] = top_districts['unreached_population'].map('{:,}'.format)
+    return top_districts
+
+
+def compute_aggregates(gap_df, state_df, camps_df,
+                       top_states=TOP_STATES, top_districts=TOP_DISTRICTS):
+    """
+    Headline metrics and top-N tables
+
+    Parameters:
+    -----------
+    gap_df : DataFrame
+        District gap analysis
+    state_df : DataFrame
+        State gap analysis
+    camps_df : DataFrame
+        Mobile camp locations
+
+    Returns:
+    --------
+    aggregates : dict
+        Scalars (total_districts, total_unreached, critical_districts,
+        national_coverage, total_camps, total_budget_crores), priority_counts
+        (non-zero levels), top_states and top_districts (formatted)
+    """
+    priority_counts = gap_df['priority_level'].astype(str).value_counts()
+
+    return {
+        'total_districts': len(gap_df),
+        'total_unreached': int(gap_df['unreached_population'].sum()),
+        'critical_districts': int(priority_counts.get('CRITICAL', 0)),
+        'national_coverage': (gap_df['total_enrolment'].sum() /
+                              gap_df['population_2025'].sum() * 100),
+        'total_camps': len(camps_df),
+        'total_budget_crores': camps_df['total_cost'].sum() / CRORE,
+        'priority_counts': priority_counts[priority_counts > 0],
+        'top_states': state_df.nlargest(top_states, 'unreached'),
+        'top_districts': format_top_districts(
+            gap_df.nlargest(top_districts, 'priority_score')[TOP_DISTRICT_COLUMNS]
+        ),
+    }
@@ -0,0 +1,492 @@
+"""
+LAST MILE CONNECT - Camp Clustering Engine
+K-Means placement of mobile enrolment camps (03_clustering.ipynb as a module).
+
+- full KMeans or MiniBatchKMeans for national-size inputs
+- parallel K sweep (elbow method) with warm starts between neighbouring K
+- fitted models cached on disk, keyed by a hash of the input features
+- native weighted clustering: raw coordinates on the unit sphere with
+  estimated_unreached as sample weights (identical coordinates collapsed)
+
+    python -m src.clustering --method minibatch --sweep --workers 8
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.preprocessing import StandardScaler
+
+from .features import build_clustering_data, filter_priority_locations, load_pincode_geo
+
+DATA_PATH = Path("data/processed")
+EXTERNAL_PATH = Path("data/external")
+CACHE_PATH = Path("data/cache/models")
+
+OPTIMAL_CAMPS = 200
+K_RANGE = range(50, 351, 50)
+RANDOM_STATE = 42
+
+MINIBATCH_SIZE = 4096
+
+EARTH_RADIUS_KM = 6371.0
+
+# Cost assumptions (in INR)
+COST_PER_CAMP_SETUP = 150000  # ₹1.5 lakh setup
+COST_PER_CAMP_OPERATION_DAY = 25000  # ₹25k per day
+ENROLLMENT_CAPACITY_PER_DAY = 500  # 500 enrollments/day
+COST_PER_ENROLLMENT = 50  # ₹50 materials/personnel per enrollment
+
+CAMP_COLUMNS = [
+    'latitude', 'longitude', 'camp_id', 'state', 'district', 'nearest_pincode',
+    'coverage_population', 'num_locations', 'priority_rank', 'camp_priority',
+    'estimated_days', 'setup_cost', 'operational_cost', 'enrollment_cost', 'total_cost'
+]
+
+
+# ============================================================================
+# FEATURES
+# ============================================================================
+
+def prepare_features(priority_data):
+    """
+    Weighted, standardised coordinates (notebook 03, section 5)
+
+    Returns:
+    --------
+    features_scaled : ndarray
+        Matrix to cluster
+    scaler : StandardScaler
+        Fitted scaler (for mapping centres back)
+    valid_idx : Index
+        Rows of priority_data with numeric coordinates
+    weights : ndarray
+        sqrt(estimated_unreached) of the valid rows
+    """
+    features = priority_data[['latitude', 'longitude']].apply(pd.to_numeric, errors='coerce')
+    valid_idx = features.dropna().index
+    features = features.loc[valid_idx]
+
+    # Weight by unreached population (sqrt to limit outliers)
+    weights = np.sqrt(priority_data.loc[valid_idx, 'estimated_unreached'].astype(float).values)
+    features_weighted = features.values * weights[:, np.newaxis]
+
+    scaler = StandardScaler()
+    features_scaled = scaler.fit_transform(features_weighted)
+    return features_scaled, scaler, valid_idx, weights
+
+
+def to_unit_sphere(latitude, longitude):
+    """(N, 3) Cartesian points on the unit sphere"""
+    lat = np.radians(np.asarray(latitude, dtype=float))
+    lon = np.radians(np.asarray(longitude, dtype=float))
+    cos_lat = np.cos(lat)
+    return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+
+
+def from_unit_sphere(points):
+    """(N, 2) latitude/longitude of 3-D points (projected onto the sphere)"""
+    points = np.asarray(points, dtype=float)
+    x, y, z = points[:, 0], points[:, 1], points[:, 2]
+    lat = np.degrees(np.arctan2(z, np.hypot(x, y)))
+    lon = np.degrees(np.arctan2(y, x))
+    return np.column_stack([lat, lon])
+
+
+def collapse_locations(coords, weights):
+    """
+    Merge identical coordinates into one weighted point
+
+    Returns:
+    --------
+    unique_coords : ndarray
+        Distinct (latitude, longitude) rows
+    unique_weights : ndarray
+        Summed weight of each distinct point
+    inverse : ndarray
+        Position in unique_coords of every input row
+    """
+    unique_coords, inverse = np.unique(coords, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    unique_weights = np.bincount(inverse, weights=weights, minlength=len(unique_coords))
+    return unique_coords, unique_weights, inverse
+
+
+def prepare_weighted_features(priority_data):
+    """
+    Sphere coordinates and sample weights for weighted clustering
+
+    Squared chord distance between unit-sphere points is a monotonic function
+    of great-circle (haversine) distance, so Euclidean K-Means on these points
+    assigns every location to its geographically nearest camp, while the
+    population weights move each centre onto the unreached population mass.
+
+    Returns:
+    --------
+    points : ndarray
+        (M, 3) unit-sphere points of the distinct locations
+    weights : ndarray
+        estimated_unreached summed per distinct location
+    inverse : ndarray
+        Distinct-location position of every valid row
+    valid_idx : Index
+        Rows of priority_data with numeric coordinates
+    """
+    coords = priority_data[['latitude', 'longitude']].apply(pd.to_numeric, errors='coerce')
+    valid_idx = coords.dropna().index
+    weights = priority_data.loc[valid_idx, 'estimated_unreached'].astype(float).to_numpy()
+
+    unique_coords, unique_weights, inverse = collapse_locations(
+        coords.loc[valid_idx].to_numpy(), weights
+    )
+    points = to_unit_sphere(unique_coords[:, 0], unique_coords[:, 1])
+    return points, unique_weights, inverse, valid_idx
+
+
+# ============================================================================
+# MODEL FITTING
+# ============================================================================
+
+def make_model(k, method='kmeans', init='k-means++', n_init=10, random_state=RANDOM_STATE,
+               batch_size=MINIBATCH_SIZE):
+    """KMeans or MiniBatchKMeans with the engine's defaults"""
+    if not isinstance(init, str):
+        n_init = 1
+    if method == 'minibatch':
+        return MiniBatchKMeans(
+            n_clusters=k, init=init, n_init=n_init, batch_size=batch_size,
+            random_state=random_state
+        )
+    if method == 'kmeans':
+        return KMeans(n_clusters=k, init=init, n_init=n_init, random_state=random_state)
+    raise ValueError(f"Unknown clustering method: {method}")
+
+
+def extend_centers(features, centers, k, random_state=RANDOM_STATE, sample_weight=None):
+    """
+    Warm-start centres for k clusters from a smaller solution
+
+    The existing centres are kept and the extra ones are drawn k-means++
+    style (probability proportional to squared distance to the nearest
+    centre), so the next fit starts close to convergence.
+    """
+    rng = np.random.default_rng(random_state)
+    centers = np.asarray(centers, dtype=float)
+    if len(centers) >= k:
+        return centers[:k].copy()
+
+    weights = np.ones(len(features)) if sample_weight is None else np.asarray(sample_weight, float)
+    dist_sq = cKDTree(centers).query(features)[0] ** 2
+
+    new_centers = []
+    for _ in range(k - len(centers)):
+        p = dist_sq * weights
+        total = p.sum()
+        i = rng.choice(len(features), p=p / total) if total > 0 else rng.integers(len(features))
+        new_centers.append(features[i])
+        dist_sq = np.minimum(dist_sq, ((features - features[i]) ** 2).sum(axis=1))
+
+    return np.vstack([centers, new_centers])
+
+
+def fit_camps(features, k, method='kmeans', n_init=10, random_state=RANDOM_STATE,
+              init='k-means++', sample_weight=None):
+    """Fit one clustering model"""
+    model = make_model(k, method=method, init=init, n_init=n_init, random_state=random_state)
+    model.fit(features, sample_weight=sample_weight)
+    return model
+
+
+def _sweep_chunk(features, k_values, method, n_init, random_state, warm_start, sample_weight):
+    """Worker task: fit a run of increasing K, warm-starting each from the last"""
+    results = []
+    centers = None
+    for k in k_values:
+        if warm_start and centers is not None:
+            init = extend_centers(features, centers, k, random_state=random_state + k,
+                                  sample_weight=sample_weight)
+        else:
+            init = 'k-means++'
+        model = fit_camps(features, k, method=method, n_init=n_init,
+                          random_state=random_state, init=init, sample_weight=sample_weight)
+        centers = model.cluster_centers_
+        results.append((k, float(model.inertia_)))
+    return results
+
+
+def k_sweep(features, k_values=K_RANGE, method='minibatch', n_jobs=-1, warm_start=True,
+            n_init=3, random_state=RANDOM_STATE, sample_weight=None):
+    """
+    Inertia for every K (elbow method), fitted in parallel
+
+    K values are split into contiguous runs, one per worker; inside a run
+    each fit is warm-started from the previous K's centres.
+
+    Returns:
+    --------
+    inertias : Series
+        Inertia indexed by K
+    """
+    k_values = sorted(k_values)
+    n_jobs = joblib.cpu_count() if n_jobs in (None, -1) else max(1, n_jobs)
+    n_chunks = min(n_jobs, len(k_values))
+    chunks = [[int(k) for k in chunk] for chunk in np.array_split(k_values, n_chunks) if len(chunk)]
+
+    results = joblib.Parallel(n_jobs=n_chunks)(
+        joblib.delayed(_sweep_chunk)(
+            features, chunk, method, n_init, random_state, warm_start, sample_weight
+        )
+        for chunk in chunks
+    )
+    inertias = dict(item for chunk in results for item in chunk)
+    return pd.Series(inertias, name='inertia').rename_axis('k').sort_index()
+
+
+# ============================================================================
+# MODEL CACHE
+# ============================================================================
+
+def features_hash(features, sample_weight=None, **params):
+    """Content hash of the input matrix and fit parameters"""
+    digest = hashlib.sha256()
+    features = np.ascontiguousarray(features)
+    digest.update(str((features.shape, features.dtype.str)).encode())
+    digest.update(features.tobytes())
+    if sample_weight is not None:
+        digest.update(np.ascontiguousarray(sample_weight, dtype=float).tobytes())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    return digest.hexdigest()[:32]
+
+
+class ModelCache:
+    """Fitted models on disk, keyed by features_hash()"""
+
+    def __init__(self, cache_dir=CACHE_PATH):
+        self.cache_dir = Path(cache_dir)
+
+    def path(self, key):
+        return self.cache_dir / f"{key}.joblib"
+
+    def get_or_fit(self, features, k, method='kmeans', n_init=10, random_state=RANDOM_STATE,
+                   sample_weight=None):
+        """Load the cached model for these inputs, or fit and store it"""
+        key = features_hash(features, sample_weight, k=k, method=method, n_init=n_init,
+                            random_state=random_state)
+        path = self.path(key)
+        if path.exists():
+            return joblib.load(path)
+
+        model = fit_camps(features, k, method=method, n_init=n_init,
+                          random_state=random_state, sample_weight=sample_weight)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        joblib.dump(model, tmp_path)
+        tmp_path.replace(path)
+        return model
+
+
+# ============================================================================
+# CAMP TABLE
+# ============================================================================
+
+def nearest_locations(priority_valid, camp_coords):
+    """Row position in priority_valid of the location nearest each camp (great-circle)"""
+    points = to_unit_sphere(priority_valid['latitude'], priority_valid['longitude'])
+    camp_coords = np.asarray(camp_coords, dtype=float)
+    _, idx = cKDTree(points).query(to_unit_sphere(camp_coords[:, 0], camp_coords[:, 1]))
+    return idx
+
+
+def classify_camp_priority(rank, total_camps):
+    if rank <= total_camps * 0.2:  # Top 20%
+        return 'CRITICAL'
+    elif rank <= total_camps * 0.5:  # Top 50%
+        return 'HIGH'
+    elif rank <= total_camps * 0.8:  # Top 80%
+        return 'MEDIUM'
+    else:
+        return 'LOW'
+
+
+def classify_camp_priorities(ranks, total_camps):
+    """Vectorised classify_camp_priority()"""
+    ranks = np.asarray(ranks)
+    return np.select(
+        [ranks <= total_camps * 0.2, ranks <= total_camps * 0.5, ranks <= total_camps * 0.8],
+        ['CRITICAL', 'HIGH', 'MEDIUM'],
+        'LOW'
+    )
+
+
+def estimate_costs(camps_df):
+    """Setup + operational days + per-enrolment cost of each camp (in place)"""
+    camps_df['estimated_days'] = np.ceil(
+        camps_df['coverage_population'] / ENROLLMENT_CAPACITY_PER_DAY
+    ).astype(int)
+
+    camps_df['setup_cost'] = COST_PER_CAMP_SETUP
+    camps_df['operational_cost'] = camps_df['estimated_days'] * COST_PER_CAMP_OPERATION_DAY
+    camps_df['enrollment_cost'] = camps_df['coverage_population'] * COST_PER_ENROLLMENT
+    camps_df['total_cost'] = (
+        camps_df['setup_cost'] +
+        camps_df['operational_cost'] +
+        camps_df['enrollment_cost']
+    )
+    return camps_df
+
+
+def build_camps(priority_data, labels, camp_coords):
+    """
+    Camp table from cluster labels and centre coordinates
+
+    Parameters:
+    -----------
+    priority_data : DataFrame
+        Clustered locations (only rows with a label are used)
+    labels : Series
+        Cluster label per row of priority_data (NaN for unclustered rows)
+    camp_coords : ndarray
+        (K, 2) latitude/longitude of the camp centres
+
+    Returns:
+    --------
+    camps_df : DataFrame
+        Ranked camps with nearest district/pincode, coverage and costs
+    assignments : DataFrame
+        Pincode-to-camp mapping
+    """
+    camps_df = pd.DataFrame(camp_coords, columns=['latitude', 'longitude'])
+    camps_df['camp_id'] = range(1, len(camps_df) + 1)
+
+    priority_valid = priority_data.dropna(subset=['latitude', 'longitude'])
+    nearest = priority_valid.iloc[nearest_locations(priority_valid, camp_coords)]
+    camps_df['state'] = nearest['state'].values
+    camps_df['district'] = nearest['district'].values
+    if 'pincode' in priority_valid.columns:
+        camps_df['nearest_pincode'] = nearest['pincode'].values
+
+    clustered = priority_data.assign(camp_cluster=labels).dropna(subset=['camp_cluster'])
+    cluster = clustered['camp_cluster'].astype(int).to_numpy()
+    camps_df['coverage_population'] = np.bincount(
+        cluster, weights=clustered['estimated_unreached'].to_numpy(), minlength=len(camps_df)
+    ).astype(int)
+    camps_df['num_locations'] = np.bincount(cluster, minlength=len(camps_df))
+
+    camps_df = camps_df.sort_values('coverage_population', ascending=False).reset_index(drop=True)
+    camps_df['priority_rank'] = range(1, len(camps_df) + 1)
+    camps_df['camp_priority'] = classify_camp_priorities(camps_df['priority_rank'], len(camps_df))
+    camps_df = estimate_costs(camps_df)
+
+    assignment_cols = [col for col in ['state', 'district', 'pincode', 'latitude', 'longitude',
+                                       'estimated_unreached'] if col in clustered.columns]
+    assignments = clustered[assignment_cols].copy()
+    assignments['camp_cluster'] = cluster
+    assignments['camp_id'] = cluster + 1
+    assignments = assignments.merge(camps_df[['camp_id', 'camp_priority']], on='camp_id', how='left')
+
+    camps_df = camps_df[[col for col in CAMP_COLUMNS if col in camps_df.columns]]
+    return camps_df, assignments
+
+
+def cluster_camps(priority_data, n_camps=OPTIMAL_CAMPS, method='kmeans', n_init=20,
+                  random_state=RANDOM_STATE, cache=None, weighting='sample'):
+    """
+    Place n_camps camps over the priority locations
+
+    Parameters:
+    -----------
+    weighting : str
+        'sample' - raw coordinates on the unit sphere, estimated_unreached as
+        sample weights, identical coordinates collapsed (default)
+        'legacy' - notebook 03: coordinates multiplied by sqrt(unreached) and
+        standardised
+
+    Returns:
+    --------
+    camps_df, assignments : DataFrame
+        See build_camps()
+    """
+    if weighting == 'legacy':
+        features, scaler, valid_idx, _ = prepare_features(priority_data)
+        sample_weight = None
+        inverse = np.arange(len(valid_idx))
+    elif weighting == 'sample':
+        features, sample_weight, inverse, valid_idx = prepare_weighted_features(priority_data)
+    else:
+        raise ValueError(f"Unknown weighting: {weighting}")
+
+    if cache is not None:
+        model = cache.get_or_fit(features, n_camps, method=method, n_init=n_init,
+                                 random_state=random_state, sample_weight=sample_weight)
+    else:
+        model = fit_camps(features, n_camps, method=method, n_init=n_init,
+                          random_state=random_state, sample_weight=sample_weight)
+
+    labels = pd.Series(np.nan, index=priority_data.index)
+    labels.loc[valid_idx] = model.predict(features)[inverse]
+
+    if weighting == 'legacy':
+        # Cluster centres: standardised → original space
+        camp_coords = scaler.inverse_transform(model.cluster_centers_)
+    else:
+        camp_coords = from_unit_sphere(model.cluster_centers_)
+    return build_camps(priority_data, labels, camp_coords)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate mobile camp locations")
+    parser.add_argument("--data-path", type=Path, default=DATA_PATH)
+    parser.add_argument("--external-path", type=Path, default=EXTERNAL_PATH)
+    parser.add_argument("--camps", type=int, default=OPTIMAL_CAMPS, help="Number of camps (K)")
+    parser.add_argument("--method", choices=['kmeans', 'minibatch'], default='kmeans')
+    parser.add_argument("--weighting", choices=['sample', 'legacy'], default='sample',
+                        help="Sample-weighted sphere coordinates or the notebook's scaled copy")
+    parser.add_argument("--sweep", action="store_true", help="Run the elbow K sweep first")
+    parser.add_argument("--workers", type=int, default=-1, help="Processes for the K sweep")
+    parser.add_argument("--cache-dir", default=str(CACHE_PATH),
+                        help="Fitted model cache (empty string disables)")
+    args = parser.parse_args(argv)
+
+    gap_df = pd.read_csv(args.data_path / "district_gap_analysis.csv")
+    pincode_df = pd.read_csv(args.data_path / "pincode_enrolment.csv")
+    pincode_geo = load_pincode_geo(args.external_path)
+    if pincode_geo is None:
+        raise FileNotFoundError("Pincode coordinates not found - required for camp clustering")
+
+    clustering_data = build_clustering_data(pincode_df, gap_df, pincode_geo)
+    priority_data = filter_priority_locations(clustering_data)
+    print(f"✅ Priority locations: {len(priority_data):,}")
+
+    if args.sweep:
+        if args.weighting == 'legacy':
+            features, _, _, _ = prepare_features(priority_data)
+            sample_weight = None
+        else:
+            features, sample_weight, _, _ = prepare_weighted_features(priority_data)
+        inertias = k_sweep(features, method=args.method, n_jobs=args.workers,
+                           sample_weight=sample_weight)
+        print("\n📊 ELBOW METHOD:")
+        print(inertias.to_string())
+
+    cache = ModelCache(Path(args.cache_dir)) if args.cache_dir else None
+    camps_df, assignments = cluster_camps(priority_data, args.camps, method=args.method,
+                                          cache=cache, weighting=args.weighting)
+
+    camps_df.to_csv(args.data_path / "mobile_camp_locations.csv", index=False)
+    print("✅ Saved: mobile_camp_locations.csv")
+    assignments.to_csv(args.data_path / "pincode_camp_assignments.csv", index=False)
+    print("✅ Saved: pincode_camp_assignments.csv")
+
+
+if __name__ == "__main__":
+    main()
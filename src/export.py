@@ -0,0 +1,96 @@
+"""
+LAST MILE CONNECT - Data Export
+On-demand table exports for the web application download buttons.
+
+Tables are serialised only when an export is requested, and the bytes are
+kept in a size-bounded LRU cache keyed by (data version, filter key, format),
+so reruns and repeated downloads of the same view are free.
+"""
+
+import gzip
+import io
+import threading
+from collections import OrderedDict
+
+# Format -> (MIME type, file extension)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', '.csv'),
+    'csv.gz': ('application/gzip', '.csv.gz'),
+    'parquet': ('application/vnd.apache.parquet', '.parquet'),
+}
+
+# Total size of cached exports (bytes)
+EXPORT_CACHE_BYTES = 64 * 1024**2
+
+# Rows written per to_csv() chunk
+CSV_CHUNK_ROWS = 50_000
+
+
+def serialise(df, fmt='csv'):
+    """
+    Table as export bytes
+
+    CSV is written in chunks; csv.gz streams those chunks through gzip, so
+    the uncompressed text is never held in memory at once.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    buffer = io.BytesIO()
+    if fmt == 'parquet':
+        df.to_parquet(buffer, index=False)
+        return buffer.getvalue()
+
+    target = gzip.GzipFile(fileobj=buffer, mode='wb', mtime=0) if fmt == 'csv.gz' else buffer
+    text = io.TextIOWrapper(target, encoding='utf-8', newline='')
+    df.to_csv(text, index=False, chunksize=CSV_CHUNK_ROWS)
+    text.detach()  # flushes, leaves target open
+    if target is not buffer:
+        target.close()  # gzip trailer; buffer stays open
+    return buffer.getvalue()
+
+
+class ExportCache:
+    """
+    Size-bounded LRU cache of export bytes
+
+    Parameters:
+    -----------
+    max_bytes : int
+        Total size kept; least recently used exports are evicted first
+        (an export larger than max_bytes is returned but not kept)
+    """
+
+    def __init__(self, max_bytes=EXPORT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Cached bytes, or None"""
+        with self._lock:
+            data = self._cache.get(key)
+            if data is not None:
+                self._cache.move_to_end(key)
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._cache:
+                self.size -= len(self._cache.pop(key))
+            self._cache[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self.size -= len(evicted)
+
+    def export(self, key, df, fmt='csv'):
+        """Bytes of df in fmt, serialised only on a cache miss"""
+        data = self.get(key)
+        if data is None:
+            data = serialise(df, fmt)
+            self.put(key, data)
+        return data
@@ -0,0 +1,97 @@
+"""
+LAST MILE CONNECT - Pincode Feature Building
+Pincode-level clustering inputs: enrolment joined with district gaps and
+coordinates, and the district unreached population allocated to pincodes
+(section 3-4 of 03_clustering.ipynb, vectorised).
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+EXTERNAL_PATH = Path("data/external")
+
+PINCODE_GEO_FILE = "india_pincodes.csv"
+
+# Focus on CRITICAL and HIGH priority areas
+PRIORITY_FOCUS = ['CRITICAL', 'HIGH']
+MIN_UNREACHED_THRESHOLD = 100  # At least 100 unreached citizens
+
+
+def load_pincode_geo(external_path=EXTERNAL_PATH):
+    """Pincode coordinates with lower-case column names, or None if unusable"""
+    try:
+        pincode_geo = pd.read_csv(Path(external_path) / PINCODE_GEO_FILE)
+    except FileNotFoundError:
+        return None
+
+    pincode_geo.columns = [col.lower().strip() for col in pincode_geo.columns]
+    if not all(col in pincode_geo.columns for col in ['pincode', 'latitude', 'longitude']):
+        return None
+    return pincode_geo
+
+
+def allocate_unreached(clustering_data):
+    """
+    Distribute each district's unreached population over its pincodes
+
+    A pincode's share is its enrolment over the district's total enrolment
+    (districts are matched by name, as in the notebook). Adds enrolment_share
+    and estimated_unreached in place.
+    """
+    district = clustering_data['district']
+    district_totals = clustering_data.groupby('district')['total_enrolment'].transform('sum')
+    # Rows without a district name keep their own enrolment (share / 1)
+    district_totals = district_totals.where(district.notna(), 1)
+
+    clustering_data['enrolment_share'] = clustering_data['total_enrolment'] / district_totals
+    clustering_data['estimated_unreached'] = (
+        clustering_data['unreached_population'] * clustering_data['enrolment_share']
+    ).round(0).astype(int)
+    return clustering_data
+
+
+def build_clustering_data(pincode_df, gap_df, pincode_geo):
+    """
+    Pincode rows with district gap metrics, coordinates and estimated unreached
+
+    Parameters:
+    -----------
+    pincode_df : DataFrame
+        pincode_enrolment.csv
+    gap_df : DataFrame
+        district_gap_analysis.csv
+    pincode_geo : DataFrame
+        Pincode coordinates (pincode, latitude, longitude)
+
+    Returns:
+    --------
+    clustering_data : DataFrame
+        One row per located pincode
+    """
+    clustering_data = pincode_df.merge(
+        gap_df[['state', 'district', 'unreached_population',
+                'coverage_rate', 'priority_level']],
+        on=['state', 'district'],
+        how='left'
+    )
+
+    clustering_data = clustering_data.merge(
+        pincode_geo[['pincode', 'latitude', 'longitude']],
+        on='pincode',
+        how='left'
+    )
+
+    clustering_data = clustering_data.dropna(subset=['latitude', 'longitude'])
+    return allocate_unreached(clustering_data)
+
+
+def filter_priority_locations(clustering_data, priorities=PRIORITY_FOCUS,
+                              min_unreached=MIN_UNREACHED_THRESHOLD):
+    """High-priority pincodes with a significant unreached population"""
+    mask = (
+        clustering_data['priority_level'].isin(priorities).to_numpy() &
+        (clustering_data['estimated_unreached'].to_numpy() >= min_unreached)
+    )
+    return clustering_data[mask].copy()
+
@@ -0,0 +1,237 @@
+"""
+LAST MILE CONNECT - Chart Builders
+Plotly figures of the web application pages.
+
+Each builder aggregates its input down to the rows and columns it plots
+before handing it to Plotly, so the figure spec sent to the browser stays
+small. FigureCache memoises built figures by (data version, chart, filter
+parameters): an unchanged chart is not rebuilt on a Streamlit rerun.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+from .tiling import cell_size
+
+PRIORITY_COLORS = {'CRITICAL': '#dc2626', 'HIGH': '#f97316',
+                   'MEDIUM': '#eab308', 'LOW': '#22c55e'}
+
+# Figures kept by FigureCache
+FIGURE_CACHE_SIZE = 128
+
+
+# ============================================================================
+# BUILDERS
+# ============================================================================
+
+def top_states_bar(top_states):
+    """Top states by unreached population, coloured by coverage rate"""
+    fig = px.bar(
+        top_states[['state', 'unreached', 'coverage_rate']],
+        x='unreached',
+        y='state',
+        orientation='h',
+        color='coverage_rate',
+        color_continuous_scale='RdYlGn',
+        labels={'unreached': 'Unreached Population', 'state': 'State'}
+    )
+    fig.update_layout(
+        height=400,
+        showlegend=False,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+def priority_pie(priority_counts):
+    """Share of districts per priority level"""
+    fig = px.pie(
+        values=priority_counts.values,
+        names=priority_counts.index,
+        color=priority_counts.index,
+        color_discrete_map=PRIORITY_COLORS
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(height=400)
+    return fig
+
+
+def state_stack_bar(state_df, top_n=15):
+    """Enrolled vs unreached population of the top_n states"""
+    fig = px.bar(
+        state_df.nlargest(top_n, 'unreached')[['state', 'enrolled', 'unreached']],
+        x='state',
+        y=['enrolled', 'unreached'],
+        barmode='stack',
+        labels={'value': 'Population', 'variable': 'Category'},
+        color_discrete_sequence=['#10b981', '#ef4444']
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+def camp_priority_bar(camps_df):
+    """Number of camps per camp priority"""
+    counts = (
+        camps_df.groupby('camp_priority', observed=True).size().reset_index(name='count')
+        .astype({'camp_priority': str})
+    )
+    return px.bar(
+        counts,
+        x='camp_priority',
+        y='count',
+        color='camp_priority',
+        color_discrete_map=PRIORITY_COLORS
+    )
+
+
+def scenario_bar(scenarios_df, column, label):
+    """One bar per optimisation scenario"""
+    fig = px.bar(
+        scenarios_df[['Scenario', column]],
+        x='Scenario',
+        y=column,
+        color='Scenario',
+        labels={column: label}
+    )
+    fig.update_layout(showlegend=False)
+    return fig
+
+
+def frontier_curve(frontier, point=None, point_label=None):
+    """Coverage-vs-budget frontier, with an optional highlighted point"""
+    fig = px.line(
+        frontier,
+        x='budget_crores',
+        y='coverage',
+        hover_data=['cost_crores', 'num_camps'],
+        labels={'budget_crores': 'Budget (Crores)', 'coverage': 'Best Coverage (Citizens)'}
+    )
+    if point is not None:
+        fig.add_trace(go.Scatter(
+            x=[point['budget_crores']],
+            y=[point['coverage']],
+            mode='markers',
+            marker=dict(size=12, color='#dc2626'),
+            name=point_label
+        ))
+    fig.update_layout(height=400, showlegend=False)
+    return fig
+
+
+def cumulative_coverage(phased_df):
+    """Cumulative coverage by deployment quarter"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=phased_df['Quarter'],
+        y=phased_df['Cumulative_Coverage'],
+        mode='lines+markers',
+        name='Cumulative Coverage',
+        line=dict(color='#2563eb', width=3),
+        fill='tozeroy'
+    ))
+
+    fig.update_layout(
+        title="Cumulative Coverage Growth",
+        xaxis_title="Quarter",
+        yaxis_title="Coverage (Citizens)",
+        height=400
+    )
+    return fig
+
+
+def coverage_map(pincode_cells, camp_cells, zoom, bounds):
+    """
+    Grid map of one viewport: pincode cells coloured by coverage rate (a
+    raster choropleth) and camp clusters sized by their number of camps
+
+    Drawn on plain lon/lat axes, so no base map or tile server is needed.
+    """
+    fig = go.Figure()
+    lat_min, lat_max, lon_min, lon_max = bounds
+    size = cell_size(zoom)
+
+    if len(pincode_cells):
+        x0, y0 = pincode_cells['cell_x'].min(), pincode_cells['cell_y'].min()
+        nx = pincode_cells['cell_x'].max() - x0 + 1
+        ny = pincode_cells['cell_y'].max() - y0 + 1
+        grid = np.full((ny, nx), np.nan)
+        unreached = np.zeros((ny, nx))
+        rows = pincode_cells['cell_y'].to_numpy() - y0
+        cols = pincode_cells['cell_x'].to_numpy() - x0
+        grid[rows, cols] = pincode_cells['coverage_rate'].to_numpy()
+        unreached[rows, cols] = pincode_cells['weight'].to_numpy()
+
+        fig.add_trace(go.Heatmap(
+            x=(x0 + np.arange(nx) + 0.5) * size - 180.0,
+            y=(y0 + np.arange(ny) + 0.5) * size - 90.0,
+            z=grid,
+            customdata=unreached,
+            colorscale='RdYlGn',
+            zmin=0,
+            zmax=100,
+            colorbar=dict(title='Coverage %'),
+            hovertemplate='Coverage: %{z:.1f}%<br>Unreached: %{customdata:,.0f}<extra></extra>',
+            name='Coverage'
+        ))
+
+    if camp_cells is not None and len(camp_cells):
+        counts = camp_cells['count'].to_numpy()
+        fig.add_trace(go.Scatter(
+            x=camp_cells['longitude'],
+            y=camp_cells['latitude'],
+            mode='markers+text',
+            marker=dict(size=10 + 4 * np.sqrt(counts), color='#2563eb', opacity=0.8,
+                        line=dict(color='white', width=1)),
+            text=np.where(counts > 1, counts.astype(str), ''),
+            textfont=dict(color='white', size=10),
+            customdata=np.column_stack([counts, camp_cells['weight']]),
+            hovertemplate='Camps: %{customdata[0]}<br>Coverage: %{customdata[1]:,.0f}<extra></extra>',
+            name='Mobile Camps'
+        ))
+
+    # Degrees of latitude drawn taller than longitude, as on a map
+    mid_lat = np.radians((lat_min + lat_max) / 2)
+    fig.update_xaxes(range=[lon_min, lon_max], title='Longitude', showgrid=False)
+    fig.update_yaxes(range=[lat_min, lat_max], title='Latitude', showgrid=False,
+                     scaleanchor='x', scaleratio=1 / np.cos(mid_lat))
+    fig.update_layout(height=650, showlegend=False, plot_bgcolor='#f1f5f9')
+    return fig
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class FigureCache:
+    """
+    LRU cache of built figures
+
+    Figures are shared between reruns and sessions: callers must not modify
+    a figure returned by get_or_build().
+    """
+
+    def __init__(self, max_size=FIGURE_CACHE_SIZE):
+        self.max_size = max_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, builder, *args, **kwargs):
+        """Cached figure for key, built with builder(*args, **kwargs) on a miss"""
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        fig = builder(*args, **kwargs)
+        with self._lock:
+            self._cache[key] = fig
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return fig
@@ -0,0 +1,346 @@
+"""
+LAST MILE CONNECT - Enrolment Forecasting
+Monthly enrolment trends, projected unreached population and months to
+saturation for every district at once.
+
+master_district_month.csv is pivoted into a districts x months matrix (months
+without enrolment count as zero) and every model is fitted for all districts
+in one pass:
+
+- 'linear': least-squares trend, plus an additive calendar-month seasonal
+  profile once SEASONAL_MIN_MONTHS months are observed
+- 'holt': Holt's linear exponential smoothing (level + trend), vectorised
+  over districts
+
+The fit is kept as sufficient statistics (sums of y, t*y and y per calendar
+month, Holt level and trend) in ForecastState, so a new month updates it
+without re-reading the history:
+
+    python -m src.forecasting                # full fit
+    python -m src.forecasting --update       # after src.incremental
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DATA_PATH = Path("data/processed")
+STATE_FILE = Path("data/cache/forecast_state.npz")
+FORECAST_FILE = "district_forecast.csv"
+
+DISTRICT_KEYS = ['state', 'district']
+
+# Holt smoothing of the level and the trend
+HOLT_ALPHA = 0.5
+HOLT_BETA = 0.3
+
+# Seasonal profile only with two full years of history
+SEASONAL_MIN_MONTHS = 24
+
+# Projection horizon (months) and the search range for saturation
+PROJECTION_MONTHS = 12
+MAX_HORIZON_MONTHS = 120
+
+METHODS = ['linear', 'holt']
+
+
+def month_ordinal(dates):
+    """Months since year 0 (January 2025 -> 24300)"""
+    dates = pd.to_datetime(dates)
+    return (dates.dt.year * 12 + dates.dt.month - 1).to_numpy()
+
+
+def district_month_matrix(master_df, keys=None, origin=None, n_months=None,
+                          column='total_enrolment'):
+    """
+    Districts x months matrix of one master_district_month column
+
+    Parameters:
+    -----------
+    keys : DataFrame, optional
+        Row order (state, district); defaults to the sorted districts of
+        master_df. Districts not in keys are added at the end.
+    origin, n_months : int, optional
+        First month ordinal and number of months; default to the span of
+        master_df
+
+    Returns:
+    --------
+    matrix : ndarray
+        (D, n_months) values, zero where a district has no row
+    keys : DataFrame
+        state and district of each row
+    origin : int
+    """
+    months = month_ordinal(master_df['date'])
+    origin = int(months.min()) if origin is None else origin
+    n_months = int(months.max()) - origin + 1 if n_months is None else n_months
+
+    found = master_df[DISTRICT_KEYS].drop_duplicates().sort_values(DISTRICT_KEYS)
+    if keys is None:
+        keys = found.reset_index(drop=True)
+    else:
+        known = pd.MultiIndex.from_frame(keys)
+        new = found[~pd.MultiIndex.from_frame(found).isin(known)]
+        keys = pd.concat([keys, new], ignore_index=True)
+
+    rows = pd.MultiIndex.from_frame(keys).get_indexer(pd.MultiIndex.from_frame(master_df[DISTRICT_KEYS]))
+    cols = months - origin
+    inside = (cols >= 0) & (cols < n_months)
+    flat = rows[inside] * n_months + cols[inside]
+    matrix = np.bincount(flat, weights=master_df[column].to_numpy(dtype=float)[inside],
+                         minlength=len(keys) * n_months).reshape(len(keys), n_months)
+    return matrix, keys, origin
+
+
+def holt_smooth(matrix, level=None, trend=None, alpha=HOLT_ALPHA, beta=HOLT_BETA):
+    """
+    Holt level and trend after the months of matrix (one vectorised step per
+    month); starts from the first month (level = y0, trend = 0) unless a
+    previous level / trend is given
+    """
+    start = 0
+    if level is None:
+        level, trend = matrix[:, 0].copy(), np.zeros(len(matrix))
+        start = 1
+    for t in range(start, matrix.shape[1]):
+        previous = level
+        level = alpha * matrix[:, t] + (1 - alpha) * (level + trend)
+        trend = beta * (level - previous) + (1 - beta) * trend
+    return level, trend
+
+
+# ============================================================================
+# FITTED STATE
+# ============================================================================
+
+class ForecastState:
+    """
+    Sufficient statistics of the district models
+
+    With months t = 0..n_months-1 shared by all districts, the least-squares
+    trend needs only sum(y) and sum(t*y) per district (the sums over t are
+    the same for every row), and the seasonal profile needs sum(y) per
+    calendar month. All are additive, so new or late months are folded in
+    exactly by update().
+    """
+
+    def __init__(self, keys, origin, n_months, sum_y, sum_ty, season_y, level, trend):
+        self.keys = keys.reset_index(drop=True)
+        self.origin = int(origin)
+        self.n_months = int(n_months)
+        self.sum_y = sum_y
+        self.sum_ty = sum_ty
+        self.season_y = season_y
+        self.level = level
+        self.trend = trend
+
+    @classmethod
+    def fit(cls, master_df):
+        """Fit from the full master_district_month table"""
+        matrix, keys, origin = district_month_matrix(master_df)
+        t = np.arange(matrix.shape[1])
+        calendar = (origin + t) % 12
+        level, trend = holt_smooth(matrix)
+        return cls(keys, origin, matrix.shape[1], matrix.sum(axis=1), matrix @ t,
+                   matrix @ np.eye(12)[calendar], level, trend)
+
+    def update(self, delta_master, master_df=None):
+        """
+        Fold new district-month rows (src.incremental delta) into the fit
+
+        Least-squares sums are updated in place. Holt continues over the new
+        months; if the delta also revises months already fitted, Holt is
+        re-run over the full master_df (required in that case).
+        """
+        months = month_ordinal(delta_master['date'])
+        last_month = max(self.origin + self.n_months - 1, int(months.max()))
+        n_months = last_month - self.origin + 1
+        delta, keys, _ = district_month_matrix(delta_master, self.keys, self.origin, n_months)
+
+        grow = len(keys) - len(self.keys)
+        pad = lambda values: np.concatenate([values, np.zeros((grow,) + values.shape[1:])])
+        t = np.arange(n_months)
+        self.sum_y = pad(self.sum_y) + delta.sum(axis=1)
+        self.sum_ty = pad(self.sum_ty) + delta @ t
+        self.season_y = pad(self.season_y) + delta @ np.eye(12)[(self.origin + t) % 12]
+
+        if months.min() >= self.origin + self.n_months:
+            # Only new months: continue the recursion (new districts start at 0)
+            self.level, self.trend = holt_smooth(delta[:, self.n_months:],
+                                                 pad(self.level), pad(self.trend))
+        elif master_df is not None:
+            matrix, _, _ = district_month_matrix(master_df, keys, self.origin, n_months)
+            self.level, self.trend = holt_smooth(matrix)
+        else:
+            raise ValueError("Delta revises fitted months: pass master_df to refit Holt")
+
+        self.keys = keys
+        self.n_months = n_months
+        return self
+
+    # ------------------------------------------------------------------
+    # Models
+    # ------------------------------------------------------------------
+
+    def linear_coefficients(self):
+        """Intercept and slope (per month) of every district's trend"""
+        t = np.arange(self.n_months)
+        n, sum_t, sum_tt = self.n_months, t.sum(), (t * t).sum()
+        denominator = n * sum_tt - sum_t ** 2
+        slope = (n * self.sum_ty - sum_t * self.sum_y) / denominator if denominator else np.zeros(len(self.sum_y))
+        intercept = (self.sum_y - slope * sum_t) / n
+        return intercept, slope
+
+    def seasonal_profile(self):
+        """(D, 12) additive calendar-month effects (zeros for short histories)"""
+        if self.n_months < SEASONAL_MIN_MONTHS:
+            return np.zeros((len(self.sum_y), 12))
+        t = np.arange(self.n_months)
+        calendar = np.eye(12)[(self.origin + t) % 12]
+        intercept, slope = self.linear_coefficients()
+        counts = calendar.sum(axis=0)
+        fitted = intercept[:, None] * counts + slope[:, None] * (t @ calendar)
+        profile = (self.season_y - fitted) / counts
+        return profile - profile.mean(axis=1, keepdims=True)
+
+    def forecast(self, horizon=PROJECTION_MONTHS, method='linear'):
+        """(D, horizon) monthly enrolment after the last fitted month (>= 0)"""
+        if method not in METHODS:
+            raise ValueError(f"Unknown method: {method}")
+        steps = np.arange(1, horizon + 1)
+        if method == 'holt':
+            values = self.level[:, None] + self.trend[:, None] * steps
+        else:
+            intercept, slope = self.linear_coefficients()
+            t = self.n_months - 1 + steps
+            values = intercept[:, None] + slope[:, None] * t
+            values += self.seasonal_profile()[:, (self.origin + t) % 12]
+        return np.maximum(values, 0.0)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path=STATE_FILE):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez(f, state=self.keys['state'].to_numpy(dtype=str),
+                     district=self.keys['district'].to_numpy(dtype=str),
+                     origin=self.origin, n_months=self.n_months, sum_y=self.sum_y,
+                     sum_ty=self.sum_ty, season_y=self.season_y, level=self.level,
+                     trend=self.trend)
+
+    @classmethod
+    def load(cls, path=STATE_FILE):
+        """Saved state, or None"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        with np.load(path) as saved:
+            keys = pd.DataFrame({'state': saved['state'], 'district': saved['district']})
+            return cls(keys, saved['origin'], saved['n_months'], saved['sum_y'], saved['sum_ty'],
+                       saved['season_y'], saved['level'], saved['trend'])
+
+
+# ============================================================================
+# PROJECTIONS
+# ============================================================================
+
+def months_to_saturation(monthly, unreached):
+    """
+    First month at which cumulative projected enrolment covers the unreached
+    population (NaN if not within the horizon of monthly)
+    """
+    cumulative = np.cumsum(monthly, axis=1)
+    reached = cumulative >= np.asarray(unreached, dtype=float)[:, None]
+    months = reached.argmax(axis=1) + 1.0
+    months[~reached.any(axis=1)] = np.nan
+    months[np.asarray(unreached) <= 0] = 0
+    return months
+
+
+def forecast_districts(state, gap_df, method='linear', horizon=PROJECTION_MONTHS):
+    """
+    Per-district projection table
+
+    Returns:
+    --------
+    forecast_df : DataFrame
+        state, district, trend, next-month and horizon enrolment, projected
+        unreached population after the horizon and months_to_saturation
+    """
+    monthly = state.forecast(MAX_HORIZON_MONTHS, method)
+    _, slope = state.linear_coefficients()
+    trend = slope if method == 'linear' else state.trend
+
+    forecast_df = state.keys.copy()
+    forecast_df = forecast_df.merge(gap_df[DISTRICT_KEYS + ['unreached_population']],
+                                    on=DISTRICT_KEYS, how='left')
+    unreached = forecast_df['unreached_population'].fillna(0).to_numpy(dtype=float)
+    projected = monthly[:, :horizon].sum(axis=1)
+
+    last = state.origin + state.n_months - 1
+    forecast_df['last_month'] = f"{last // 12}-{last % 12 + 1:02d}"
+    forecast_df['monthly_trend'] = trend.round(1)
+    forecast_df['next_month_enrolment'] = monthly[:, 0].round().astype(np.int64)
+    forecast_df[f'projected_enrolment_{horizon}m'] = projected.round().astype(np.int64)
+    forecast_df[f'projected_unreached_{horizon}m'] = np.maximum(unreached - projected, 0).round().astype(np.int64)
+    forecast_df['months_to_saturation'] = months_to_saturation(monthly, unreached)
+    return forecast_df.drop(columns='unreached_population')
+
+
+def update_forecast(delta_master, master_df, gap_df, data_path=DATA_PATH, state_file=STATE_FILE):
+    """
+    Fold a delta into the saved state (or fit it from master_df) and rewrite
+    district_forecast.csv
+    """
+    state = ForecastState.load(state_file)
+    if state is None:
+        state = ForecastState.fit(master_df)
+    else:
+        state.update(delta_master, master_df)
+    state.save(state_file)
+    forecast_df = forecast_districts(state, gap_df)
+    forecast_df.to_csv(Path(data_path) / FORECAST_FILE, index=False)
+    return forecast_df
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="District enrolment forecasts")
+    parser.add_argument("--data-path", type=Path, default=DATA_PATH)
+    parser.add_argument("--state-file", type=Path, default=STATE_FILE)
+    parser.add_argument("--method", choices=METHODS, default='linear')
+    parser.add_argument("--horizon", type=int, default=PROJECTION_MONTHS, help="Months projected")
+    parser.add_argument("--update", action="store_true",
+                        help="Fold months newer than the saved state into it instead of refitting")
+    args = parser.parse_args(argv)
+
+    master_df = pd.read_csv(args.data_path / "master_district_month.csv", parse_dates=['date'])
+    gap_df = pd.read_csv(args.data_path / "district_gap_analysis.csv")
+
+    state = ForecastState.load(args.state_file) if args.update else None
+    if state is None:
+        state = ForecastState.fit(master_df)
+    else:
+        newer = month_ordinal(master_df['date']) >= state.origin + state.n_months
+        if newer.any():
+            state.update(master_df[newer])
+    state.save(args.state_file)
+
+    forecast_df = forecast_districts(state, gap_df, args.method, args.horizon)
+    forecast_df.to_csv(args.data_path / FORECAST_FILE, index=False)
+    saturated = forecast_df['months_to_saturation'].notna().sum()
+    print(f"✅ Saved: {FORECAST_FILE} ({len(forecast_df):,} districts, "
+          f"{saturated:,} saturate within {MAX_HORIZON_MONTHS} months)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+LAST MILE CONNECT - Coverage Gap Analysis
+District and state coverage metrics, priority classification and scoring
+(the computations of 02_gap_analysis.ipynb as reusable functions).
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DATA_PATH = Path("data/processed")
+EXTERNAL_PATH = Path("data/external")
+
+CENSUS_FILE = "census_2011_district_population_clean.csv"
+
+ANNUAL_GROWTH_RATE = 0.012  # 1.2% per year (India's average)
+CENSUS_YEAR = 2011
+TARGET_YEAR = 2025
+
+# Fallback when Census data is missing
+INDIA_POPULATION_2025 = 1_450_000_000
+
+# Priority thresholds on coverage rate (%)
+PRIORITY_LEVELS = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']
+PRIORITY_THRESHOLDS = [70, 85, 95]
+
+# Priority score weights
+UNREACHED_WEIGHT = 60
+GAP_WEIGHT = 40
+
+STATE_COLUMNS = ['state', 'population', 'enrolled', 'unreached', 'num_districts',
+                 'coverage_rate', 'gap_pct']
+
+
+# ============================================================================
+# POPULATION
+# ============================================================================
+
+def load_census(external_path=EXTERNAL_PATH):
+    """Census 2011 district population with standardised names, or None if missing"""
+    try:
+        census_df = pd.read_csv(Path(external_path) / CENSUS_FILE)
+    except FileNotFoundError:
+        return None
+
+    census_df['state'] = census_df['state'].str.strip().str.title()
+    census_df['district'] = census_df['district'].str.strip().str.title()
+    return census_df
+
+
+def project_population(census_df, growth_rate=ANNUAL_GROWTH_RATE,
+                       base_year=CENSUS_YEAR, target_year=TARGET_YEAR):
+    """Project Census population to the target year with compound growth"""
+    census_df = census_df.copy()
+    census_df['population_2025'] = (
+        census_df['population_2011'] *
+        (1 + growth_rate) ** (target_year - base_year)
+    ).round(0).astype(int)
+    return census_df
+
+
+def estimate_population(district_summary):
+    """
+    FALLBACK: population proportional to enrolment share
+
+    Only used when Census data is missing; not suitable for final results.
+    """
+    total_enrolments = district_summary['total_enrolment'].sum()
+    census_df = district_summary[['state', 'district']].copy()
+    census_df['population_2025'] = (
+        (district_summary['total_enrolment'] / total_enrolments) *
+        INDIA_POPULATION_2025
+    ).round(0).astype(int)
+    return census_df
+
+
+def merge_population(district_summary, census_df):
+    """
+    Attach population_2025 to each district
+
+    Districts without a Census match get a population estimated from their
+    enrolment at the national average coverage rate.
+    """
+    gap_df = district_summary.merge(
+        census_df[['state', 'district', 'population_2025']],
+        on=['state', 'district'],
+        how='left'
+    )
+
+    missing = gap_df['population_2025'].isna()
+    if missing.any():
+        avg_coverage = gap_df['total_enrolment'].sum() / gap_df['population_2025'].sum()
+        gap_df.loc[missing, 'population_2025'] = (
+            gap_df.loc[missing, 'total_enrolment'] / avg_coverage
+        ).round(0).astype(int)
+
+    return gap_df
+
+
+# ============================================================================
+# COVERAGE METRICS
+# ============================================================================
+
+def compute_coverage(gap_df):
+    """coverage_rate, unreached_population and coverage_gap_pct (in place)"""
+    gap_df['coverage_rate'] = (
+        gap_df['total_enrolment'] / gap_df['population_2025'] * 100
+    ).clip(upper=100).round(2)  # Cap at 100% (migration effects)
+
+    gap_df['unreached_population'] = (
+        gap_df['population_2025'] - gap_df['total_enrolment']
+    ).clip(lower=0).astype(int)
+
+    gap_df['coverage_gap_pct'] = (100 - gap_df['coverage_rate']).round(2)
+    return gap_df
+
+
+def classify_priority(coverage_rate):
+    """Classify district priority based on coverage rate"""
+    if coverage_rate < 70:
+        return 'CRITICAL'
+    elif coverage_rate < 85:
+        return 'HIGH'
+    elif coverage_rate < 95:
+        return 'MEDIUM'
+    else:
+        return 'LOW'
+
+
+def classify_priorities(coverage_rates, thresholds=PRIORITY_THRESHOLDS):
+    """Vectorised classify_priority() for a whole column"""
+    levels = np.searchsorted(np.asarray(thresholds, dtype=float),
+                             np.asarray(coverage_rates, dtype=float), side='right')
+    return np.asarray(PRIORITY_LEVELS, dtype=object)[levels]
+
+
+def compute_priority_scores(gap_df, max_unreached=None):
+    """
+    Composite priority score (in place)
+
+    Higher score = higher priority for intervention:
+    60% normalised unreached population + 40% coverage gap.
+    """
+    if max_unreached is None:
+        max_unreached = gap_df['unreached_population'].max()
+
+    gap_df['priority_score'] = (
+        (gap_df['unreached_population'] / max_unreached) * UNREACHED_WEIGHT +
+        (gap_df['coverage_gap_pct'] / 100) * GAP_WEIGHT
+    ).round(2)
+    return gap_df
+
+
+def rank_districts(gap_df):
+    """Sort by priority score and assign priority_rank"""
+    gap_df = gap_df.sort_values('priority_score', ascending=False).reset_index(drop=True)
+    gap_df['priority_rank'] = range(1, len(gap_df) + 1)
+    return gap_df
+
+
+def state_rollup(gap_df):
+    """State-level totals and coverage from district rows"""
+    state_analysis = gap_df.groupby('state', observed=True).agg({
+        'population_2025': 'sum',
+        'total_enrolment': 'sum',
+        'unreached_population': 'sum',
+        'district': 'count'
+    }).reset_index()
+
+    state_analysis.columns = [
+        'state', 'population', 'enrolled', 'unreached', 'num_districts'
+    ]
+
+    state_analysis['coverage_rate'] = (
+        state_analysis['enrolled'] / state_analysis['population'] * 100
+    ).round(2)
+
+    state_analysis['gap_pct'] = (100 - state_analysis['coverage_rate']).round(2)
+
+    return state_analysis.sort_values('unreached', ascending=False)
+
+
+def build_gap_analysis(district_summary, census_df=None):
+    """
+    Full district gap analysis from the district summary
+
+    Parameters:
+    -----------
+    district_summary : DataFrame
+        Enrolment totals per district (district_summary.csv)
+    census_df : DataFrame, optional
+        Census 2011 population; falls back to the enrolment-share estimate
+
+    Returns:
+    --------
+    gap_df : DataFrame
+        District metrics, priority level, score and rank
+    state_analysis : DataFrame
+        State rollup sorted by unreached population
+    """
+    if census_df is None:
+        census_df = estimate_population(district_summary)
+    elif 'population_2025' not in census_df.columns:
+        census_df = project_population(census_df)
+
+    gap_df = merge_population(district_summary, census_df)
+    gap_df = compute_coverage(gap_df)
+    gap_df['priority_level'] = classify_priorities(gap_df['coverage_rate'])
+    gap_df = compute_priority_scores(gap_df)
+    gap_df = rank_districts(gap_df)
+
+    return gap_df, state_rollup(gap_df)
+
+
+def save_gap_outputs(gap_df, state_analysis, data_path=DATA_PATH):
+    """Write the notebook-02 output files"""
+    data_path = Path(data_path)
+    gap_df.to_csv(data_path / "district_gap_analysis.csv", index=False)
+    state_analysis.to_csv(data_path / "state_gap_analysis.csv", index=False)
+    gap_df[gap_df['priority_level'] == 'CRITICAL'].to_csv(
+        data_path / "critical_priority_districts.csv", index=False
+    )
+    gap_df.head(1000).to_csv(data_path / "top_1000_priority_districts.csv", index=False)
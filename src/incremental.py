@@ -0,0 +1,360 @@
+"""
+LAST MILE CONNECT - Incremental Gap Analysis
+Apply a new month of raw shards to the processed tables without a full rebuild.
+
+Per-district running totals live in district_summary.csv. A delta run ingests
+only the new shards, adds their district-month aggregates to the running
+totals and recomputes coverage, priority and the state rollup for the
+districts that changed; the district forecasts (src.forecasting) are updated
+from the same delta. Each run appends an entry to change_manifest.json
+that the web application applies on top of its cached tables:
+
+    python -m src.incremental --new-raw-path data/raw/2026-01
+"""
+
+import argparse
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+from .forecasting import update_forecast
+from .gap_analysis import (
+    EXTERNAL_PATH, STATE_COLUMNS, classify_priorities, compute_coverage, compute_priority_scores,
+    load_census, merge_population, project_population, rank_districts, save_gap_outputs,
+    state_rollup,
+)
+from .ingestion import (
+    CHUNK_SIZE, DATASETS, MONTH_KEYS, SUMMARY_COLUMNS, add_features,
+    build_master_district_month, dataset_files, ingest_dataset,
+)
+
+DATA_PATH = Path("data/processed")
+MANIFEST_FILE = "change_manifest.json"
+
+# Updates kept in the manifest for application instances to catch up on
+MANIFEST_HISTORY = 24
+
+DISTRICT_KEYS = ['state', 'district']
+
+# master_district_month columns that are summed; the rest are derived
+MASTER_BASE_COLUMNS = [
+    'age_0_5', 'age_5_17', 'age_18_greater', 'total_enrolment',
+    'total_biometric_updates', 'total_demographic_updates'
+]
+
+
+# ============================================================================
+# MANIFEST
+# ============================================================================
+
+def read_manifest(data_path=DATA_PATH):
+    """Current change manifest (an empty one if no update was ever applied)"""
+    path = Path(data_path) / MANIFEST_FILE
+    if not path.exists():
+        return {'version': 0, 'applied_shards': [], 'updates': []}
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_manifest(manifest, data_path=DATA_PATH):
+    """Write the manifest atomically (readers never see a partial file)"""
+    path = Path(data_path) / MANIFEST_FILE
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=1, default=str)
+    tmp_path.replace(path)
+
+
+def _records(df):
+    """JSON-safe row records"""
+    return json.loads(df.to_json(orient='records', date_format='iso'))
+
+
+# ============================================================================
+# DELTA COMPUTATION
+# ============================================================================
+
+def ingest_delta(new_files, chunksize=CHUNK_SIZE):
+    """
+    District-month rows of the new shards only
+
+    Parameters:
+    -----------
+    new_files : dict
+        Dataset name ('enrolment', 'biometric', 'demographic') -> list of shards
+
+    Returns:
+    --------
+    delta_master : DataFrame
+        master_district_month rows built from the new shards
+    """
+    monthly = {}
+    for dataset, value_cols in DATASETS.items():
+        monthly[dataset], _ = ingest_dataset(
+            new_files.get(dataset, []), value_cols, chunksize=chunksize
+        )
+    return build_master_district_month(
+        monthly['enrolment'], monthly['biometric'], monthly['demographic']
+    )
+
+
+def merge_master(master_df, delta_master):
+    """
+    Add delta months to master_district_month
+
+    Only the districts present in the delta are re-summed and have their
+    derived features (shares, rates, velocity) recomputed.
+    """
+    touched = delta_master[DISTRICT_KEYS].drop_duplicates()
+    in_delta = master_df.set_index(DISTRICT_KEYS).index.isin(
+        touched.set_index(DISTRICT_KEYS).index
+    )
+
+    combined = pd.concat([
+        master_df.loc[in_delta, MONTH_KEYS + MASTER_BASE_COLUMNS],
+        delta_master[MONTH_KEYS + MASTER_BASE_COLUMNS]
+    ])
+    combined = combined.groupby(MONTH_KEYS, as_index=False)[MASTER_BASE_COLUMNS].sum()
+    combined = add_features(combined)
+
+    master_df = pd.concat([master_df.loc[~in_delta], combined[master_df.columns]])
+    return master_df.sort_values(['state', 'district', 'date']).reset_index(drop=True)
+
+
+def apply_delta(district_summary, gap_df, delta_master, census_df=None):
+    """
+    Fold delta totals into the running district aggregates
+
+    With census_df, populations are set as build_gap_analysis() sets them
+    (Census where matched, the national-rate estimate otherwise), so
+    districts seen for the first time and estimated populations that moved
+    with the delta match a full rebuild. Without it, existing populations
+    are kept and new districts are estimated at the current national rate.
+
+    Returns:
+    --------
+    district_summary : DataFrame
+        Updated running totals
+    gap_df : DataFrame
+        Updated gap analysis (re-ranked)
+    changed : DataFrame
+        (state, district) keys whose metrics were recomputed
+    rescaled : bool
+        True when the largest unreached population moved, so every district's
+        priority score was rescaled
+    """
+    deltas = delta_master.groupby(DISTRICT_KEYS)[SUMMARY_COLUMNS].sum()
+
+    summary = district_summary.set_index(DISTRICT_KEYS)
+    summary = summary.add(deltas, fill_value=0)[summary.columns]
+    district_summary = summary.reset_index()
+
+    gap = gap_df.set_index(DISTRICT_KEYS)
+    changed_idx = deltas.index
+
+    population = None
+    if census_df is not None:
+        population = merge_population(district_summary, census_df).set_index(DISTRICT_KEYS)
+        population = population['population_2025'].astype(int)
+        moved = population.ne(gap['population_2025'].reindex(population.index))
+        changed_idx = changed_idx.union(population.index[moved])
+
+    # Districts seen for the first time: zero-filled rows with the table's dtypes
+    new_idx = changed_idx.difference(gap.index)
+    if len(new_idx):
+        new_rows = pd.DataFrame(0, index=new_idx, columns=gap.columns).astype(gap.dtypes)
+        if population is None:
+            # Population at the national coverage rate
+            avg_coverage = gap['total_enrolment'].sum() / gap['population_2025'].sum()
+            new_rows['population_2025'] = (
+                summary.loc[new_idx, 'total_enrolment'] / avg_coverage
+            ).round(0).astype(int)
+        gap = pd.concat([gap, new_rows]).astype(gap.dtypes)
+
+    if population is not None:
+        gap.loc[changed_idx, 'population_2025'] = population.loc[changed_idx].values
+    gap.loc[changed_idx, SUMMARY_COLUMNS] = summary.loc[changed_idx, SUMMARY_COLUMNS].values
+
+    rows = compute_coverage(gap.loc[changed_idx].copy())
+    rows['priority_level'] = classify_priorities(rows['coverage_rate'])
+    metric_cols = ['coverage_rate', 'unreached_population', 'coverage_gap_pct', 'priority_level']
+    gap.loc[changed_idx, metric_cols] = rows[metric_cols].values
+    gap['unreached_population'] = gap['unreached_population'].astype(int)
+
+    # Scores are normalised by the largest unreached population
+    old_max = gap_df['unreached_population'].max()
+    new_max = gap['unreached_population'].max()
+    rescaled = bool(new_max != old_max)
+
+    if rescaled:
+        gap = compute_priority_scores(gap, max_unreached=new_max)
+    else:
+        rows = compute_priority_scores(gap.loc[changed_idx].copy(), max_unreached=new_max)
+        gap.loc[changed_idx, 'priority_score'] = rows['priority_score'].values
+
+    # Rank from the full build's row order (district_summary), so tied scores rank alike
+    gap_df = rank_districts(gap.reset_index().sort_values(DISTRICT_KEYS, ignore_index=True))
+    changed = changed_idx.to_frame(index=False)
+    return district_summary, gap_df, changed, rescaled
+
+
+def update_states(state_df, gap_df, states):
+    """Recompute the state rollup for the given states only"""
+    subset = gap_df[gap_df['state'].isin(states)]
+    rows = state_rollup(subset)
+    state_df = pd.concat([state_df[~state_df['state'].isin(states)], rows])
+    return state_df.sort_values('unreached', ascending=False)[STATE_COLUMNS]
+
+
+# ============================================================================
+# UPDATE RUN
+# ============================================================================
+
+def find_new_shards(raw_path, applied):
+    """Shards under raw_path that are not recorded as applied"""
+    applied = set(applied)
+    return {
+        dataset: [f for f in dataset_files(raw_path, dataset) if str(f.resolve()) not in applied]
+        for dataset in DATASETS
+    }
+
+
+def run_update(new_raw_path, data_path=DATA_PATH, chunksize=CHUNK_SIZE, external_path=EXTERNAL_PATH):
+    """
+    Apply new raw shards to the processed tables
+
+    Parameters:
+    -----------
+    new_raw_path : Path
+        Folder with enrolment/, biometric/ and demographic/ sub-folders holding
+        the new shards (already-applied shards are skipped)
+    data_path : Path
+        Processed data folder
+    external_path : Path
+        Folder with the Census file (populations as in the full build)
+
+    Returns:
+    --------
+    update : dict or None
+        The manifest entry written, or None when there was nothing new
+    """
+    data_path = Path(data_path)
+    manifest = read_manifest(data_path)
+
+    new_files = find_new_shards(new_raw_path, manifest['applied_shards'])
+    if not any(new_files.values()):
+        return None
+
+    delta_master = ingest_delta(new_files, chunksize=chunksize)
+
+    district_summary = pd.read_csv(data_path / "district_summary.csv")
+    gap_df = pd.read_csv(data_path / "district_gap_analysis.csv")
+    state_df = pd.read_csv(data_path / "state_gap_analysis.csv")
+    master_df = pd.read_csv(data_path / "master_district_month.csv", parse_dates=['date'])
+
+    census_df = load_census(external_path)
+    if census_df is not None and 'population_2025' not in census_df.columns:
+        census_df = project_population(census_df)
+
+    district_summary, gap_df, changed, rescaled = apply_delta(district_summary, gap_df, delta_master,
+                                                              census_df)
+    changed_states = sorted(changed['state'].unique())
+    state_df = update_states(state_df, gap_df, changed_states)
+    master_df = merge_master(master_df, delta_master)
+
+    # Tables first, manifest last: readers of the manifest always find the data
+    master_df.to_csv(data_path / "master_district_month.csv", index=False)
+    district_summary.to_csv(data_path / "district_summary.csv", index=False)
+    save_gap_outputs(gap_df, state_df, data_path)
+    update_forecast(delta_master, master_df, gap_df, data_path)
+
+    if rescaled:
+        district_rows = gap_df
+    else:
+        district_rows = gap_df.merge(changed, on=DISTRICT_KEYS)
+
+    shards = [str(f.resolve()) for files in new_files.values() for f in files]
+    update = {
+        'version': manifest['version'] + 1,
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'months': sorted(delta_master['date'].dt.strftime('%Y-%m').unique().tolist()),
+        'shards': shards,
+        'rescaled': rescaled,
+        'districts': _records(district_rows),
+        'states': _records(state_df[state_df['state'].isin(changed_states)]),
+    }
+
+    manifest['version'] = update['version']
+    manifest['applied_shards'] = manifest['applied_shards'] + shards
+    manifest['updates'] = (manifest['updates'] + [update])[-MANIFEST_HISTORY:]
+    write_manifest(manifest, data_path)
+    return update
+
+
+# ============================================================================
+# APPLYING UPDATES (web application side)
+# ============================================================================
+
+def _upsert(df, rows, keys):
+    """Replace rows of df that match on keys, append the others"""
+    if rows.empty:
+        return df
+    categorical = [col for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)]
+    matched = df.set_index(keys).index.isin(rows.set_index(keys).index)
+    rows = rows[[col for col in df.columns if col in rows.columns]]
+    df = pd.concat([df.loc[~matched].astype({col: object for col in categorical}), rows],
+                   ignore_index=True)
+    return df.astype({col: 'category' for col in categorical})
+
+
+def pending_updates(manifest, since_version):
+    """Manifest entries newer than since_version, oldest first"""
+    return [u for u in manifest.get('updates', []) if u['version'] > since_version]
+
+
+def apply_updates(gap_df, state_df, updates):
+    """
+    Patch cached gap and state tables with manifest entries
+
+    Upserts are idempotent, so applying an entry that is already contained in
+    the tables is harmless. District ranks are re-derived from the scores.
+    """
+    for update in updates:
+        gap_df = _upsert(gap_df, pd.DataFrame(update['districts']), DISTRICT_KEYS)
+        state_df = _upsert(state_df, pd.DataFrame(update['states']), ['state'])
+
+    if updates:
+        gap_df = rank_districts(gap_df)
+        state_df = state_df.sort_values('unreached', ascending=False).reset_index(drop=True)
+    return gap_df, state_df
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply new monthly shards incrementally")
+    parser.add_argument("--new-raw-path", type=Path, required=True,
+                        help="Folder with enrolment/, biometric/ and demographic/ new shards")
+    parser.add_argument("--data-path", type=Path, default=DATA_PATH,
+                        help="Processed data folder")
+    parser.add_argument("--external-path", type=Path, default=EXTERNAL_PATH,
+                        help="Folder with the Census file")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE,
+                        help="Rows per chunk")
+    args = parser.parse_args(argv)
+
+    update = run_update(args.new_raw_path, args.data_path, chunksize=args.chunksize,
+                        external_path=args.external_path)
+    if update is None:
+        print("✅ No new shards to apply")
+    else:
+        print(f"✅ Update {update['version']}: {len(update['districts'])} districts, "
+              f"{len(update['states'])} states changed (months: {', '.join(update['months'])})")
+
+
+if __name__ == "__main__":
+    main()
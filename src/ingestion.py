@@ -0,0 +1,520 @@
+"""
+LAST MILE CONNECT - Raw Data Ingestion
+Streaming, chunked ingestion of the UIDAI enrolment, biometric and demographic CSVs.
+
+This is the loading / cleaning / aggregation part of 01_data_exploration.ipynb
+rewritten as a generator pipeline. Each chunk is cleaned and folded into running
+pincode and district-month aggregates, so raw rows are never held. Peak memory
+grows with the number of groups plus 8 bytes per unique (date, state, district,
+pincode) row key kept for de-duplication (KeyDeduplicator):
+
+    python -m src.ingestion --raw-path data/raw --output-path data/processed
+
+With --workers N the shards are parsed and pre-aggregated in N worker processes
+and the partial aggregates are merged exactly (same output as one worker).
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+RAW_DATA_PATH = Path("data/raw")
+PROCESSED_PATH = Path("data/processed")
+
+CHUNK_SIZE = 250_000
+
+# Value columns of each raw dataset (sub-folder of data/raw)
+DATASETS = {
+    'enrolment': ['age_0_5', 'age_5_17', 'age_18_greater'],
+    'biometric': ['bio_age_5_17', 'bio_age_17_'],
+    'demographic': ['demo_age_5_17', 'demo_age_17_'],
+}
+
+TOTAL_COLUMNS = {
+    'enrolment': 'total_enrolment',
+    'biometric': 'total_biometric_updates',
+    'demographic': 'total_demographic_updates',
+}
+
+# Duplicate rows are identified on these columns (as in notebook 01)
+KEY_COLUMNS = ['date', 'state', 'district', 'pincode']
+
+PINCODE_KEYS = ['state', 'district', 'pincode']
+MONTH_KEYS = ['state', 'district', 'date']
+
+SUMMARY_COLUMNS = [
+    'age_0_5', 'age_5_17', 'age_18_greater', 'total_enrolment',
+    'total_biometric_updates', 'total_demographic_updates'
+]
+
+
+# ============================================================================
+# READING & CLEANING
+# ============================================================================
+
+def dataset_files(raw_path, dataset):
+    """Raw CSV shards of one dataset, in a deterministic order"""
+    return sorted(Path(raw_path, dataset).glob("*.csv"))
+
+
+def read_chunks(files, value_cols, chunksize=CHUNK_SIZE):
+    """Yield raw chunks from a list of CSV files, one file after another"""
+    usecols = KEY_COLUMNS + list(value_cols)
+    for file in files:
+        reader = pd.read_csv(
+            file,
+            usecols=usecols,
+            dtype={'state': 'string', 'district': 'string'},
+            chunksize=chunksize
+        )
+        for chunk in reader:
+            yield chunk
+
+
+def normalise_names(series):
+    """Strip and title-case names, working on the distinct values only"""
+    codes, uniques = pd.factorize(series)
+    cleaned = pd.Index(uniques).astype('string').str.strip().str.title()
+    values = cleaned.take(codes)
+    values = values.where(codes >= 0, pd.NA)
+    return pd.Series(values, index=series.index, dtype='string')
+
+
+def parse_chunk(chunk):
+    """Parse dates and pincodes of a raw chunk (names are still raw)"""
+    chunk = chunk.copy()
+    chunk['date'] = pd.to_datetime(chunk['date'], dayfirst=True, errors='coerce')
+    chunk['pincode'] = pd.to_numeric(chunk['pincode'], errors='coerce').astype('Int64')
+    return chunk
+
+
+def clean_chunk(chunk):
+    """Standardise state and district names of a parsed chunk"""
+    chunk['state'] = normalise_names(chunk['state'])
+    chunk['district'] = normalise_names(chunk['district'])
+    return chunk
+
+
+# ============================================================================
+# DEDUPLICATION
+# ============================================================================
+
+def row_keys(chunk):
+    """64-bit hash of the duplicate-check columns of every row"""
+    return pd.util.hash_pandas_object(chunk[KEY_COLUMNS], index=False).to_numpy()
+
+
+class KeyDeduplicator:
+    """
+    Drop rows whose (date, state, district, pincode) was already seen
+
+    Keys are kept as sorted runs of 64-bit hashes (8 bytes per unique row)
+    that are merged like a binary counter, so lookups and inserts stay
+    O(log n) amortised without ever holding the raw rows. Memory therefore
+    grows with the number of unique daily keys, not with the number of
+    pincode / district-month groups.
+    """
+
+    def __init__(self):
+        self._runs = []
+
+    def __len__(self):
+        return sum(len(run) for run in self._runs)
+
+    def contains(self, keys):
+        """Boolean mask of keys already seen"""
+        seen = np.zeros(len(keys), dtype=bool)
+        for run in self._runs:
+            pos = np.searchsorted(run, keys)
+            pos[pos == len(run)] = 0
+            seen |= run[pos] == keys
+        return seen
+
+    def add(self, keys):
+        if len(keys) == 0:
+            return
+        run = np.unique(keys)
+        while self._runs and len(self._runs[-1]) <= len(run):
+            run = np.union1d(self._runs.pop(), run)
+        self._runs.append(run)
+
+    def keys(self):
+        """All seen keys as one sorted array"""
+        if not self._runs:
+            return np.empty(0, dtype=np.uint64)
+        return np.unique(np.concatenate(self._runs))
+
+    def filter(self, chunk):
+        """Return the rows of chunk that are neither repeated nor already seen"""
+        keys = row_keys(chunk)
+        keep = ~pd.Series(keys).duplicated().to_numpy() & ~self.contains(keys)
+        self.add(keys[keep])
+        return chunk[keep]
+
+
+# ============================================================================
+# RUNNING AGGREGATES
+# ============================================================================
+
+class RunningAggregate:
+    """
+    Group-by sum that is folded chunk by chunk
+
+    Partial sums are buffered and compacted once the buffer grows past the
+    size of the compacted result, so memory stays proportional to the number
+    of groups.
+    """
+
+    def __init__(self, keys, value_cols):
+        self.keys = list(keys)
+        self.value_cols = list(value_cols)
+        self._parts = []
+        self._buffered = 0
+        self._size = 0
+
+    def update(self, frame):
+        if frame.empty:
+            return
+        partial = frame.groupby(self.keys, sort=False)[self.value_cols].sum()
+        self.merge(partial)
+
+    def merge(self, partial):
+        """Fold an already aggregated frame (indexed by keys) into the total"""
+        if partial.empty:
+            return
+        self._parts.append(partial)
+        self._buffered += len(partial)
+        if self._buffered > max(self._size, 100_000):
+            self._compact()
+
+    def _compact(self):
+        combined = pd.concat(self._parts)
+        if len(self._parts) > 1:
+            combined = combined.groupby(level=self.keys, sort=False).sum()
+        self._parts = [combined]
+        self._buffered = 0
+        self._size = len(combined)
+
+    def result(self):
+        """Aggregated frame with key columns, sorted by the keys"""
+        if not self._parts:
+            empty = pd.DataFrame(columns=self.keys + self.value_cols)
+            if 'date' in self.keys:
+                empty['date'] = pd.to_datetime(empty['date'])
+            return empty
+        self._compact()
+        return self._parts[0].sort_index().reset_index()
+
+
+def month_end(dates):
+    """Month-end label of each date (same bins as pd.Grouper(freq='M'))"""
+    return dates.dt.normalize() + pd.offsets.MonthEnd(0)
+
+
+def fold_chunk(chunk, monthly, pincode=None):
+    """Fold one cleaned chunk into the district-month (and pincode) aggregates"""
+    if pincode is not None:
+        pincode.update(chunk)
+    monthly_frame = chunk.drop(columns='pincode').assign(date=month_end(chunk['date']))
+    monthly.update(monthly_frame)
+
+
+def ingest_dataset(files, value_cols, chunksize=CHUNK_SIZE, pincode_level=False,
+                   deduplicate=True, deduplicator=None):
+    """
+    Stream one raw dataset into running aggregates
+
+    Parameters:
+    -----------
+    files : list
+        Raw CSV shards, read in the given order
+    value_cols : list
+        Count columns to sum
+    chunksize : int
+        Rows per chunk
+    pincode_level : bool
+        Also build the (state, district, pincode) aggregate
+    deduplicate : bool
+        Drop repeated (date, state, district, pincode) rows, keeping the first
+    deduplicator : KeyDeduplicator, optional
+        Shared deduplicator (e.g. pre-seeded with keys from earlier shards)
+
+    Returns:
+    --------
+    monthly : DataFrame
+        Sums by state, district and month-end date
+    pincode : DataFrame or None
+        Sums by state, district and pincode
+    """
+    if deduplicate and deduplicator is None:
+        deduplicator = KeyDeduplicator()
+
+    monthly = RunningAggregate(MONTH_KEYS, value_cols)
+    pincode = RunningAggregate(PINCODE_KEYS, value_cols) if pincode_level else None
+
+    for chunk in read_chunks(files, value_cols, chunksize):
+        chunk = parse_chunk(chunk)
+        if deduplicate:
+            chunk = deduplicator.filter(chunk)
+        chunk = clean_chunk(chunk)
+        fold_chunk(chunk, monthly, pincode)
+
+    return monthly.result(), pincode.result() if pincode is not None else None
+
+
+# ============================================================================
+# OUTPUT TABLES
+# ============================================================================
+
+def add_total(df, dataset):
+    """Add the dataset's total column (sum of its value columns)"""
+    df[TOTAL_COLUMNS[dataset]] = df[DATASETS[dataset]].sum(axis=1)
+    return df
+
+
+def build_pincode_enrolment(pincode_agg):
+    """pincode_enrolment.csv from the pincode-level enrolment aggregate"""
+    return add_total(pincode_agg.copy(), 'enrolment')
+
+
+def add_features(master_df):
+    """Temporal, age-mix, update-rate and velocity features (notebook 01, section 7)"""
+    master_df['year'] = master_df['date'].dt.year
+    master_df['month'] = master_df['date'].dt.month
+    master_df['quarter'] = master_df['date'].dt.quarter
+
+    total = master_df['total_enrolment']
+    for col in ['age_0_5', 'age_5_17', 'age_18_greater']:
+        master_df[f'pct_{col}'] = (master_df[col] / total * 100).fillna(0).round(2)
+
+    master_df['biometric_update_rate'] = (
+        master_df['total_biometric_updates'] / total * 100
+    ).fillna(0).round(2)
+    master_df['demographic_update_rate'] = (
+        master_df['total_demographic_updates'] / total * 100
+    ).fillna(0).round(2)
+
+    master_df = master_df.sort_values(['state', 'district', 'date'])
+    master_df['enrolment_velocity'] = (
+        master_df.groupby(['state', 'district'])['total_enrolment'].diff()
+    )
+    return master_df
+
+
+def build_master_district_month(enrol_agg, bio_agg, demo_agg):
+    """master_district_month.csv from the three district-month aggregates"""
+    enrol_agg = add_total(enrol_agg.copy(), 'enrolment')
+    bio_agg = add_total(bio_agg.copy(), 'biometric')
+    demo_agg = add_total(demo_agg.copy(), 'demographic')
+
+    master_df = enrol_agg.merge(
+        bio_agg[MONTH_KEYS + ['total_biometric_updates']],
+        on=MONTH_KEYS,
+        how='left'
+    ).merge(
+        demo_agg[MONTH_KEYS + ['total_demographic_updates']],
+        on=MONTH_KEYS,
+        how='left'
+    )
+
+    update_cols = ['total_biometric_updates', 'total_demographic_updates']
+    master_df[update_cols] = master_df[update_cols].fillna(0)
+
+    return add_features(master_df)
+
+
+def build_summaries(master_df):
+    """District- and state-level totals across all months"""
+    district_summary = master_df.groupby(['state', 'district'])[SUMMARY_COLUMNS].sum().reset_index()
+    state_summary = master_df.groupby('state')[SUMMARY_COLUMNS].sum().reset_index()
+    return district_summary, state_summary
+
+
+def build_outputs(enrol_results, bio_results, demo_results):
+    """Assemble the processed tables from per-dataset (monthly, pincode) results"""
+    master_df = build_master_district_month(enrol_results[0], bio_results[0], demo_results[0])
+    district_summary, state_summary = build_summaries(master_df)
+
+    return {
+        'pincode_enrolment': build_pincode_enrolment(enrol_results[1]),
+        'master_district_month': master_df,
+        'district_summary': district_summary,
+        'state_summary': state_summary,
+    }
+
+
+# ============================================================================
+# PARALLEL INGESTION
+# ============================================================================
+
+def ingest_shard(path, value_cols, chunksize=CHUNK_SIZE, pincode_level=False, exclude_keys=None):
+    """
+    Worker task: parse, deduplicate and pre-aggregate one shard
+
+    Parameters:
+    -----------
+    path : Path
+        Raw CSV shard
+    exclude_keys : ndarray, optional
+        Row keys already taken by earlier shards; matching rows are dropped
+
+    Returns:
+    --------
+    monthly, pincode : DataFrame
+        Partial aggregates of the shard (pincode is None unless pincode_level)
+    keys : ndarray
+        Sorted row keys of the shard (None when exclude_keys was given)
+    """
+    deduplicator = KeyDeduplicator()
+    if exclude_keys is not None:
+        deduplicator.add(exclude_keys)
+
+    monthly, pincode = ingest_dataset(
+        [path], value_cols, chunksize=chunksize,
+        pincode_level=pincode_level, deduplicator=deduplicator
+    )
+    keys = deduplicator.keys() if exclude_keys is None else None
+    return monthly, pincode, keys
+
+
+def merge_shards(files, partials, value_cols, chunksize=CHUNK_SIZE, pincode_level=False,
+                 executor=None):
+    """
+    Merge per-shard partial aggregates exactly
+
+    Duplicates are resolved in file order, as if the shards had been
+    concatenated: a shard that repeats keys of an earlier shard is re-aggregated
+    with those keys excluded. Shards rarely overlap, so this second pass is
+    usually empty.
+    """
+    partials = list(partials)
+    seen = KeyDeduplicator()
+    reruns = {}
+
+    for i, (_, _, keys) in enumerate(partials):
+        overlap = keys[seen.contains(keys)]
+        if len(overlap):
+            reruns[i] = overlap
+        seen.add(keys)
+
+    if executor is not None:
+        futures = {
+            i: executor.submit(ingest_shard, files[i], value_cols, chunksize, pincode_level, overlap)
+            for i, overlap in reruns.items()
+        }
+        for i, future in futures.items():
+            partials[i] = future.result()
+    else:
+        for i, overlap in reruns.items():
+            partials[i] = ingest_shard(files[i], value_cols, chunksize, pincode_level, overlap)
+
+    monthly = RunningAggregate(MONTH_KEYS, value_cols)
+    pincode = RunningAggregate(PINCODE_KEYS, value_cols) if pincode_level else None
+    for shard_monthly, shard_pincode, _ in partials:
+        monthly.merge(shard_monthly.set_index(MONTH_KEYS))
+        if pincode is not None:
+            pincode.merge(shard_pincode.set_index(PINCODE_KEYS))
+
+    return monthly.result(), pincode.result() if pincode is not None else None
+
+
+def ingest_raw_parallel(raw_path=RAW_DATA_PATH, chunksize=CHUNK_SIZE, workers=2):
+    """
+    Parallel ingest_raw(): one worker task per shard, then an exact merge
+
+    Shards of all three datasets share one process pool, so small datasets do
+    not leave workers idle.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        submitted = {}
+        for dataset, value_cols in DATASETS.items():
+            files = dataset_files(raw_path, dataset)
+            pincode_level = dataset == 'enrolment'
+            futures = [
+                executor.submit(ingest_shard, file, value_cols, chunksize, pincode_level)
+                for file in files
+            ]
+            submitted[dataset] = (files, futures, pincode_level)
+
+        results = {}
+        for dataset, (files, futures, pincode_level) in submitted.items():
+            results[dataset] = merge_shards(
+                files,
+                [future.result() for future in futures],
+                DATASETS[dataset],
+                chunksize=chunksize,
+                pincode_level=pincode_level,
+                executor=executor
+            )
+
+    return build_outputs(results['enrolment'], results['biometric'], results['demographic'])
+
+
+def ingest_raw(raw_path=RAW_DATA_PATH, chunksize=CHUNK_SIZE, workers=1):
+    """
+    Stream all three raw datasets and build the notebook-01 outputs
+
+    Parameters:
+    -----------
+    raw_path : Path
+        Folder with enrolment/, biometric/ and demographic/ shards
+    chunksize : int
+        Rows per chunk
+    workers : int
+        Worker processes; 1 streams everything in this process
+
+    Returns:
+    --------
+    outputs : dict
+        'pincode_enrolment', 'master_district_month', 'district_summary'
+        and 'state_summary' DataFrames
+    """
+    if workers > 1:
+        return ingest_raw_parallel(raw_path, chunksize=chunksize, workers=workers)
+
+    results = {}
+    for dataset, value_cols in DATASETS.items():
+        results[dataset] = ingest_dataset(
+            dataset_files(raw_path, dataset),
+            value_cols,
+            chunksize=chunksize,
+            pincode_level=(dataset == 'enrolment')
+        )
+
+    return build_outputs(results['enrolment'], results['biometric'], results['demographic'])
+
+
+def save_outputs(outputs, processed_path=PROCESSED_PATH):
+    """Write the processed tables as CSV"""
+    processed_path = Path(processed_path)
+    processed_path.mkdir(parents=True, exist_ok=True)
+    for name, df in outputs.items():
+        df.to_csv(processed_path / f"{name}.csv", index=False)
+        print(f"✅ Saved: {name}.csv")
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream raw UIDAI CSVs into processed aggregates")
+    parser.add_argument("--raw-path", type=Path, default=RAW_DATA_PATH,
+                        help="Folder with enrolment/, biometric/ and demographic/ shards")
+    parser.add_argument("--output-path", type=Path, default=PROCESSED_PATH,
+                        help="Folder for the processed CSV files")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE,
+                        help="Rows per chunk")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for parallel shard ingestion")
+    args = parser.parse_args(argv)
+
+    outputs = ingest_raw(args.raw_path, chunksize=args.chunksize, workers=args.workers)
+    save_outputs(outputs, args.output_path)
+
+
+if __name__ == "__main__":
+    main()
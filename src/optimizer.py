@@ -0,0 +1,828 @@
+"""
+LAST MILE CONNECT - Resource Allocation Optimizer
+Camp selection under budget and timeline constraints (05_validation.ipynb).
+
+- optimize_camp_deployment(): the notebook's greedy ROI heuristic
+- optimize_camp_deployment_exact(): 0/1 knapsack on exact costs, solved by
+  dynamic programming over non-dominated selections or by a MILP (scipy /
+  HiGHS), with the optimality gap of the greedy answer reported (against the
+  LP bound when optimality is not proven)
+- pareto_frontier(): best coverage for every budget from one DP pass,
+  stored as a lookup table (pareto_frontier.csv)
+- OptimizerService: memoised solver for interactive use (web application)
+- save_scenario_outputs(): the notebook's scenario comparison, phased plan,
+  state allocation and budget sensitivity tables
+
+    python -m src.optimizer --scenarios --frontier
+"""
+
+import argparse
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+DATA_PATH = Path("data/processed")
+FRONTIER_FILE = "pareto_frontier.csv"
+
+CRORE = 10**7
+DAYS_PER_MONTH = 30
+
+# Relative MIP gap at which HiGHS stops (0: only a proven optimum counts)
+MILP_REL_GAP = 0
+
+# MILP time limit (seconds); the best selection found so far is kept, unproven
+MILP_TIME_LIMIT = 10
+
+# scipy.optimize.milp status codes
+MILP_STATUS = {0: 'optimal', 1: 'limit reached', 2: 'infeasible', 3: 'unbounded', 4: 'failed'}
+
+# Non-dominated partial selections the exact DP may hold before giving up
+MAX_DP_STATES = 2_000_000
+
+# Solutions kept by OptimizerService
+SERVICE_CACHE_SIZE = 256
+
+# Budget slider of the Resource Optimizer page (Crores)
+SLIDER_BUDGETS = range(100, 1501, 50)
+
+# Budget range of the Pareto frontier (Crores)
+FRONTIER_MIN_BUDGET = 100
+FRONTIER_MAX_BUDGET = 1500
+
+# Frontier DP resolution (columns) and the budget grid of the stored table (Crores)
+FRONTIER_UNITS = 500_000
+FRONTIER_STEP = 0.1
+
+FRONTIER_COLUMNS = ['budget_crores', 'cost_crores', 'coverage', 'num_camps']
+
+# Quarters of the phased plan, and the budgets of the sensitivity table (Crores)
+NUM_PHASES = 4
+SENSITIVITY_BUDGETS = [100, 200, 300, 400, 500, 750, 1000, 1500]
+
+SCENARIOS = {
+    'AGGRESSIVE': {
+        'budget_crores': 1000,
+        'timeline_months': 6,
+        'priority_filter': None,
+        'description': 'Maximum coverage with high budget and fast timeline'
+    },
+    'BALANCED': {
+        'budget_crores': 500,
+        'timeline_months': 12,
+        'priority_filter': None,
+        'description': 'Balanced approach with moderate budget and timeline'
+    },
+    'CONSERVATIVE': {
+        'budget_crores': 250,
+        'timeline_months': 18,
+        'priority_filter': None,
+        'description': 'Phased rollout with controlled budget'
+    },
+    'CRITICAL_ONLY': {
+        'budget_crores': 150,
+        'timeline_months': 12,
+        'priority_filter': ['CRITICAL'],
+        'description': 'Focus only on critical priority areas'
+    },
+    'QUICK_WIN': {
+        'budget_crores': 100,
+        'timeline_months': 6,
+        'priority_filter': ['CRITICAL', 'HIGH'],
+        'description': 'Fast deployment to highest priority areas'
+    }
+}
+
+
+# ============================================================================
+# SHARED HELPERS
+# ============================================================================
+
+def empty_result():
+    return {
+        'num_camps': 0,
+        'selected_camp_ids': [],
+        'total_cost_inr': 0,
+        'total_cost_crores': 0,
+        'total_coverage': 0,
+        'budget_utilization_pct': 0,
+        'cost_per_enrollment': 0,
+        'estimated_timeline_days': 0,
+        'estimated_timeline_months': 0
+    }
+
+
+def filter_camps(camps_data, priority_filter=None):
+    """Camps whose camp_priority is in priority_filter (all camps if None)"""
+    if not priority_filter:
+        return camps_data
+    priority_filter_upper = [p.upper() for p in priority_filter]
+    return camps_data[camps_data['camp_priority'].astype(str).str.upper().isin(priority_filter_upper)]
+
+
+def summarise_selection(selected_camps, budget_inr):
+    """Result metrics of a camp selection"""
+    total_cost = selected_camps['total_cost'].sum()
+    total_coverage = selected_camps['coverage_population'].sum()
+    total_days = selected_camps['estimated_days'].max() if len(selected_camps) else 0
+
+    return {
+        'num_camps': len(selected_camps),
+        'selected_camp_ids': selected_camps.index.tolist(),
+        'total_cost_inr': total_cost,
+        'total_cost_crores': total_cost / CRORE,
+        'total_coverage': int(total_coverage),
+        'budget_utilization_pct': (total_cost / budget_inr) * 100 if budget_inr > 0 else 0,
+        'cost_per_enrollment': total_cost / total_coverage if total_coverage > 0 else 0,
+        'estimated_timeline_days': total_days,
+        'estimated_timeline_months': int(np.ceil(total_days / DAYS_PER_MONTH))
+    }
+
+
+def print_result(result):
+    print(f"\n📊 Optimization Results:")
+    print(f"   Camps selected: {result['num_camps']}")
+    print(f"   Total coverage: {result['total_coverage']:,} citizens")
+    print(f"   Total cost: ₹{result['total_cost_crores']:.2f} Crores")
+    print(f"   Budget utilization: {result['budget_utilization_pct']:.1f}%")
+    print(f"   Cost per enrollment: ₹{result['cost_per_enrollment']:.2f}")
+    print(f"   Estimated timeline: {result['estimated_timeline_months']} months")
+
+
+# ============================================================================
+# GREEDY
+# ============================================================================
+
+def greedy_selection(costs, values, budget):
+    """
+    Positions chosen by the ROI greedy: best coverage per rupee first,
+    skipping camps that no longer fit the remaining budget
+    """
+    costs = np.asarray(costs, dtype=float)
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(-(values / costs), kind='stable')
+
+    selected = []
+    total_cost = 0
+    for i in order:
+        if total_cost + costs[i] > budget:
+            continue
+        selected.append(i)
+        total_cost += costs[i]
+    return np.asarray(selected, dtype=int)
+
+
+def optimize_camp_deployment(camps_data, budget_crores, timeline_months,
+                             priority_filter=None, verbose=True):
+    """
+    Greedy algorithm to maximize coverage under budget/timeline constraints
+
+    Parameters:
+    -----------
+    camps_data : DataFrame
+        Camp locations with costs and coverage
+    budget_crores : float
+        Budget limit in crores
+    timeline_months : int
+        Timeline constraint in months (parallel deployment assumed)
+    priority_filter : list, optional
+        Priority levels to filter (e.g., ['CRITICAL', 'HIGH'])
+    verbose : bool
+        Print progress information
+
+    Returns:
+    --------
+    result : dict
+        Optimization results
+    selected_camps : DataFrame
+        Selected camp details
+    """
+    budget_inr = budget_crores * CRORE
+
+    camps_filtered = filter_camps(camps_data, priority_filter).copy()
+    if priority_filter and verbose:
+        print(f"   Filtered to {len(camps_filtered)} camps with priority {priority_filter}")
+
+    if len(camps_filtered) == 0:
+        if verbose:
+            print(f"   ⚠️  WARNING: No camps match the priority filter!")
+        return empty_result(), pd.DataFrame()
+
+    # Calculate ROI (coverage per rupee), best first
+    camps_filtered['roi'] = camps_filtered['coverage_population'] / camps_filtered['total_cost']
+    camps_sorted = camps_filtered.sort_values('roi', ascending=False)
+
+    positions = greedy_selection(
+        camps_sorted['total_cost'].to_numpy(), camps_sorted['coverage_population'].to_numpy(),
+        budget_inr
+    )
+    selected_camps = camps_sorted.iloc[np.sort(positions)].copy()
+
+    result = summarise_selection(selected_camps, budget_inr)
+    if verbose:
+        print_result(result)
+    return result, selected_camps
+
+
+# ============================================================================
+# EXACT SOLVERS
+# ============================================================================
+
+def knapsack_milp(costs, values, budget, time_limit=None):
+    """
+    0/1 knapsack as a MILP (scipy.optimize.milp / HiGHS) on exact costs
+
+    Returns:
+    --------
+    selected : ndarray
+        Positions of the chosen items (best found if the solve was cut short)
+    status : str
+        MILP_STATUS entry; only 'optimal' is a proven optimum
+    """
+    costs = np.asarray(costs, dtype=float)
+    values = np.asarray(values, dtype=float)
+    options = {'mip_rel_gap': MILP_REL_GAP}
+    if time_limit is not None:
+        options['time_limit'] = time_limit
+
+    res = milp(
+        c=-values,
+        constraints=LinearConstraint(costs[np.newaxis, :], -np.inf, budget),
+        integrality=np.ones(len(costs)),
+        bounds=Bounds(0, 1),
+        options=options
+    )
+    status = MILP_STATUS.get(res.status, 'failed')
+    if res.x is None:
+        return np.empty(0, dtype=int), status
+    return np.flatnonzero(res.x > 0.5), status
+
+
+def fractional_bound(costs, values, budget):
+    """LP-relaxation upper bound on the knapsack optimum (Dantzig bound)"""
+    costs = np.asarray(costs, dtype=float)
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(-(values / costs), kind='stable')
+    cum_cost = np.cumsum(costs[order])
+    full = np.searchsorted(cum_cost, budget, side='right')
+    bound = values[order[:full]].sum()
+    if full < len(order):
+        spent = cum_cost[full - 1] if full else 0.0
+        bound += values[order[full]] * (budget - spent) / costs[order[full]]
+    return bound
+
+
+def budget_units(costs, budget, max_units=FRONTIER_UNITS):
+    """
+    Discretise costs and budget for the frontier DP
+
+    Costs are rounded up and the budget down, so every DP selection is
+    feasible for the exact costs.
+    """
+    resolution = max(np.ceil(budget / max_units), 1.0)
+    weights = np.ceil(np.asarray(costs, dtype=float) / resolution).astype(np.int64)
+    capacity = int(np.floor(budget / resolution))
+    return weights, capacity, resolution
+
+
+def knapsack_exact_dp(costs, values, budget, lower_bound=0.0, max_states=MAX_DP_STATES):
+    """
+    0/1 knapsack on exact costs by dynamic programming over states
+
+    Camps are added in ROI order. A state is the (cost, coverage) of one
+    selection among the camps seen so far; after each camp only the states
+    that no cheaper state matches on coverage are kept, and states whose LP
+    bound over the remaining camps falls below the best selection known are
+    dropped. Costs are never rounded, so the result is a proven optimum.
+
+    Parameters:
+    -----------
+    lower_bound : float
+        Coverage of a known feasible selection (e.g. greedy), for pruning
+    max_states : int
+        Give up when more states than this would be needed
+
+    Returns:
+    --------
+    selected : ndarray
+        Positions of the chosen items (empty if the limit was reached)
+    status : str
+        'optimal' or 'limit reached'
+    """
+    costs = np.asarray(costs, dtype=float)
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(-(values / costs), kind='stable')
+    item_costs, item_values = costs[order], values[order]
+    n = len(order)
+    cum_cost = np.concatenate([[0.0], np.cumsum(item_costs)])
+    cum_value = np.concatenate([[0.0], np.cumsum(item_values)])
+
+    def remaining_bounds(start, remaining):
+        # LP bound and ROI-prefix (feasible) coverage of items start.. per state
+        target = cum_cost[start] + remaining
+        full = np.searchsorted(cum_cost, target, side='right') - 1
+        nxt = np.minimum(full, n - 1)
+        prefix = cum_value[full] - cum_value[start]
+        fraction = np.where(full < n, item_values[nxt] * (target - cum_cost[full]) / item_costs[nxt], 0.0)
+        return prefix + fraction, prefix
+
+    cost = np.zeros(1)
+    value = np.zeros(1)
+    lower = lower_bound
+    parents, taken = [], []
+    for i in range(n):
+        fit = np.flatnonzero(cost + item_costs[i] <= budget)
+        count = len(cost)
+        new_cost = np.concatenate([cost, cost[fit] + item_costs[i]])
+        new_value = np.concatenate([value, value[fit] + item_values[i]])
+        parent = np.concatenate([np.arange(count), fit])
+        took = np.concatenate([np.zeros(count, dtype=bool), np.ones(len(fit), dtype=bool)])
+
+        # Dominance: by cost, keep states covering more than every cheaper one
+        by_cost = np.lexsort((-new_value, new_cost))
+        best_cheaper = np.maximum.accumulate(new_value[by_cost])
+        keep = by_cost[new_value[by_cost] > np.concatenate([[-np.inf], best_cheaper[:-1]])]
+
+        # Bounding (tolerance for rounding in the bound arithmetic)
+        bound, prefix = remaining_bounds(i + 1, budget - new_cost[keep])
+        lower = max(lower, (new_value[keep] + prefix).max())
+        keep = keep[new_value[keep] + bound >= lower * (1 - 1e-9)]
+
+        if len(keep) > max_states:
+            return np.empty(0, dtype=int), 'limit reached'
+        cost, value = new_cost[keep], new_value[keep]
+        parents.append(parent[keep])
+        taken.append(took[keep])
+
+    selected = []
+    state = int(np.argmax(value))
+    for i in range(n - 1, -1, -1):
+        if taken[i][state]:
+            selected.append(order[i])
+        state = parents[i][state]
+    return np.asarray(selected[::-1], dtype=int), 'optimal'
+
+
+def _gap_pct(best, other):
+    return (best - other) / best * 100 if best > 0 else 0.0
+
+
+def optimize_camp_deployment_exact(camps_data, budget_crores, timeline_months,
+                                   priority_filter=None, method='dp', enforce_timeline=True,
+                                   max_states=MAX_DP_STATES, time_limit=MILP_TIME_LIMIT, verbose=True):
+    """
+    Coverage-maximising camp selection (0/1 knapsack)
+
+    Parameters:
+    -----------
+    camps_data : DataFrame
+        Camp locations with costs and coverage
+    budget_crores : float
+        Budget limit in crores
+    timeline_months : int
+        Camps whose estimated_days exceed the timeline are not eligible
+        (camps run in parallel) when enforce_timeline is True
+    priority_filter : list, optional
+        Priority levels to filter (e.g., ['CRITICAL', 'HIGH'])
+    method : str
+        'dp' (knapsack_exact_dp) or 'milp'; both return a proven optimum
+        unless max_states / time_limit is hit
+    max_states : int
+        DP state limit
+    time_limit : float, optional
+        MILP time limit in seconds
+
+    Returns:
+    --------
+    result : dict
+        Same keys as optimize_camp_deployment() plus 'method', 'status'
+        (solver status, 'optimal' only for a proven optimum), 'optimal',
+        'greedy_coverage', 'optimality_gap_pct' (greedy vs the optimum, or
+        vs the LP bound when not optimal; see 'gap_reference') and
+        'bound_gap_pct' (returned solution vs LP upper bound)
+    selected_camps : DataFrame
+        Selected camp details
+    """
+    budget_inr = budget_crores * CRORE
+    timeline_days = timeline_months * DAYS_PER_MONTH
+
+    camps_filtered = filter_camps(camps_data, priority_filter)
+    if enforce_timeline:
+        camps_filtered = camps_filtered[camps_filtered['estimated_days'] <= timeline_days]
+
+    if len(camps_filtered) == 0:
+        if verbose:
+            print(f"   ⚠️  WARNING: No eligible camps for this scenario!")
+        return empty_result(), pd.DataFrame()
+
+    costs = camps_filtered['total_cost'].to_numpy(dtype=float)
+    values = camps_filtered['coverage_population'].to_numpy(dtype=float)
+
+    greedy = greedy_selection(costs, values, budget_inr)
+    greedy_coverage = values[greedy].sum()
+
+    bound = fractional_bound(costs, values, budget_inr)
+
+    if method == 'milp':
+        selected, status = knapsack_milp(costs, values, budget_inr, time_limit=time_limit)
+    elif method == 'dp':
+        selected, status = knapsack_exact_dp(costs, values, budget_inr, greedy_coverage, max_states)
+    else:
+        raise ValueError(f"Unknown method: {method}")
+    optimal = status == 'optimal'
+
+    # Ties keep the greedy selection; an unproven solution can also trail it
+    if values[selected].sum() <= greedy_coverage:
+        selected = greedy
+
+    selected_camps = camps_filtered.iloc[np.sort(selected)].copy()
+    result = summarise_selection(selected_camps, budget_inr)
+
+    coverage = values[selected].sum()
+    result['method'] = method
+    result['status'] = status
+    result['optimal'] = optimal
+    result['greedy_coverage'] = int(greedy_coverage)
+    result['gap_reference'] = 'optimum' if optimal else 'LP bound'
+    result['optimality_gap_pct'] = _gap_pct(coverage if optimal else bound, greedy_coverage)
+    result['bound_gap_pct'] = _gap_pct(bound, coverage)
+
+    if verbose:
+        print_result(result)
+        print(f"   Solver status: {status}")
+        print(f"   Greedy gap vs {result['gap_reference']}: {result['optimality_gap_pct']:.3f}%")
+        print(f"   Gap to LP bound: {result['bound_gap_pct']:.3f}%")
+    return result, selected_camps
+
+
+# ============================================================================
+# PARETO FRONTIER
+# ============================================================================
+
+def pareto_frontier(camps_data, max_budget_crores=FRONTIER_MAX_BUDGET,
+                    min_budget_crores=FRONTIER_MIN_BUDGET, timeline_months=None,
+                    priority_filter=None, step_crores=FRONTIER_STEP, max_units=FRONTIER_UNITS):
+    """
+    Coverage-vs-budget Pareto frontier from a single knapsack DP pass
+
+    The DP row after the last camp holds the best coverage for every
+    discretised budget up to max_budget_crores; the cost and camp count of
+    each of those solutions are carried along (no choice table is needed).
+    The stored table keeps the Pareto points in force at every step_crores
+    of budget, so it stays small.
+
+    Parameters:
+    -----------
+    camps_data : DataFrame
+        Camp locations with costs and coverage
+    max_budget_crores, min_budget_crores : float
+        Budget range of the frontier
+    timeline_months : int, optional
+        Camps whose estimated_days exceed it are not eligible
+    priority_filter : list, optional
+        Priority levels to filter (e.g., ['CRITICAL', 'HIGH'])
+    step_crores : float
+        Budget grid of the stored points
+    max_units : int
+        Budget resolution (DP columns)
+
+    Returns:
+    --------
+    frontier : DataFrame
+        budget_crores (smallest budget reaching the point), cost_crores,
+        coverage and num_camps, sorted by budget
+    """
+    camps_filtered = filter_camps(camps_data, priority_filter)
+    if timeline_months is not None:
+        camps_filtered = camps_filtered[
+            camps_filtered['estimated_days'] <= timeline_months * DAYS_PER_MONTH
+        ]
+
+    costs = camps_filtered['total_cost'].to_numpy(dtype=float)
+    values = camps_filtered['coverage_population'].to_numpy(dtype=float)
+    weights, capacity, resolution = budget_units(costs, max_budget_crores * CRORE, max_units)
+
+    best = np.zeros(capacity + 1)
+    cost = np.zeros(capacity + 1)
+    count = np.zeros(capacity + 1, dtype=np.int32)
+    for i in range(len(weights)):
+        w = weights[i]
+        if w > capacity:
+            continue
+        candidate = best[:capacity + 1 - w] + values[i]
+        improved = np.flatnonzero(candidate > best[w:])
+        # Read the shorter-budget solutions before overwriting
+        cost[w + improved] = cost[improved] + costs[i]
+        count[w + improved] = count[improved] + 1
+        best[w + improved] = candidate[improved]
+
+    # ROI-prefix selections (greedy without skipping) are exact-cost solutions
+    # too; they cover budgets where rounding costs up loses the most
+    order = np.argsort(-(values / costs), kind='stable')
+    prefix_cost = np.cumsum(costs[order])
+
+    frontier = pd.DataFrame({
+        'budget_crores': np.concatenate([np.arange(capacity + 1) * resolution, prefix_cost]) / CRORE,
+        'cost_crores': np.concatenate([cost, prefix_cost]) / CRORE,
+        'coverage': np.concatenate([best, np.cumsum(values[order])]).astype(np.int64),
+        'num_camps': np.concatenate([count, np.arange(1, len(order) + 1)]).astype(np.int32),
+    })
+
+    # Pareto points: coverage strictly above every solution within a smaller budget
+    frontier = frontier.sort_values(['budget_crores', 'coverage'], kind='stable')
+    frontier = frontier[frontier['coverage'] > frontier['coverage'].cummax().shift(fill_value=-1)]
+    frontier = frontier.reset_index(drop=True)
+
+    # Points in force on the budget grid
+    grid = np.arange(min_budget_crores, max_budget_crores + step_crores / 2, step_crores)
+    positions = np.searchsorted(frontier['budget_crores'].to_numpy(), grid, side='right') - 1
+    positions = np.unique(positions[positions >= 0])
+    return frontier.iloc[positions].reset_index(drop=True)[FRONTIER_COLUMNS]
+
+
+def frontier_lookup(frontier, budget_crores):
+    """
+    Frontier point for a budget by binary search (O(log n))
+
+    Returns:
+    --------
+    point : Series or None
+        Best solution affordable within budget_crores (None below the frontier)
+    """
+    pos = np.searchsorted(frontier['budget_crores'].to_numpy(), budget_crores, side='right') - 1
+    if pos < 0:
+        return None
+    return frontier.iloc[pos]
+
+
+# ============================================================================
+# SERVICE (web application)
+# ============================================================================
+
+class OptimizerService:
+    """
+    Memoised camp optimiser
+
+    Solutions are kept in an LRU cache keyed on (budget, timeline, priority
+    set, timeline enforcement). warm_up() fills the cache in a background
+    thread so that interactive requests are usually cache hits. Cached
+    results are shared: callers must not modify them.
+
+    Parameters:
+    -----------
+    camps_data : DataFrame
+        Camp locations with costs and coverage
+    method : str
+        Solver of optimize_camp_deployment_exact() ('dp' or 'milp')
+    cache_size : int
+        Solutions kept
+    """
+
+    def __init__(self, camps_data, method='dp', cache_size=SERVICE_CACHE_SIZE):
+        self.camps_data = camps_data
+        self.method = method
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._warming = {}
+
+    @staticmethod
+    def key(budget_crores, timeline_months, priority_filter=None, enforce_timeline=True):
+        priorities = frozenset(p.upper() for p in priority_filter) if priority_filter else None
+        return (float(budget_crores), int(timeline_months), priorities, bool(enforce_timeline))
+
+    def cached(self, budget_crores, timeline_months, priority_filter=None, enforce_timeline=True):
+        """Cached solution, or None (never solves)"""
+        key = self.key(budget_crores, timeline_months, priority_filter, enforce_timeline)
+        with self._lock:
+            return self._cache.get(key)
+
+    def solve(self, budget_crores, timeline_months, priority_filter=None, enforce_timeline=True):
+        """
+        (result, selected_camps) of optimize_camp_deployment_exact(),
+        from the cache when available
+        """
+        key = self.key(budget_crores, timeline_months, priority_filter, enforce_timeline)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+
+        # Solved outside the lock; a concurrent solve of the same key is harmless
+        solution = optimize_camp_deployment_exact(
+            self.camps_data, budget_crores, timeline_months,
+            priority_filter=sorted(key[2]) if key[2] else None, method=self.method,
+            enforce_timeline=enforce_timeline, verbose=False
+        )
+        with self._lock:
+            self._cache[key] = solution
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return solution
+
+    def warm_up(self, timeline_months, priority_filter=None, enforce_timeline=True,
+                budgets=SLIDER_BUDGETS):
+        """
+        Solve every budget in a daemon thread (once per timeline / priority set)
+
+        Returns:
+        --------
+        thread : Thread
+            The warm-up thread (already started)
+        """
+        key = self.key(0, timeline_months, priority_filter, enforce_timeline)[1:]
+        with self._lock:
+            thread = self._warming.get(key)
+            if thread is not None:
+                return thread
+            thread = threading.Thread(
+                target=self._warm, args=(list(budgets), timeline_months, priority_filter, enforce_timeline),
+                name=f"optimizer-warm-up-{timeline_months}", daemon=True
+            )
+            self._warming[key] = thread
+        thread.start()
+        return thread
+
+    def _warm(self, budgets, timeline_months, priority_filter, enforce_timeline):
+        for budget in budgets:
+            if self.cached(budget, timeline_months, priority_filter, enforce_timeline) is None:
+                self.solve(budget, timeline_months, priority_filter, enforce_timeline)
+
+    def cache_info(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._cache),
+                    'max_size': self.cache_size}
+
+
+# ============================================================================
+# SCENARIO OUTPUTS (notebook 05)
+# ============================================================================
+
+def run_scenarios(camps_data, scenarios=SCENARIOS):
+    """
+    Greedy optimisation of every scenario
+
+    Returns:
+    --------
+    comparison_df : DataFrame
+        optimization_scenarios.csv
+    selections : dict
+        Scenario name -> selected camps
+    """
+    rows = []
+    selections = {}
+    for name, params in scenarios.items():
+        result, selected_camps = optimize_camp_deployment(
+            camps_data, params['budget_crores'], params['timeline_months'],
+            params['priority_filter'], verbose=False
+        )
+        selections[name] = selected_camps
+        rows.append({
+            'Scenario': name,
+            'Budget (Cr)': params['budget_crores'],
+            'Timeline (months)': params['timeline_months'],
+            'Camps': result['num_camps'],
+            'Coverage': result['total_coverage'],
+            'Cost (Cr)': round(result['total_cost_crores'], 2),
+            'Budget Util %': round(result['budget_utilization_pct'], 1),
+            'Cost/Enrollment': round(result['cost_per_enrollment'], 2),
+            'Actual Timeline': int(result['estimated_timeline_months'])
+        })
+    return pd.DataFrame(rows), selections
+
+
+def phased_plan(selected_camps, num_phases=NUM_PHASES):
+    """
+    Quarterly rollout of a selection in priority_rank order: equal phases,
+    the last one taking the remainder (phased_deployment_plan.csv)
+    """
+    if selected_camps.empty:
+        raise ValueError("No camps selected - cannot create a phased plan")
+
+    camps = selected_camps.sort_values('priority_rank').reset_index(drop=True)
+    camps_per_phase = max(len(camps) // num_phases, 1)
+    camps['Phase'] = np.minimum(np.arange(len(camps)) // camps_per_phase, num_phases - 1) + 1
+
+    phases = camps.groupby('Phase').agg(
+        Num_Camps=('camp_id', 'size'),
+        Coverage=('coverage_population', 'sum'),
+        Cost_Crores=('total_cost', 'sum'),
+        States_Covered=('state', 'nunique'),
+        Districts_Covered=('district', 'nunique'),
+        Avg_Days_Per_Camp=('estimated_days', 'mean'),
+    ).reindex(range(1, num_phases + 1))
+
+    phased_df = pd.DataFrame({
+        'Phase': phases.index,
+        'Quarter': [f'Q{phase}' for phase in phases.index],
+        'Num_Camps': phases['Num_Camps'].fillna(0).astype(int).to_numpy(),
+        'Coverage': phases['Coverage'].fillna(0).astype(np.int64).to_numpy(),
+        'Cost_Crores': (phases['Cost_Crores'].fillna(0) / CRORE).round(2).to_numpy(),
+        'States_Covered': phases['States_Covered'].fillna(0).astype(int).to_numpy(),
+        'Districts_Covered': phases['Districts_Covered'].fillna(0).astype(int).to_numpy(),
+        'Avg_Days_Per_Camp': phases['Avg_Days_Per_Camp'].fillna(0).astype(int).to_numpy(),
+    })
+    phased_df['Cumulative_Camps'] = phased_df['Num_Camps'].cumsum()
+    phased_df['Cumulative_Coverage'] = phased_df['Coverage'].cumsum()
+    phased_df['Cumulative_Cost'] = phased_df['Cost_Crores'].cumsum()
+    return phased_df
+
+
+def state_allocation(selected_camps):
+    """Camps, coverage and cost per state (state_resource_allocation.csv)"""
+    allocation = selected_camps.groupby('state', observed=True).agg(
+        Num_Camps=('camp_id', 'count'),
+        Coverage=('coverage_population', 'sum'),
+        Cost_INR=('total_cost', 'sum'),
+        Avg_Days=('estimated_days', 'mean'),
+    ).reset_index().rename(columns={'state': 'State'})
+    allocation['Cost_Crores'] = (allocation.pop('Cost_INR') / CRORE).round(2)
+    return allocation.sort_values('Coverage', ascending=False)
+
+
+def budget_sensitivity(camps_data, budgets=SENSITIVITY_BUDGETS, timeline_months=12):
+    """Greedy result per budget, with marginal returns (budget_sensitivity_analysis.csv)"""
+    rows = []
+    for budget in budgets:
+        result, _ = optimize_camp_deployment(camps_data, budget, timeline_months, verbose=False)
+        rows.append({
+            'Budget_Crores': budget,
+            'Camps': result['num_camps'],
+            'Coverage': result['total_coverage'],
+            'Cost_Crores': result['total_cost_crores'],
+            'Cost_Per_Enrollment': result['cost_per_enrollment']
+        })
+    sensitivity_df = pd.DataFrame(rows)
+    sensitivity_df['Marginal_Coverage'] = sensitivity_df['Coverage'].diff()
+    sensitivity_df['Marginal_Cost'] = sensitivity_df['Cost_Crores'].diff()
+    sensitivity_df['Marginal_ROI'] = (
+        sensitivity_df['Marginal_Coverage'] / (sensitivity_df['Marginal_Cost'] * CRORE)
+    ).round(4)
+    return sensitivity_df
+
+
+def save_scenario_outputs(camps_data, data_path=DATA_PATH, scenarios=SCENARIOS):
+    """Write the notebook-05 output files"""
+    data_path = Path(data_path)
+    camps_data = camps_data.copy()
+    camps_data['camp_priority'] = camps_data['camp_priority'].astype(str).str.upper().str.strip()
+
+    comparison_df, selections = run_scenarios(camps_data, scenarios)
+    balanced = selections['BALANCED']
+    outputs = {
+        'optimization_scenarios': comparison_df,
+        'phased_deployment_plan': phased_plan(balanced),
+        'state_resource_allocation': state_allocation(balanced),
+        'budget_sensitivity_analysis': budget_sensitivity(camps_data),
+    }
+    for name, selected_camps in selections.items():
+        outputs[f'recommended_camps_{name.lower()}'] = selected_camps
+
+    for name, df in outputs.items():
+        df.to_csv(data_path / f"{name}.csv", index=False)
+        print(f"✅ Saved: {name}.csv")
+    return outputs
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Camp budget optimisation")
+    parser.add_argument("--data-path", type=Path, default=DATA_PATH,
+                        help="Processed data folder (mobile_camp_locations.csv)")
+    parser.add_argument("--scenarios", action="store_true",
+                        help="Write the scenario comparison, phased plan and sensitivity tables")
+    parser.add_argument("--frontier", action="store_true",
+                        help="Write the coverage-vs-budget Pareto frontier")
+    parser.add_argument("--min-budget", type=float, default=FRONTIER_MIN_BUDGET,
+                        help="Frontier lower budget (Crores)")
+    parser.add_argument("--max-budget", type=float, default=FRONTIER_MAX_BUDGET,
+                        help="Frontier upper budget (Crores)")
+    parser.add_argument("--timeline", type=int, default=None,
+                        help="Timeline (months) each camp must finish within")
+    args = parser.parse_args(argv)
+
+    camps_df = pd.read_csv(args.data_path / "mobile_camp_locations.csv")
+
+    if args.scenarios:
+        save_scenario_outputs(camps_df, args.data_path)
+
+    if args.frontier:
+        frontier = pareto_frontier(camps_df, args.max_budget, args.min_budget,
+                                   timeline_months=args.timeline)
+        frontier.to_csv(args.data_path / FRONTIER_FILE, index=False)
+        print(f"✅ Saved: {FRONTIER_FILE} ({len(frontier):,} points)")
+
+
+if __name__ == "__main__":
+    main()
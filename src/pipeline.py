@@ -0,0 +1,444 @@
+"""
+LAST MILE CONNECT - Batch Pipeline
+Headless rebuild of data/processed (notebooks 01-06 without Jupyter).
+
+Stages form a DAG:
+
+    ingest -> gap -> cluster -> optimise / frontier / tiles / validate -> convert
+              gap -> forecast
+
+Each stage declares its input files, parameters and source modules. Its
+cache key is a content hash of all three plus the outputs of the stages it
+depends on; a stage whose key and outputs are unchanged since its last run
+is skipped. Stages whose dependencies are done run concurrently in a process
+pool, so a nightly run only redoes what its new inputs affect. validate
+(src.validation) is a gate: convert, which publishes the app tables, only
+runs when every error-level rule passes:
+
+    python -m src.pipeline --raw-path data/raw --jobs 4
+    python -m src.pipeline --stages optimise frontier --force
+"""
+
+import argparse
+import hashlib
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .clustering import CACHE_PATH, OPTIMAL_CAMPS, ModelCache, cluster_camps
+from .features import (
+    PINCODE_GEO_FILE, build_clustering_data, filter_priority_locations, load_pincode_geo,
+)
+from .forecasting import (
+    FORECAST_FILE, STATE_FILE as FORECAST_STATE_FILE, ForecastState, forecast_districts,
+)
+from .gap_analysis import CENSUS_FILE, build_gap_analysis, load_census, save_gap_outputs
+from .ingestion import ingest_raw, save_outputs
+from .optimizer import FRONTIER_FILE, pareto_frontier, save_scenario_outputs
+from .storage import convert_processed
+from .tiling import TILES_FILE, build_tiles
+from .validation import (
+    TABLES as VALIDATION_TABLES, VALIDATION_FILE, run_validation, validate_or_raise,
+)
+
+RAW_DATA_PATH = Path("data/raw")
+DATA_PATH = Path("data/processed")
+EXTERNAL_PATH = Path("data/external")
+STATE_FILE = Path("data/cache/pipeline_state.json")
+
+SRC_PATH = Path(__file__).resolve().parent
+
+# Bytes read at a time when hashing files
+HASH_BLOCK = 1 << 20
+
+INGEST_OUTPUTS = ['pincode_enrolment.csv', 'master_district_month.csv',
+                  'district_summary.csv', 'state_summary.csv']
+GAP_OUTPUTS = ['district_gap_analysis.csv', 'state_gap_analysis.csv',
+               'critical_priority_districts.csv', 'top_1000_priority_districts.csv']
+CLUSTER_OUTPUTS = ['mobile_camp_locations.csv', 'pincode_camp_assignments.csv']
+OPTIMISE_OUTPUTS = ['optimization_scenarios.csv', 'phased_deployment_plan.csv',
+                    'state_resource_allocation.csv', 'budget_sensitivity_analysis.csv']
+CONVERT_TABLES = ['district_gap_analysis', 'state_gap_analysis', 'mobile_camp_locations',
+                  'optimization_scenarios', 'phased_deployment_plan', 'pareto_frontier']
+
+
+# ============================================================================
+# STAGE FUNCTIONS (run in worker processes)
+# ============================================================================
+
+def run_ingest(config):
+    save_outputs(ingest_raw(config['raw_path'], workers=config['workers']), config['data_path'])
+
+
+def run_gap(config):
+    district_summary = pd.read_csv(config['data_path'] / "district_summary.csv")
+    gap_df, state_analysis = build_gap_analysis(district_summary, load_census(config['external_path']))
+    save_gap_outputs(gap_df, state_analysis, config['data_path'])
+    print(f"✅ Saved: gap analysis ({len(gap_df):,} districts)")
+
+
+def run_forecast(config):
+    data_path = config['data_path']
+    state = ForecastState.fit(pd.read_csv(data_path / "master_district_month.csv", parse_dates=['date']))
+    state.save(Path(config['cache_path']) / FORECAST_STATE_FILE.name)
+    forecast_df = forecast_districts(state, pd.read_csv(data_path / "district_gap_analysis.csv"))
+    forecast_df.to_csv(data_path / FORECAST_FILE, index=False)
+    print(f"✅ Saved: {FORECAST_FILE} ({len(forecast_df):,} districts)")
+
+
+def run_cluster(config):
+    data_path = config['data_path']
+    pincode_geo = load_pincode_geo(config['external_path'])
+    if pincode_geo is None:
+        raise FileNotFoundError("Pincode coordinates not found - required for camp clustering")
+
+    clustering_data = build_clustering_data(pd.read_csv(data_path / "pincode_enrolment.csv"),
+                                            pd.read_csv(data_path / "district_gap_analysis.csv"),
+                                            pincode_geo)
+    camps_df, assignments = cluster_camps(filter_priority_locations(clustering_data),
+                                          config['camps'], method=config['method'],
+                                          cache=ModelCache(config['model_cache']),
+                                          weighting=config['weighting'])
+    camps_df.to_csv(data_path / "mobile_camp_locations.csv", index=False)
+    assignments.to_csv(data_path / "pincode_camp_assignments.csv", index=False)
+    print(f"✅ Saved: mobile_camp_locations.csv ({len(camps_df):,} camps)")
+
+
+def run_optimise(config):
+    save_scenario_outputs(pd.read_csv(config['data_path'] / "mobile_camp_locations.csv"),
+                          config['data_path'])
+
+
+def run_frontier(config):
+    frontier = pareto_frontier(pd.read_csv(config['data_path'] / "mobile_camp_locations.csv"))
+    frontier.to_csv(config['data_path'] / FRONTIER_FILE, index=False)
+    print(f"✅ Saved: {FRONTIER_FILE} ({len(frontier):,} points)")
+
+
+def run_tiles(config):
+    data_path = config['data_path']
+    pincode_points = None
+    pincode_geo = load_pincode_geo(config['external_path'])
+    if pincode_geo is not None:
+        pincode_points = build_clustering_data(pd.read_csv(data_path / "pincode_enrolment.csv"),
+                                               pd.read_csv(data_path / "district_gap_analysis.csv"),
+                                               pincode_geo)
+    tiles = build_tiles(pd.read_csv(data_path / "mobile_camp_locations.csv"), pincode_points)
+    tiles.to_parquet(data_path / TILES_FILE, index=False)
+    print(f"✅ Saved: {TILES_FILE} ({len(tiles):,} cells)")
+
+
+def run_validate(config):
+    report = run_validation(config['data_path'])
+    failed = report[~report['passed']]
+    if len(failed):
+        print(failed.to_string(index=False))
+    print(f"✅ Saved: {VALIDATION_FILE} ({len(report)} checks)")
+    validate_or_raise(report)
+
+
+def run_convert(config):
+    convert_processed(config['data_path'], tables=CONVERT_TABLES)
+
+
+# ============================================================================
+# STAGES
+# ============================================================================
+
+class Stage:
+    """
+    One pipeline step
+
+    Parameters:
+    -----------
+    name : str
+    run : callable
+        Module-level function of the config dict (picklable)
+    deps : list
+        Stages that must finish first
+    inputs : list
+        (root, glob) pairs; root is a config path key ('raw_path', ...)
+    outputs : list
+        (root, file name) pairs
+    params : list
+        Config keys that change the outputs
+    modules : list
+        src modules whose source is part of the cache key
+    """
+
+    def __init__(self, name, run, deps=(), inputs=(), outputs=(), params=(), modules=()):
+        self.name = name
+        self.run = run
+        self.deps = list(deps)
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.params = list(params)
+        self.modules = list(modules) + ['pipeline']
+
+
+STAGES = [
+    Stage('ingest', run_ingest,
+          inputs=[('raw_path', '*/*.csv')],
+          outputs=[('data_path', name) for name in INGEST_OUTPUTS],
+          modules=['ingestion']),
+    Stage('gap', run_gap, deps=['ingest'],
+          inputs=[('data_path', 'district_summary.csv'),
+                  ('external_path', CENSUS_FILE)],
+          outputs=[('data_path', name) for name in GAP_OUTPUTS],
+          modules=['gap_analysis']),
+    Stage('forecast', run_forecast, deps=['ingest', 'gap'],
+          inputs=[('data_path', 'master_district_month.csv'), ('data_path', 'district_gap_analysis.csv')],
+          outputs=[('data_path', FORECAST_FILE), ('cache_path', FORECAST_STATE_FILE.name)],
+          modules=['forecasting']),
+    Stage('cluster', run_cluster, deps=['gap'],
+          inputs=[('data_path', 'district_gap_analysis.csv'), ('data_path', 'pincode_enrolment.csv'),
+                  ('external_path', PINCODE_GEO_FILE)],
+          outputs=[('data_path', name) for name in CLUSTER_OUTPUTS],
+          params=['camps', 'method', 'weighting'],
+          modules=['clustering', 'features']),
+    Stage('optimise', run_optimise, deps=['cluster'],
+          inputs=[('data_path', 'mobile_camp_locations.csv')],
+          outputs=[('data_path', name) for name in OPTIMISE_OUTPUTS],
+          modules=['optimizer']),
+    Stage('frontier', run_frontier, deps=['cluster'],
+          inputs=[('data_path', 'mobile_camp_locations.csv')],
+          outputs=[('data_path', FRONTIER_FILE)],
+          modules=['optimizer']),
+    Stage('tiles', run_tiles, deps=['cluster'],
+          inputs=[('data_path', 'mobile_camp_locations.csv'), ('data_path', 'pincode_enrolment.csv'),
+                  ('data_path', 'district_gap_analysis.csv'), ('external_path', PINCODE_GEO_FILE)],
+          outputs=[('data_path', TILES_FILE)],
+          modules=['tiling', 'features']),
+    Stage('validate', run_validate, deps=['ingest', 'gap', 'cluster'],
+          inputs=[('data_path', f'{name}.csv') for name in VALIDATION_TABLES],
+          outputs=[('data_path', VALIDATION_FILE)],
+          modules=['validation']),
+    Stage('convert', run_convert, deps=['gap', 'cluster', 'optimise', 'frontier', 'validate'],
+          inputs=[('data_path', f'{name}.csv') for name in CONVERT_TABLES],
+          outputs=[('data_path', f'{name}.parquet') for name in CONVERT_TABLES],
+          modules=['storage']),
+]
+
+
+# ============================================================================
+# CONTENT HASHING
+# ============================================================================
+
+class PipelineState:
+    """
+    Persistent record of stage keys and output digests
+
+    File digests are memoised by (path, size, mtime), so unchanged raw
+    shards are not re-read on every run.
+    """
+
+    def __init__(self, path=STATE_FILE):
+        self.path = Path(path)
+        try:
+            state = json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            state = {}
+        self.files = state.get('files', {})
+        self.stages = state.get('stages', {})
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({'files': self.files, 'stages': self.stages}, indent=1))
+
+    def digest(self, path):
+        """sha1 of a file's content, or None if it does not exist"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        memo = self.files.get(str(path))
+        if memo and memo[0] == stat.st_size and memo[1] == stat.st_mtime_ns:
+            return memo[2]
+
+        sha = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK), b''):
+                sha.update(block)
+        self.files[str(path)] = [stat.st_size, stat.st_mtime_ns, sha.hexdigest()]
+        return sha.hexdigest()
+
+
+def _paths(config, patterns):
+    paths = []
+    for root, pattern in patterns:
+        matched = sorted(Path(config[root]).glob(pattern))
+        paths += matched if matched else [Path(config[root]) / pattern]
+    return paths
+
+
+def output_digests(stage, config, state):
+    return {str(path): state.digest(path) for path in _paths(config, stage.outputs)}
+
+
+def stage_key(stage, config, state):
+    """Content hash of a stage's code, parameters, inputs and upstream outputs"""
+    key = {
+        'stage': stage.name,
+        'code': [state.digest(SRC_PATH / f"{module}.py") for module in stage.modules],
+        'params': {name: str(config[name]) for name in stage.params},
+        'inputs': {str(path): state.digest(path) for path in _paths(config, stage.inputs)},
+        'deps': {dep: state.stages.get(dep, {}).get('outputs') for dep in stage.deps},
+    }
+    return hashlib.sha1(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def up_to_date(stage, key, config, state):
+    """Same key as the last successful run, and its outputs untouched"""
+    record = state.stages.get(stage.name)
+    if record is None or record['key'] != key:
+        return False
+    current = output_digests(stage, config, state)
+    return None not in current.values() and current == record['outputs']
+
+
+# ============================================================================
+# SCHEDULER
+# ============================================================================
+
+def _timed_run(run, config):
+    start = time.perf_counter()
+    run(config)
+    return time.perf_counter() - start
+
+
+def run_pipeline(config, stages=STAGES, selected=None, force=False, jobs=2, state_file=STATE_FILE):
+    """
+    Run the stages that are out of date, concurrently where the DAG allows
+
+    Parameters:
+    -----------
+    config : dict
+        raw_path, data_path, external_path, cache_path (forecast state) and
+        the stage parameters
+    selected : list, optional
+        Only these stages are considered; the others count as done
+    force : bool
+        Run the selected stages even if they are up to date
+    jobs : int
+        Stages run at once
+
+    Returns:
+    --------
+    report : DataFrame
+        stage, status ('ran', 'skipped', 'failed', 'blocked') and seconds
+    """
+    by_name = {stage.name: stage for stage in stages}
+    selected = set(selected) if selected else set(by_name)
+    unknown = selected - set(by_name)
+    if unknown:
+        raise ValueError(f"Unknown stages: {sorted(unknown)}")
+
+    state = PipelineState(state_file)
+    pending = [stage for stage in stages if stage.name in selected]
+    done = set(by_name) - selected
+    failed = set()
+    report = []
+    running = {}
+
+    with ProcessPoolExecutor(max_workers=max(1, jobs)) as executor:
+        while pending or running:
+            # Resolve every stage whose dependencies are done (skips cascade)
+            progress = True
+            while progress:
+                progress = False
+                for stage in list(pending):
+                    if any(dep in failed for dep in stage.deps):
+                        pending.remove(stage)
+                        failed.add(stage.name)
+                        report.append({'stage': stage.name, 'status': 'blocked', 'seconds': 0.0})
+                        progress = True
+                    elif all(dep in done for dep in stage.deps):
+                        pending.remove(stage)
+                        key = stage_key(stage, config, state)
+                        if not force and up_to_date(stage, key, config, state):
+                            print(f"⏭️  {stage.name}: up to date")
+                            done.add(stage.name)
+                            report.append({'stage': stage.name, 'status': 'skipped', 'seconds': 0.0})
+                            progress = True
+                        else:
+                            print(f"▶️  {stage.name}")
+                            running[executor.submit(_timed_run, stage.run, config)] = (stage, key)
+
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, key = running.pop(future)
+                try:
+                    seconds = future.result()
+                except Exception as exc:
+                    print(f"❌ {stage.name}: {exc!r}")
+                    failed.add(stage.name)
+                    state.stages.pop(stage.name, None)
+                    report.append({'stage': stage.name, 'status': 'failed', 'seconds': np.nan})
+                    continue
+
+                state.stages[stage.name] = {
+                    'key': key,
+                    'outputs': output_digests(stage, config, state),
+                    'finished': datetime.now().isoformat(timespec='seconds'),
+                }
+                state.save()
+                done.add(stage.name)
+                print(f"✅ {stage.name}: {seconds:.1f}s")
+                report.append({'stage': stage.name, 'status': 'ran', 'seconds': round(seconds, 2)})
+
+    state.save()
+    return pd.DataFrame(report, columns=['stage', 'status', 'seconds'])
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild the processed data (notebooks 01-06)")
+    parser.add_argument("--raw-path", type=Path, default=RAW_DATA_PATH)
+    parser.add_argument("--data-path", type=Path, default=DATA_PATH)
+    parser.add_argument("--external-path", type=Path, default=EXTERNAL_PATH)
+    parser.add_argument("--state-file", type=Path, default=STATE_FILE)
+    parser.add_argument("--stages", nargs='+', choices=[stage.name for stage in STAGES],
+                        help="Only consider these stages (the others count as done)")
+    parser.add_argument("--force", action="store_true", help="Run stages even if up to date")
+    parser.add_argument("--jobs", type=int, default=2, help="Stages run concurrently")
+    parser.add_argument("--workers", type=int, default=1, help="Processes for raw ingestion")
+    parser.add_argument("--camps", type=int, default=OPTIMAL_CAMPS, help="Number of camps (K)")
+    parser.add_argument("--method", choices=['kmeans', 'minibatch'], default='kmeans')
+    parser.add_argument("--weighting", choices=['sample', 'legacy'], default='sample')
+    parser.add_argument("--model-cache", type=Path, default=CACHE_PATH)
+    args = parser.parse_args(argv)
+
+    config = {
+        'raw_path': args.raw_path,
+        'data_path': args.data_path,
+        'external_path': args.external_path,
+        'cache_path': args.state_file.parent,
+        'workers': args.workers,
+        'camps': args.camps,
+        'method': args.method,
+        'weighting': args.weighting,
+        'model_cache': args.model_cache,
+    }
+    args.data_path.mkdir(parents=True, exist_ok=True)
+    report = run_pipeline(config, selected=args.stages, force=args.force,
+                          jobs=args.jobs, state_file=args.state_file)
+
+    print("\n📊 PIPELINE SUMMARY:")
+    print(report.to_string(index=False))
+    if (report['status'].isin(['failed', 'blocked'])).any():
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
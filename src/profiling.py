@@ -0,0 +1,228 @@
+"""
+LAST MILE CONNECT - Profiling
+Opt-in timers and memory counters for the Streamlit app's hot paths.
+
+Disabled unless LMC_PROFILE is set (sections are then a shared no-op
+context). With LMC_PROFILE=1 every section records wall time and net
+traced allocation (tracemalloc); LMC_PROFILE=time records wall time only.
+Samples are kept per (scope, section) - scope is the app page - in a
+bounded window, summarised as p50 / p95, and exported as JSON or
+Prometheus text (by file suffix) when LMC_PROFILE_FILE is set:
+
+    LMC_PROFILE=1 LMC_PROFILE_FILE=data/cache/app_profile.prom streamlit run app/app.py
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROFILE_ENV = "LMC_PROFILE"
+PROFILE_FILE_ENV = "LMC_PROFILE_FILE"
+
+# Written by the Diagnostics page buttons when LMC_PROFILE_FILE is unset
+DEFAULT_EXPORT_FILE = Path("data/cache/app_profile.json")
+
+# Samples kept per (scope, section) for the percentiles
+MAX_SAMPLES = 2000
+
+# Minimum seconds between automatic exports
+EXPORT_INTERVAL = 10
+
+PERCENTILES = {'p50': 50, 'p95': 95}
+
+METRIC_PREFIX = "lmc"
+
+
+def profile_mode():
+    """'memory', 'time' or None (disabled) from LMC_PROFILE"""
+    value = os.environ.get(PROFILE_ENV, '').strip().lower()
+    if value in ('', '0', 'false', 'no', 'off'):
+        return None
+    return 'time' if value == 'time' else 'memory'
+
+
+def export_path():
+    """LMC_PROFILE_FILE as a Path, or None"""
+    value = os.environ.get(PROFILE_FILE_ENV, '').strip()
+    return Path(value) if value else None
+
+
+class NullProfiler:
+    """Profiler stand-in when profiling is off: sections cost one call"""
+
+    enabled = False
+
+    def section(self, scope, name):
+        return nullcontext()
+
+    def record(self, scope, name, seconds, alloc_bytes=0):
+        pass
+
+    def maybe_export(self, path=None):
+        pass
+
+
+class Profiler:
+    """
+    Section timings shared by all sessions (thread-safe)
+
+    Parameters:
+    -----------
+    memory : bool
+        Also record net traced allocation per section (starts tracemalloc)
+    max_samples : int
+        Samples kept per section for the percentiles
+    """
+
+    enabled = True
+
+    def __init__(self, memory=True, max_samples=MAX_SAMPLES):
+        self.memory = memory
+        self.max_samples = max_samples
+        self._samples = {}
+        self._totals = {}
+        self._lock = threading.Lock()
+        self._last_export = 0.0
+        self.started = datetime.now().isoformat(timespec='seconds')
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def section(self, scope, name):
+        """Time the enclosed block as (scope, name)"""
+        before = tracemalloc.get_traced_memory()[0] if self.memory else 0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            alloc = tracemalloc.get_traced_memory()[0] - before if self.memory else 0
+            self.record(scope, name, seconds, alloc)
+
+    def record(self, scope, name, seconds, alloc_bytes=0):
+        """Add one sample"""
+        key = (scope, name)
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.max_samples)
+                self._totals[key] = [0, 0.0]
+            samples.append((seconds, alloc_bytes))
+            totals = self._totals[key]
+            totals[0] += 1
+            totals[1] += seconds
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+    def summary(self):
+        """
+        Per (scope, section): call count, p50 / p95 / max milliseconds over
+        the sample window and p95 net allocation
+
+        Returns:
+        --------
+        summary : DataFrame
+            Sorted by p95 time, slowest first
+        """
+        with self._lock:
+            items = [(key, np.array(samples), self._totals[key]) for key, samples in self._samples.items()]
+
+        rows = []
+        for (scope, name), samples, (count, total) in items:
+            row = {'scope': scope, 'section': name, 'calls': count}
+            millis = samples[:, 0] * 1000
+            for label, q in PERCENTILES.items():
+                row[f'{label}_ms'] = round(float(np.percentile(millis, q)), 2)
+            row['max_ms'] = round(float(millis.max()), 2)
+            row['total_s'] = round(total, 3)
+            if self.memory:
+                row['p95_alloc_mb'] = round(float(np.percentile(samples[:, 1], 95)) / 2**20, 3)
+            rows.append(row)
+
+        columns = ['scope', 'section', 'calls'] + [f'{label}_ms' for label in PERCENTILES] + \
+                  ['max_ms', 'total_s'] + (['p95_alloc_mb'] if self.memory else [])
+        summary = pd.DataFrame(rows, columns=columns)
+        return summary.sort_values(f"{list(PERCENTILES)[-1]}_ms", ascending=False).reset_index(drop=True)
+
+    # ------------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------------
+
+    def to_json(self):
+        summary = self.summary()
+        traced = tracemalloc.get_traced_memory() if self.memory else (0, 0)
+        return json.dumps({
+            'started': self.started,
+            'exported': datetime.now().isoformat(timespec='seconds'),
+            'memory': self.memory,
+            'traced_current_mb': round(traced[0] / 2**20, 3),
+            'traced_peak_mb': round(traced[1] / 2**20, 3),
+            'sections': summary.to_dict('records'),
+        }, indent=1)
+
+    def to_prometheus(self):
+        """Prometheus text exposition: one summary per section, seconds"""
+        with self._lock:
+            items = [(key, np.array(samples), list(self._totals[key]))
+                     for key, samples in self._samples.items()]
+
+        name = f"{METRIC_PREFIX}_section_seconds"
+        lines = [f"# HELP {name} Wall time of instrumented app sections",
+                 f"# TYPE {name} summary"]
+        for (scope, section), samples, (count, total) in items:
+            labels = f'scope="{_escape(scope)}",section="{_escape(section)}"'
+            for q in PERCENTILES.values():
+                value = np.percentile(samples[:, 0], q)
+                lines.append(f'{name}{{{labels},quantile="{q / 100:g}"}} {value:.6f}')
+            lines.append(f"{name}_sum{{{labels}}} {total:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {count}")
+
+        if self.memory:
+            alloc = f"{METRIC_PREFIX}_section_alloc_bytes"
+            lines += [f"# HELP {alloc} p95 net traced allocation of instrumented app sections",
+                      f"# TYPE {alloc} gauge"]
+            for (scope, section), samples, _ in items:
+                labels = f'scope="{_escape(scope)}",section="{_escape(section)}"'
+                lines.append(f"{alloc}{{{labels}}} {np.percentile(samples[:, 1], 95):.0f}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        """Write to_prometheus() (.prom / .txt) or to_json() (otherwise) atomically"""
+        path = Path(path)
+        text = self.to_prometheus() if path.suffix in ('.prom', '.txt') else self.to_json()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(text)
+        os.replace(tmp, path)
+        self._last_export = time.monotonic()
+        return path
+
+    def maybe_export(self, path=None):
+        """export() to LMC_PROFILE_FILE at most every EXPORT_INTERVAL seconds"""
+        path = path or export_path()
+        if path is not None and time.monotonic() - self._last_export >= EXPORT_INTERVAL:
+            self.export(path)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def create_profiler():
+    """Profiler for the LMC_PROFILE mode, or a NullProfiler when it is unset"""
+    mode = profile_mode()
+    if mode is None:
+        return NullProfiler()
+    return Profiler(memory=(mode == 'memory'))
@@ -0,0 +1,159 @@
+"""
+LAST MILE CONNECT - District Query Index
+Row indexes over the district gap table for the web application filters.
+
+Built once per loaded table: state -> row positions, a priority bitmask and
+a trigram index over the lower-case state and district names. Queries return
+sorted row positions (use with DataFrame.iloc) and are memoised by their
+arguments, so a widget change never copies or rescans the whole table.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .gap_analysis import PRIORITY_LEVELS
+
+# Query results kept per index
+QUERY_CACHE_SIZE = 256
+
+NGRAM = 3
+
+
+def _positions_by_value(values):
+    """Mapping value -> sorted row positions (missing values are skipped)"""
+    codes, uniques = pd.factorize(values)
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    return {
+        value: order[bounds[i]:bounds[i + 1]]
+        for i, value in enumerate(uniques)
+    }
+
+
+def _ngrams(text, n=NGRAM):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class DistrictIndex:
+    """
+    Precomputed indexes over district_gap_analysis rows
+
+    Parameters:
+    -----------
+    gap_df : DataFrame
+        District gap analysis (state, district, priority_level columns)
+    cache_size : int
+        Query results kept
+    """
+
+    def __init__(self, gap_df, cache_size=QUERY_CACHE_SIZE):
+        self.num_rows = len(gap_df)
+        self.all_positions = np.arange(self.num_rows)
+        self.all_positions.setflags(write=False)
+
+        state = gap_df['state'].astype(object)
+        district = gap_df['district'].astype(object)
+        self.state_positions = _positions_by_value(state.to_numpy())
+
+        # One bit per priority level
+        level_codes = pd.Categorical(gap_df['priority_level'].astype(object),
+                                     categories=PRIORITY_LEVELS).codes
+        self.priority_bits = np.where(level_codes >= 0, 1 << level_codes.clip(min=0), 0).astype(np.uint8)
+
+        # Lower-case names (state and district) -> row positions
+        name_positions = {}
+        for column in (state, district):
+            lowered = column.str.lower().to_numpy()
+            for name, positions in _positions_by_value(lowered).items():
+                if isinstance(name, str):
+                    name_positions.setdefault(name, []).append(positions)
+        self.names = list(name_positions)
+        self.name_positions = [
+            np.unique(np.concatenate(parts)) for parts in name_positions.values()
+        ]
+
+        # Trigram -> ids of the names containing it
+        postings = {}
+        for name_id, name in enumerate(self.names):
+            for gram in _ngrams(name):
+                postings.setdefault(gram, []).append(name_id)
+        self.postings = {gram: np.asarray(ids) for gram, ids in postings.items()}
+
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Memoisation
+    # ------------------------------------------------------------------
+
+    def _memoised(self, key, compute):
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        positions = compute()
+        positions.setflags(write=False)
+        with self._lock:
+            self._cache[key] = positions
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return positions
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def filter(self, priorities=None, state=None):
+        """
+        Row positions with priority_level in priorities and the given state
+
+        An empty / None priorities or a None state does not filter.
+        """
+        priorities = frozenset(priorities) if priorities else None
+        return self._memoised(('filter', priorities, state),
+                              lambda: self._filter(priorities, state))
+
+    def _filter(self, priorities, state):
+        positions = self.all_positions if state is None else \
+            self.state_positions.get(state, np.empty(0, dtype=np.intp))
+        if priorities:
+            mask = 0
+            for level in priorities:
+                if level in PRIORITY_LEVELS:
+                    mask |= 1 << PRIORITY_LEVELS.index(level)
+            positions = positions[(self.priority_bits[positions] & mask) != 0]
+        return positions
+
+    def search(self, text):
+        """
+        Row positions whose state or district name contains text
+        (case-insensitive, literal substring)
+        """
+        text = text.lower()
+        if not text:
+            return self.all_positions
+        return self._memoised(('search', text), lambda: self._search(text))
+
+    def _search(self, text):
+        grams = _ngrams(text)
+        if grams:
+            # Candidate names hold every trigram of the query; rarest first
+            lists = sorted((self.postings.get(gram) for gram in grams),
+                           key=lambda ids: -1 if ids is None else len(ids))
+            if lists[0] is None:
+                return np.empty(0, dtype=np.intp)
+            candidates = lists[0]
+            for ids in lists[1:]:
+                candidates = np.intersect1d(candidates, ids, assume_unique=True)
+        else:
+            candidates = range(len(self.names))
+
+        # Trigrams may match out of order: verify the substring
+        matches = [self.name_positions[i] for i in candidates if text in self.names[i]]
+        if not matches:
+            return np.empty(0, dtype=np.intp)
+        return np.unique(np.concatenate(matches))
@@ -0,0 +1,97 @@
+"""
+LAST MILE CONNECT - Priority Scoring Engine
+Re-score, re-classify and re-rank every district for any weights and
+coverage thresholds.
+
+The normalised score components (unreached population / max, coverage gap
+/ 100) are kept as one contiguous districts x components array, so a new
+weighting is a single matrix-vector product, the priority levels a single
+searchsorted and the ranking a single argsort. The defaults reproduce
+district_gap_analysis.csv (src.gap_analysis).
+"""
+
+import numpy as np
+import pandas as pd
+
+from .gap_analysis import GAP_WEIGHT, PRIORITY_LEVELS, PRIORITY_THRESHOLDS, UNREACHED_WEIGHT
+
+SCORE_COMPONENTS = ['unreached', 'gap']
+DEFAULT_WEIGHTS = (UNREACHED_WEIGHT, GAP_WEIGHT)
+
+
+def score_components(gap_df, max_unreached=None):
+    """
+    (D, 2) float64 C-contiguous array: unreached population / max and
+    coverage gap / 100
+    """
+    unreached = gap_df['unreached_population'].to_numpy(dtype=float)
+    if max_unreached is None:
+        max_unreached = unreached.max() if len(unreached) else 1.0
+    components = np.empty((len(gap_df), len(SCORE_COMPONENTS)))
+    np.divide(unreached, max_unreached or 1.0, out=components[:, 0])
+    np.divide(gap_df['coverage_gap_pct'].to_numpy(dtype=float), 100, out=components[:, 1])
+    return components
+
+
+class ScoringEngine:
+    """
+    Priority scoring over a fixed district table
+
+    Parameters:
+    -----------
+    gap_df : DataFrame
+        District gap analysis (unreached_population, coverage_gap_pct,
+        coverage_rate)
+    """
+
+    def __init__(self, gap_df):
+        self.num_rows = len(gap_df)
+        self.components = score_components(gap_df)
+        self.coverage_rate = np.ascontiguousarray(gap_df['coverage_rate'].to_numpy(dtype=float))
+        self.components.setflags(write=False)
+        self.coverage_rate.setflags(write=False)
+
+    def scores(self, weights=DEFAULT_WEIGHTS):
+        """priority_score of every district (weights per SCORE_COMPONENTS)"""
+        return np.round(self.components @ np.asarray(weights, dtype=float), 2)
+
+    def level_codes(self, thresholds=PRIORITY_THRESHOLDS):
+        """Position in PRIORITY_LEVELS of every district (coverage rate below
+        thresholds[0] -> CRITICAL, ...)"""
+        thresholds = np.sort(np.asarray(thresholds, dtype=float))
+        return np.searchsorted(thresholds, self.coverage_rate, side='right').astype(np.int8)
+
+    def rank(self, weights=DEFAULT_WEIGHTS, thresholds=PRIORITY_THRESHOLDS):
+        """
+        Scores, levels and ranks for one weighting
+
+        Returns:
+        --------
+        result : dict of ndarray
+            score, level_code and rank (1 = highest score) per district, in
+            table order, and order (row positions, best first)
+        """
+        score = self.scores(weights)
+        order = np.argsort(-score, kind='stable')
+        rank = np.empty(self.num_rows, dtype=np.int64)
+        rank[order] = np.arange(1, self.num_rows + 1)
+        return {'score': score, 'level_code': self.level_codes(thresholds),
+                'rank': rank, 'order': order}
+
+    def level_counts(self, thresholds=PRIORITY_THRESHOLDS):
+        """Number of districts per priority level"""
+        counts = np.bincount(self.level_codes(thresholds), minlength=len(PRIORITY_LEVELS))
+        return pd.Series(counts, index=PRIORITY_LEVELS)
+
+    def apply(self, gap_df, weights=DEFAULT_WEIGHTS, thresholds=PRIORITY_THRESHOLDS):
+        """
+        gap_df with priority_score, priority_level and priority_rank
+        recomputed, sorted by the new rank (as rank_districts)
+        """
+        result = self.rank(weights, thresholds)
+        ranked = gap_df.assign(
+            priority_score=result['score'],
+            priority_level=np.asarray(PRIORITY_LEVELS, dtype=object)[result['level_code']],
+            priority_rank=result['rank'],
+        )
+        return ranked.iloc[result['order']].reset_index(drop=True)
@@ -0,0 +1,232 @@
+"""
+LAST MILE CONNECT - Shared-Memory Serving
+One copy of the processed tables for every Streamlit worker process.
+
+The tables are published once as uncompressed Arrow IPC files in shared
+memory (/dev/shm, or data/cache/serve where there is none), in a snapshot
+directory named after the data version. Each worker memory-maps the current
+snapshot read-only, so numeric columns are zero-copy views of the same
+physical pages in every process and session, and RAM does not grow with
+the number of workers:
+
+    python -m src.serving --data-path data/processed
+    LMC_SERVE=1 streamlit run app/app.py
+
+The app re-publishes on its own when the processed files change (one
+worker publishes under a file lock, the others attach). Workers still
+mapping an older snapshot keep it until they re-attach.
+"""
+
+import argparse
+import json
+import os
+import shutil
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import pyarrow as pa
+
+from .incremental import read_manifest
+from .storage import APP_TABLES, DATA_PATH, data_version, read_arrow
+
+try:
+    import fcntl
+except ImportError:  # Windows: no shared-memory serving, publish without a lock
+    fcntl = None
+
+SERVE_ENV = "LMC_SERVE"
+SHM_PATH = Path("/dev/shm/last_mile_connect")
+FALLBACK_PATH = Path("data/cache/serve")
+
+SERVED_TABLES = APP_TABLES + ['pareto_frontier']
+
+CURRENT_FILE = "current.json"
+LOCK_FILE = ".lock"
+
+# Snapshots kept on publish (older ones are unlinked; open mappings survive)
+KEEP_SNAPSHOTS = 2
+
+
+def default_serve_path():
+    return SHM_PATH if SHM_PATH.parent.is_dir() else FALLBACK_PATH
+
+
+def serve_path():
+    """
+    Snapshot folder from LMC_SERVE ('1' -> default_serve_path(), otherwise a
+    folder), or None when serving is off
+    """
+    value = os.environ.get(SERVE_ENV, '').strip()
+    if value.lower() in ('', '0', 'false', 'no', 'off'):
+        return None
+    if value.lower() in ('1', 'true', 'yes', 'on'):
+        return default_serve_path()
+    return Path(value)
+
+
+@contextmanager
+def _publish_lock(serve):
+    serve.mkdir(parents=True, exist_ok=True)
+    with open(serve / LOCK_FILE, 'w') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def read_current(serve):
+    """Metadata of the current snapshot, or None if nothing is published"""
+    try:
+        current = json.loads((Path(serve) / CURRENT_FILE).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return current if (Path(serve) / current['version']).is_dir() else None
+
+
+# ============================================================================
+# PUBLISHING
+# ============================================================================
+
+def write_ipc(table, path):
+    """Uncompressed Arrow IPC file with one record batch (mappable zero-copy)"""
+    table = table.combine_chunks()
+    with pa.OSFile(str(path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=max(table.num_rows, 1))
+
+
+def _prune(serve, keep, current):
+    snapshots = sorted((path for path in serve.iterdir() if path.is_dir() and not path.name.startswith('.')),
+                       key=lambda path: path.stat().st_mtime, reverse=True)
+    for path in snapshots[keep:]:
+        if path.name != current:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def publish(data_path=DATA_PATH, serve=None, tables=SERVED_TABLES, force=False):
+    """
+    Write the processed tables as a new snapshot and make it current
+
+    Parameters:
+    -----------
+    data_path : Path
+        Processed data folder (CSV / Parquet, as read_table)
+    serve : Path, optional
+        Snapshot folder (default_serve_path())
+    tables : list
+        Table names; missing tables are skipped
+    force : bool
+        Re-publish even if the current snapshot has the same data version
+
+    Returns:
+    --------
+    meta : dict
+        version, base_version (change manifest version included in the
+        tables), published and per-table rows and bytes
+    """
+    serve = Path(serve or default_serve_path())
+    version = data_version(data_path, tables)
+    with _publish_lock(serve):
+        current = read_current(serve)
+        if current is not None and current['version'] == version and not force:
+            return current
+
+        # Read the manifest version first: tables written after it already contain its updates
+        base_version = read_manifest(data_path)['version']
+        staging = serve / f".staging-{version}-{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+
+        meta = {'version': version, 'base_version': base_version, 'source_tables': list(tables),
+                'published': datetime.now().isoformat(timespec='seconds'), 'tables': {}}
+        for name in tables:
+            try:
+                table = read_arrow(name, data_path)
+            except FileNotFoundError:
+                continue
+            write_ipc(table, staging / f"{name}.arrow")
+            meta['tables'][name] = {'rows': table.num_rows,
+                                    'bytes': (staging / f"{name}.arrow").stat().st_size}
+        (staging / "meta.json").write_text(json.dumps(meta, indent=1))
+
+        target = serve / version
+        shutil.rmtree(target, ignore_errors=True)
+        os.rename(staging, target)
+
+        tmp = serve / f".{CURRENT_FILE}.{os.getpid()}"
+        tmp.write_text(json.dumps(meta, indent=1))
+        os.replace(tmp, serve / CURRENT_FILE)
+        _prune(serve, KEEP_SNAPSHOTS, version)
+    return meta
+
+
+def ensure_published(data_path=DATA_PATH, serve=None, tables=SERVED_TABLES):
+    """
+    Current snapshot metadata, publishing first if the processed files
+    changed (tables published earlier with --tables are kept)
+    """
+    serve = Path(serve or default_serve_path())
+    current = read_current(serve)
+    if current is not None:
+        source_tables = current['source_tables']
+        if set(tables) <= set(source_tables) and \
+                current['version'] == data_version(data_path, source_tables):
+            return current
+        tables = source_tables + [name for name in tables if name not in source_tables]
+    return publish(data_path, serve, tables)
+
+
+# ============================================================================
+# ATTACHING
+# ============================================================================
+
+def attach_table(path):
+    """Arrow table backed by a read-only memory map of an IPC file"""
+    return pa.ipc.open_file(pa.memory_map(str(path), 'r')).read_all()
+
+
+def attach(version, serve=None, tables=None):
+    """
+    DataFrames over a published snapshot
+
+    Numeric columns without nulls are read-only views of the mapped file
+    (shared by every process); dictionary columns become Categoricals.
+
+    Returns:
+    --------
+    frames : dict
+        Table name -> DataFrame, for the tables in the snapshot
+    """
+    snapshot = Path(serve or default_serve_path()) / version
+    names = tables or json.loads((snapshot / "meta.json").read_text())['tables']
+    return {name: attach_table(snapshot / f"{name}.arrow").to_pandas(split_blocks=True)
+            for name in names if (snapshot / f"{name}.arrow").exists()}
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Publish the processed tables to shared memory")
+    parser.add_argument("--data-path", type=Path, default=DATA_PATH)
+    parser.add_argument("--serve-path", type=Path, default=None,
+                        help=f"Snapshot folder (default: {SHM_PATH}, else {FALLBACK_PATH})")
+    parser.add_argument("--tables", nargs='+', default=SERVED_TABLES,
+                        help="Tables to publish (add pincode-level tables here)")
+    parser.add_argument("--force", action='store_true')
+    args = parser.parse_args(argv)
+
+    serve = args.serve_path or default_serve_path()
+    meta = publish(args.data_path, serve, args.tables, force=args.force)
+    for name, info in meta['tables'].items():
+        print(f"   {name}: {info['rows']:,} rows, {info['bytes'] / 2**20:.1f} MB")
+    print(f"✅ Published: {serve / meta['version']}")
+
+
+if __name__ == "__main__":
+    main()
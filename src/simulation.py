@@ -0,0 +1,339 @@
+"""
+LAST MILE CONNECT - Deployment Simulation
+Batch what-if evaluation of phased (quarterly) camp rollouts.
+
+A plan is a camp order, a budget cap per quarter and a camp throughput
+(enrolments per camp per day). Camps start in plan order as soon as the
+budget released so far (unspent budget rolls over) covers their cost; each
+camp's full cost is committed when it starts, and it then enrols at the
+plan's throughput until its coverage population is reached. Camps run in
+parallel, as in src.optimizer.
+
+simulate_plans() evaluates a whole batch of plans as plans x camps x
+quarters arrays (in chunks of plans), so thousands of phasings are scored
+without a Python loop over plans:
+
+    python -m src.simulation --plans 5000 --caps 100 125 150 --throughput 400 500 600
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .clustering import COST_PER_CAMP_OPERATION_DAY, COST_PER_CAMP_SETUP, COST_PER_ENROLLMENT
+from .optimizer import CRORE
+
+DATA_PATH = Path("data/processed")
+SIMULATION_FILE = "simulated_plans.csv"
+
+QUARTERS = 4
+DAYS_PER_QUARTER = 90
+
+# Quarterly budget caps (Crores) and throughputs tried by default
+BUDGET_CAPS = [100, 125, 150]
+THROUGHPUTS = [400, 500, 600]
+
+# Plans scored by default, and the best ones reported
+NUM_PLANS = 2000
+TOP_PLANS = 10
+
+# Randomised orders: std of the log-normal noise on each camp's ROI
+ORDER_NOISE = 0.5
+
+# Largest plans x camps x quarters block evaluated at once
+MAX_BLOCK_CELLS = 4_000_000
+
+PLAN_ORDERS = ['roi', 'priority']
+
+
+# ============================================================================
+# PLAN BATCH
+# ============================================================================
+
+class PlanBatch:
+    """
+    Candidate phasings evaluated together
+
+    Attributes:
+    -----------
+    order : ndarray
+        (P, N) camp positions in deployment order
+    caps : ndarray
+        (P, Q) budget released per quarter (INR)
+    throughput : ndarray
+        (P,) enrolments per camp per day
+    strategy : ndarray
+        (P,) how the order was built ('roi', 'priority' or 'random')
+    """
+
+    def __init__(self, order, caps, throughput, strategy):
+        self.order = np.asarray(order, dtype=np.int32)
+        self.caps = np.asarray(caps, dtype=float)
+        self.throughput = np.asarray(throughput, dtype=float)
+        self.strategy = np.asarray(strategy, dtype=object)
+
+    def __len__(self):
+        return len(self.order)
+
+    @property
+    def quarters(self):
+        return self.caps.shape[1]
+
+
+def camp_costs(coverage, throughput):
+    """
+    Days and total cost (INR) of camps at a given throughput, as in
+    src.clustering.estimate_costs (broadcasts over plans)
+    """
+    days = np.ceil(coverage / throughput)
+    cost = COST_PER_CAMP_SETUP + days * COST_PER_CAMP_OPERATION_DAY + coverage * COST_PER_ENROLLMENT
+    return days, cost
+
+
+def generate_plans(camps_df, num_plans=NUM_PLANS, quarters=QUARTERS, budget_caps=BUDGET_CAPS,
+                   throughputs=THROUGHPUTS, order_noise=ORDER_NOISE, seed=42):
+    """
+    Candidate plans: every (order, cap, throughput) combination of the ROI
+    and priority-rank orders, then random plans up to num_plans
+
+    Random plans draw a cap and a throughput from the lists and order camps
+    by their ROI times log-normal noise, so good camps still tend to go first.
+
+    Parameters:
+    -----------
+    camps_df : DataFrame
+        Camp locations (coverage_population, priority_rank)
+    budget_caps : list
+        Budget released per quarter (Crores)
+    throughputs : list
+        Enrolments per camp per day
+
+    Returns:
+    --------
+    plans : PlanBatch
+    """
+    rng = np.random.default_rng(seed)
+    coverage = camps_df['coverage_population'].to_numpy(dtype=float)
+    n_camps = len(coverage)
+    budget_caps = np.asarray(budget_caps, dtype=float)
+    throughputs = np.asarray(throughputs, dtype=float)
+
+    # Deterministic grid
+    grid_order, grid_cap, grid_thr = np.meshgrid(
+        np.arange(len(PLAN_ORDERS)), budget_caps, throughputs, indexing='ij'
+    )
+    grid_order, grid_cap, grid_thr = grid_order.ravel(), grid_cap.ravel(), grid_thr.ravel()
+    _, cost = camp_costs(coverage[None, :], grid_thr[:, None])
+    roi_keys = -(coverage[None, :] / cost)
+    rank_keys = np.broadcast_to(camps_df['priority_rank'].to_numpy(dtype=float), roi_keys.shape)
+    keys = np.where((grid_order == PLAN_ORDERS.index('roi'))[:, None], roi_keys, rank_keys)
+
+    # Randomised plans
+    n_random = max(num_plans - len(grid_cap), 0)
+    rand_cap = rng.choice(budget_caps, n_random)
+    rand_thr = rng.choice(throughputs, n_random)
+    _, rand_cost = camp_costs(coverage[None, :], rand_thr[:, None])
+    rand_keys = -(coverage[None, :] / rand_cost) * rng.lognormal(0.0, order_noise, (n_random, n_camps))
+
+    order = np.argsort(np.vstack([keys, rand_keys]), axis=1, kind='stable')
+    caps = np.repeat(np.concatenate([grid_cap, rand_cap])[:, None] * CRORE, quarters, axis=1)
+    strategy = np.concatenate([np.asarray(PLAN_ORDERS, dtype=object)[grid_order],
+                               np.full(n_random, 'random', dtype=object)])
+    return PlanBatch(order, caps, np.concatenate([grid_thr, rand_thr]), strategy)
+
+
+# ============================================================================
+# SIMULATION
+# ============================================================================
+
+def _simulate_block(coverage, order, caps, throughput):
+    """Schedule of one block of plans (see simulate_plans)"""
+    n_plans, quarters = caps.shape
+    cov = coverage[order]                                    # (P, N) in plan order
+    days, cost = camp_costs(cov, throughput[:, None])
+
+    # Start quarter: first quarter whose cumulative budget covers the
+    # cumulative cost up to this camp (quarters = never started)
+    cum_cost = np.cumsum(cost, axis=1)
+    cum_caps = np.cumsum(caps, axis=1)
+    start = (cum_cost[:, :, None] > cum_caps[:, None, :]).sum(axis=2)
+    started = start < quarters
+
+    # Enrolled by the end of each quarter (P, N, Q)
+    elapsed = (np.arange(1, quarters + 1)[None, None, :] - start[:, :, None]).clip(min=0)
+    per_quarter = (throughput * DAYS_PER_QUARTER)[:, None, None]
+    enrolled = np.minimum(cov[:, :, None], per_quarter * elapsed)
+
+    # Spend and camps started per quarter
+    flat = (np.arange(n_plans)[:, None] * quarters + start)[started]
+    spend = np.bincount(flat, weights=cost[started], minlength=n_plans * quarters)
+    camps = np.bincount(flat, minlength=n_plans * quarters)
+
+    # Camps finished within the horizon
+    finish = start + np.ceil(days / DAYS_PER_QUARTER).astype(np.int64) - 1
+    return {
+        'cumulative_coverage': enrolled.sum(axis=1),
+        'spend': spend.reshape(n_plans, quarters),
+        'camps_started': camps.reshape(n_plans, quarters),
+        'camps_finished': (started & (finish < quarters)).sum(axis=1),
+    }
+
+
+def simulate_plans(camps_df, plans, max_block_cells=MAX_BLOCK_CELLS):
+    """
+    Quarterly outcome of every plan in the batch
+
+    Parameters:
+    -----------
+    camps_df : DataFrame
+        Camp locations (coverage_population)
+    plans : PlanBatch
+        Candidate plans
+    max_block_cells : int
+        Plans are evaluated in blocks of at most this many plan x camp x
+        quarter cells, which bounds memory
+
+    Returns:
+    --------
+    results : dict of ndarray
+        cumulative_coverage, spend (INR) and camps_started, each (P, Q),
+        and camps_finished (P,)
+    """
+    coverage = camps_df['coverage_population'].to_numpy(dtype=float)
+    cells = max(len(coverage) * plans.quarters, 1)
+    block = max(max_block_cells // cells, 1)
+
+    parts = [
+        _simulate_block(coverage, plans.order[i:i + block], plans.caps[i:i + block],
+                        plans.throughput[i:i + block])
+        for i in range(0, len(plans), block)
+    ]
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+
+def best_plans(plans, results, top_n=TOP_PLANS):
+    """
+    The top_n plans by final coverage, ties broken by earlier coverage
+    (sum of the cumulative coverage of every quarter)
+
+    Returns:
+    --------
+    best : DataFrame
+        One row per plan, best first
+    """
+    coverage = results['cumulative_coverage']
+    final = coverage[:, -1]
+    area = coverage.sum(axis=1)
+
+    # Candidates from argpartition, ranked exactly among themselves
+    top_n = min(top_n, len(plans))
+    candidates = np.argpartition(-final, top_n - 1)[:top_n] if top_n < len(plans) else np.arange(len(plans))
+    threshold = final[candidates].min()
+    candidates = np.flatnonzero(final >= threshold)
+    ranked = candidates[np.lexsort((-area[candidates], -final[candidates]))][:top_n]
+
+    spend = results['spend'][ranked]
+    return pd.DataFrame({
+        'plan': ranked,
+        'strategy': plans.strategy[ranked],
+        'quarterly_cap_crores': plans.caps[ranked, 0] / CRORE,
+        'throughput_per_day': plans.throughput[ranked].astype(int),
+        'camps_started': results['camps_started'][ranked].sum(axis=1),
+        'camps_finished': results['camps_finished'][ranked],
+        'coverage': final[ranked].round().astype(np.int64),
+        'coverage_quarters': area[ranked].round().astype(np.int64),
+        'cost_crores': (spend.sum(axis=1) / CRORE).round(2),
+    })
+
+
+def plan_schedule(camps_df, plans, results, plan):
+    """
+    Quarterly schedule of one plan, in the phased_deployment_plan.csv layout
+
+    Coverage is the citizens enrolled during the quarter; Cost_Crores is the
+    cost committed by the camps started in it.
+    """
+    quarters = plans.quarters
+    cov = camps_df['coverage_population'].to_numpy(dtype=float)
+    days, cost = camp_costs(cov, plans.throughput[plan])
+    cum_caps = np.cumsum(plans.caps[plan])
+    ordered_cost = np.cumsum(cost[plans.order[plan]])
+    start = np.empty(len(cov), dtype=np.int64)
+    start[plans.order[plan]] = np.searchsorted(cum_caps, ordered_cost, side='left')
+
+    started = camps_df.assign(_quarter=start, _days=days)[start < quarters]
+    per_quarter = started.groupby('_quarter').agg(
+        States_Covered=('state', 'nunique'),
+        Districts_Covered=('district', 'nunique'),
+        Avg_Days_Per_Camp=('_days', 'mean'),
+    ).reindex(range(quarters), fill_value=0)
+
+    cumulative = results['cumulative_coverage'][plan]
+    schedule = pd.DataFrame({
+        'Phase': np.arange(1, quarters + 1),
+        'Quarter': [f'Q{q}' for q in range(1, quarters + 1)],
+        'Num_Camps': results['camps_started'][plan],
+        'Coverage': np.diff(cumulative, prepend=0).round().astype(np.int64),
+        'Cost_Crores': (results['spend'][plan] / CRORE).round(2),
+        'States_Covered': per_quarter['States_Covered'].to_numpy(),
+        'Districts_Covered': per_quarter['Districts_Covered'].to_numpy(),
+        'Avg_Days_Per_Camp': per_quarter['Avg_Days_Per_Camp'].fillna(0).astype(int).to_numpy(),
+    })
+    schedule['Cumulative_Camps'] = schedule['Num_Camps'].cumsum()
+    schedule['Cumulative_Coverage'] = schedule['Coverage'].cumsum()
+    schedule['Cumulative_Cost'] = schedule['Cost_Crores'].cumsum()
+    return schedule
+
+
+def what_if(camps_df, num_plans=NUM_PLANS, quarters=QUARTERS, budget_caps=BUDGET_CAPS,
+            throughputs=THROUGHPUTS, top_n=TOP_PLANS, seed=42):
+    """
+    Generate, simulate and rank plans
+
+    Returns:
+    --------
+    best : DataFrame
+        The top_n plans (see best_plans)
+    schedule : DataFrame
+        Quarterly schedule of the best plan
+    """
+    plans = generate_plans(camps_df, num_plans, quarters, budget_caps, throughputs, seed=seed)
+    results = simulate_plans(camps_df, plans)
+    best = best_plans(plans, results, top_n)
+    return best, plan_schedule(camps_df, plans, results, int(best['plan'].iloc[0]))
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="What-if simulation of phased deployment plans")
+    parser.add_argument("--data-path", type=Path, default=DATA_PATH)
+    parser.add_argument("--plans", type=int, default=NUM_PLANS, help="Plans simulated")
+    parser.add_argument("--quarters", type=int, default=QUARTERS)
+    parser.add_argument("--caps", type=float, nargs='+', default=BUDGET_CAPS,
+                        help="Quarterly budget caps tried (Crores)")
+    parser.add_argument("--throughput", type=float, nargs='+', default=THROUGHPUTS,
+                        help="Camp throughputs tried (enrolments per day)")
+    parser.add_argument("--top", type=int, default=TOP_PLANS)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    camps_df = pd.read_csv(args.data_path / "mobile_camp_locations.csv")
+    best, schedule = what_if(camps_df, args.plans, args.quarters, args.caps,
+                             args.throughput, args.top, args.seed)
+
+    print(f"\n📊 BEST OF {args.plans:,} PLANS:")
+    print(best.to_string(index=False))
+    print("\n📅 BEST PLAN SCHEDULE:")
+    print(schedule.to_string(index=False))
+
+    best.to_csv(args.data_path / SIMULATION_FILE, index=False)
+    print(f"\n✅ Saved: {SIMULATION_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+LAST MILE CONNECT - Spatial Index
+Nearest-camp and coverage-radius queries between camps and pincodes.
+
+Points are indexed as 3-D unit vectors in a KD-tree (as in src.clustering):
+the straight-line (chord) distance between unit vectors is a monotone
+function of the great-circle distance, so kNN and radius queries are exact
+haversine queries after converting radii and distances:
+
+    python -m src.spatial --radius-km 25
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from .clustering import EARTH_RADIUS_KM, estimate_costs, to_unit_sphere
+from .features import build_clustering_data, load_pincode_geo
+
+DATA_PATH = Path("data/processed")
+EXTERNAL_PATH = Path("data/external")
+
+# Catchment of a mobile camp (km)
+COVERAGE_RADIUS_KM = 25.0
+
+
+def km_to_chord(distance_km):
+    """Great-circle distance (km) -> chord length on the unit sphere"""
+    angle = np.minimum(np.asarray(distance_km, dtype=float) / EARTH_RADIUS_KM, np.pi)
+    return 2.0 * np.sin(angle / 2.0)
+
+
+def chord_to_km(chord):
+    """Chord length on the unit sphere -> great-circle distance (km)"""
+    return 2.0 * np.arcsin(np.clip(np.asarray(chord, dtype=float) / 2.0, 0.0, 1.0)) * EARTH_RADIUS_KM
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance (km) between coordinate arrays"""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(a, dtype=float)) for a in (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2 +
+         np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2.0 * np.arcsin(np.sqrt(a)) * EARTH_RADIUS_KM
+
+
+class SpatialIndex:
+    """
+    Great-circle KD-tree over latitude/longitude points
+
+    Parameters:
+    -----------
+    latitude, longitude : array-like
+        Coordinates in degrees (rows with missing coordinates must be dropped)
+    """
+
+    def __init__(self, latitude, longitude):
+        self.points = to_unit_sphere(latitude, longitude)
+        self.tree = cKDTree(self.points)
+
+    def __len__(self):
+        return len(self.points)
+
+    def nearest(self, latitude, longitude, k=1, workers=-1):
+        """
+        k nearest indexed points of each query point
+
+        Returns:
+        --------
+        distances_km : ndarray
+            (N,) for k == 1, else (N, k)
+        indices : ndarray
+            Positions in the index, same shape
+        """
+        chord, idx = self.tree.query(to_unit_sphere(latitude, longitude), k=k, workers=workers)
+        return chord_to_km(chord), idx
+
+    def within(self, latitude, longitude, radius_km, workers=-1):
+        """
+        Indexed points within radius_km of each query point, as flat pairs
+
+        Returns:
+        --------
+        query_pos : ndarray
+            Position of the query point
+        index_pos : ndarray
+            Position of the indexed point
+        """
+        hits = self.tree.query_ball_point(to_unit_sphere(latitude, longitude),
+                                          km_to_chord(radius_km), workers=workers)
+        lengths = np.fromiter((len(h) for h in hits), dtype=np.int64, count=len(hits))
+        query_pos = np.repeat(np.arange(len(hits)), lengths)
+        index_pos = np.concatenate(hits).astype(np.int64) if lengths.sum() else np.empty(0, np.int64)
+        return query_pos, index_pos
+
+    def count_within(self, latitude, longitude, radius_km, workers=-1):
+        """Number of indexed points within radius_km of each query point"""
+        return self.tree.query_ball_point(to_unit_sphere(latitude, longitude),
+                                          km_to_chord(radius_km), workers=workers,
+                                          return_length=True)
+
+
+# ============================================================================
+# CAMP / PINCODE QUERIES
+# ============================================================================
+
+def nearest_camp(pincode_points, camps_df):
+    """
+    Nearest camp of every pincode
+
+    Returns:
+    --------
+    nearest : DataFrame
+        pincode, nearest_camp_id and distance_km, aligned with pincode_points
+    """
+    camp_index = SpatialIndex(camps_df['latitude'], camps_df['longitude'])
+    distance_km, idx = camp_index.nearest(pincode_points['latitude'], pincode_points['longitude'])
+    return pd.DataFrame({
+        'pincode': pincode_points['pincode'].to_numpy(),
+        'nearest_camp_id': camps_df['camp_id'].to_numpy()[idx],
+        'distance_km': distance_km.round(3),
+    }, index=pincode_points.index)
+
+
+def reachable_population(camps_df, pincode_points, radius_km=COVERAGE_RADIUS_KM,
+                         weight_col='estimated_unreached'):
+    """
+    Population each camp can reach within radius_km
+
+    Parameters:
+    -----------
+    camps_df : DataFrame
+        Camp locations (camp_id, latitude, longitude)
+    pincode_points : DataFrame
+        Located pincodes with weight_col (see build_clustering_data)
+    radius_km : float
+        Camp catchment radius
+
+    Returns:
+    --------
+    reach : DataFrame
+        Per camp: reachable_pincodes and reachable_population (every
+        pincode in the radius), exclusive_population (pincodes in the
+        radius whose nearest camp it is, so camps do not double count) and
+        nearest_pincode_km
+    """
+    pincode_points = pincode_points.dropna(subset=['latitude', 'longitude'])
+    weights = np.nan_to_num(pincode_points[weight_col].to_numpy(dtype=float))
+    n_camps = len(camps_df)
+
+    pincode_index = SpatialIndex(pincode_points['latitude'], pincode_points['longitude'])
+    camp_pos, pin_pos = pincode_index.within(camps_df['latitude'], camps_df['longitude'], radius_km)
+    nearest_km, _ = pincode_index.nearest(camps_df['latitude'], camps_df['longitude'])
+
+    # Each pincode counts once, for its nearest camp, if that camp is in range
+    camp_index = SpatialIndex(camps_df['latitude'], camps_df['longitude'])
+    distance_km, owner = camp_index.nearest(pincode_points['latitude'], pincode_points['longitude'])
+    in_range = distance_km <= radius_km
+
+    return pd.DataFrame({
+        'camp_id': camps_df['camp_id'].to_numpy(),
+        'reachable_pincodes': np.bincount(camp_pos, minlength=n_camps),
+        'reachable_population': np.bincount(camp_pos, weights=weights[pin_pos],
+                                            minlength=n_camps).round().astype(np.int64),
+        'exclusive_population': np.bincount(owner[in_range], weights=weights[in_range],
+                                            minlength=n_camps).round().astype(np.int64),
+        'nearest_pincode_km': nearest_km.round(3),
+    })
+
+
+def with_reachable_coverage(camps_df, reach, column='exclusive_population'):
+    """
+    Camps with coverage_population replaced by a reachable population and
+    the costs re-estimated, ready for src.optimizer
+    """
+    camps_df = camps_df.merge(reach[['camp_id', column]], on='camp_id', how='left')
+    camps_df['coverage_population'] = camps_df.pop(column).fillna(0).astype(np.int64)
+    return estimate_costs(camps_df)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Camp reachability within a radius")
+    parser.add_argument("--data-path", type=Path, default=DATA_PATH)
+    parser.add_argument("--external-path", type=Path, default=EXTERNAL_PATH)
+    parser.add_argument("--radius-km", type=float, default=COVERAGE_RADIUS_KM,
+                        help="Camp catchment radius (km)")
+    args = parser.parse_args(argv)
+
+    pincode_geo = load_pincode_geo(args.external_path)
+    if pincode_geo is None:
+        raise FileNotFoundError("Pincode coordinates not found - required for reachability")
+
+    camps_df = pd.read_csv(args.data_path / "mobile_camp_locations.csv")
+    gap_df = pd.read_csv(args.data_path / "district_gap_analysis.csv")
+    pincode_df = pd.read_csv(args.data_path / "pincode_enrolment.csv")
+    pincode_points = build_clustering_data(pincode_df, gap_df, pincode_geo)
+
+    reach = reachable_population(camps_df, pincode_points, args.radius_km)
+    reach.to_csv(args.data_path / "camp_reachable_population.csv", index=False)
+    print(f"✅ Saved: camp_reachable_population.csv "
+          f"({reach['exclusive_population'].sum():,} citizens within {args.radius_km:g} km)")
+
+    nearest = nearest_camp(pincode_points, camps_df)
+    nearest.to_csv(args.data_path / "pincode_nearest_camp.csv", index=False)
+    print("✅ Saved: pincode_nearest_camp.csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+LAST MILE CONNECT - Columnar Data Store
+Parquet/Arrow storage for the processed datasets.
+
+The notebooks write their outputs as CSV. Converting them once to Parquet with an
+explicit schema (categorical names, downcast numerics) lets the web application
+skip CSV parsing and dtype inference on every cold start:
+
+    python -m src.storage --data-path data/processed
+"""
+
+import argparse
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DATA_PATH = Path("data/processed")
+
+# Dictionary-encoded on disk, pandas Categorical in memory
+CATEGORY = pa.dictionary(pa.int16(), pa.string())
+
+# ============================================================================
+# TABLE SCHEMAS
+# ============================================================================
+
+SCHEMAS = {
+    'district_gap_analysis': {
+        'state': CATEGORY,
+        'district': CATEGORY,
+        'age_0_5': pa.int32(),
+        'age_5_17': pa.int32(),
+        'age_18_greater': pa.int32(),
+        'total_enrolment': pa.int32(),
+        'total_biometric_updates': pa.int32(),
+        'total_demographic_updates': pa.int32(),
+        'population_2025': pa.int32(),
+        'coverage_rate': pa.float32(),
+        'unreached_population': pa.int32(),
+        'coverage_gap_pct': pa.float32(),
+        'priority_level': CATEGORY,
+        'priority_score': pa.float32(),
+        'priority_rank': pa.int32(),
+    },
+    'state_gap_analysis': {
+        'state': CATEGORY,
+        'population': pa.int64(),
+        'enrolled': pa.int64(),
+        'unreached': pa.int64(),
+        'num_districts': pa.int16(),
+        'coverage_rate': pa.float32(),
+        'gap_pct': pa.float32(),
+    },
+    'mobile_camp_locations': {
+        'latitude': pa.float32(),
+        'longitude': pa.float32(),
+        'camp_id': pa.int32(),
+        'state': CATEGORY,
+        'district': CATEGORY,
+        'nearest_pincode': pa.int32(),
+        'coverage_population': pa.int32(),
+        'num_locations': pa.int32(),
+        'priority_rank': pa.int32(),
+        'camp_priority': CATEGORY,
+        'estimated_days': pa.int32(),
+        'setup_cost': pa.int64(),
+        'operational_cost': pa.int64(),
+        'enrollment_cost': pa.int64(),
+        'total_cost': pa.int64(),
+    },
+    'optimization_scenarios': {
+        'Scenario': pa.string(),
+        'Budget (Cr)': pa.float32(),
+        'Timeline (months)': pa.int16(),
+        'Camps': pa.int32(),
+        'Coverage': pa.int64(),
+        'Cost (Cr)': pa.float64(),
+        'Budget Util %': pa.float32(),
+        'Cost/Enrollment': pa.float32(),
+        'Actual Timeline': pa.int16(),
+    },
+    'phased_deployment_plan': {
+        'Phase': pa.int16(),
+        'Quarter': pa.string(),
+        'Num_Camps': pa.int32(),
+        'Coverage': pa.int64(),
+        'Cost_Crores': pa.float64(),
+        'States_Covered': pa.int16(),
+        'Districts_Covered': pa.int16(),
+        'Avg_Days_Per_Camp': pa.int32(),
+        'Cumulative_Camps': pa.int32(),
+        'Cumulative_Coverage': pa.int64(),
+        'Cumulative_Cost': pa.float64(),
+    },
+    'pareto_frontier': {
+        'budget_crores': pa.float64(),
+        'cost_crores': pa.float64(),
+        'coverage': pa.int64(),
+        'num_camps': pa.int32(),
+    },
+}
+
+# Tables loaded by the web application, in load_data() order
+APP_TABLES = [
+    'district_gap_analysis',
+    'state_gap_analysis',
+    'mobile_camp_locations',
+    'optimization_scenarios',
+    'phased_deployment_plan',
+]
+
+
+# ============================================================================
+# CONVERSION
+# ============================================================================
+
+def _fits(values, arrow_type):
+    """Check that integer values fit the target Arrow integer type"""
+    info = np.iinfo(arrow_type.to_pandas_dtype())
+    return len(values) == 0 or (values.min() >= info.min and values.max() <= info.max)
+
+
+def _dictionary_type(series, arrow_type=CATEGORY):
+    """Dictionary type whose index holds every category (int32 beyond int16)"""
+    if series.nunique(dropna=True) > np.iinfo(arrow_type.index_type.to_pandas_dtype()).max:
+        return pa.dictionary(pa.int32(), arrow_type.value_type)
+    return arrow_type
+
+
+def _column_type(series, arrow_type):
+    """Resolve the Arrow type for one column, widening where the data requires it"""
+    if pa.types.is_dictionary(arrow_type):
+        return _dictionary_type(series, arrow_type)
+    if pa.types.is_string(arrow_type):
+        return arrow_type
+
+    values = pd.to_numeric(series, errors='coerce')
+    if pa.types.is_integer(arrow_type):
+        non_null = values.dropna()
+        # Integer columns that arrive with fractions are not integers
+        if not (non_null == np.floor(non_null)).all():
+            return pa.float64()
+        if not _fits(non_null, arrow_type):
+            return pa.int64()
+    return arrow_type
+
+
+def _infer_type(series):
+    """Downcast type for columns that have no schema entry"""
+    if pd.api.types.is_bool_dtype(series):
+        return pa.bool_()
+    if pd.api.types.is_integer_dtype(series):
+        return pa.from_numpy_dtype(pd.to_numeric(series, downcast='integer').dtype)
+    if pd.api.types.is_float_dtype(series):
+        return pa.float64()
+    if series.nunique(dropna=True) <= len(series) // 2:
+        return _dictionary_type(series)
+    return pa.string()
+
+
+def to_arrow(df, name):
+    """
+    Convert a processed DataFrame to an Arrow table with its explicit schema
+
+    Columns listed in SCHEMAS[name] get the declared type (integers are widened
+    only if the data would overflow). Columns not in the schema are downcast
+    from their pandas dtype.
+    """
+    declared = SCHEMAS.get(name, {})
+    fields = []
+    arrays = []
+
+    for col in df.columns:
+        series = df[col]
+        if col in declared:
+            arrow_type = _column_type(series, declared[col])
+        else:
+            arrow_type = _infer_type(series)
+
+        if pa.types.is_dictionary(arrow_type):
+            values = series.astype('string').astype('category')
+            array = pa.array(values, type=arrow_type)
+        elif pa.types.is_string(arrow_type):
+            array = pa.array(series.astype('string'), type=arrow_type)
+        else:
+            array = pa.array(pd.to_numeric(series, errors='coerce'), type=arrow_type, from_pandas=True)
+
+        fields.append(pa.field(col, arrow_type))
+        arrays.append(array)
+
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def convert_csv(csv_path, name=None, compression='snappy'):
+    """Convert one processed CSV to Parquet next to it"""
+    csv_path = Path(csv_path)
+    name = name or csv_path.stem
+    df = pd.read_csv(csv_path)
+    table = to_arrow(df, name)
+    parquet_path = csv_path.with_suffix('.parquet')
+    pq.write_table(table, parquet_path, compression=compression)
+    return parquet_path
+
+
+def convert_processed(data_path=DATA_PATH, tables=None, compression='snappy'):
+    """
+    One-shot conversion of the processed CSVs to Parquet
+
+    Parameters:
+    -----------
+    data_path : Path
+        Folder holding the processed CSV files
+    tables : list, optional
+        Table names to convert (defaults to every CSV in the folder)
+    compression : str
+        Parquet compression codec
+
+    Returns:
+    --------
+    written : list
+        Paths of the Parquet files written
+    """
+    data_path = Path(data_path)
+    if tables is None:
+        csv_files = sorted(data_path.glob("*.csv"))
+    else:
+        csv_files = [data_path / f"{name}.csv" for name in tables]
+
+    written = []
+    for csv_file in csv_files:
+        if csv_file.exists():
+            written.append(convert_csv(csv_file, compression=compression))
+    return written
+
+
+# ============================================================================
+# READING
+# ============================================================================
+
+def read_arrow(name, data_path=DATA_PATH, columns=None):
+    """
+    Read a processed table as an Arrow table, preferring the Parquet copy
+
+    The Parquet file is used only when it is at least as new as the CSV, so a
+    notebook re-run that rewrites the CSV is never shadowed by a stale copy.
+    Parquet reads are memory-mapped; the CSV fallback applies the same schema.
+    """
+    data_path = Path(data_path)
+    parquet_path = data_path / f"{name}.parquet"
+    csv_path = data_path / f"{name}.csv"
+
+    use_parquet = parquet_path.exists() and (
+        not csv_path.exists() or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+    )
+
+    if use_parquet:
+        return pq.read_table(parquet_path, columns=columns, memory_map=True)
+    return to_arrow(pd.read_csv(csv_path, usecols=columns), name)
+
+
+def read_table(name, data_path=DATA_PATH, columns=None):
+    """Read a processed table (see read_arrow) as a DataFrame"""
+    return read_arrow(name, data_path, columns).to_pandas()
+
+
+def data_version(data_path=DATA_PATH, tables=APP_TABLES, extra_files=()):
+    """
+    Fingerprint of the files behind the given tables
+
+    Hashes the name, size and modification time of every CSV / Parquet copy
+    (and of extra_files), so it changes whenever any of them is rewritten.
+    """
+    data_path = Path(data_path)
+    paths = [data_path / f"{name}.{ext}" for name in tables for ext in ('csv', 'parquet')]
+    paths += [data_path / name for name in extra_files]
+
+    digest = hashlib.sha1()
+    for path in paths:
+        if path.exists():
+            stat = path.stat()
+            digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()[:16]
+
+
+def load_app_tables(data_path=DATA_PATH):
+    """Load every table used by the web application, in APP_TABLES order"""
+    return tuple(read_table(name, data_path) for name in APP_TABLES)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert processed CSVs to Parquet")
+    parser.add_argument("--data-path", type=Path, default=DATA_PATH,
+                        help="Folder holding the processed CSV files")
+    parser.add_argument("--tables", nargs="*", default=None,
+                        help="Table names to convert (default: all CSVs)")
+    parser.add_argument("--compression", default="snappy",
+                        help="Parquet compression codec")
+    args = parser.parse_args(argv)
+
+    written = convert_processed(args.data_path, args.tables, args.compression)
+    for path in written:
+        print(f"✅ Saved: {path.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+LAST MILE CONNECT - Map Tiling
+Multi-zoom grid aggregation of camps and pincodes for the Interactive Map.
+
+Points are binned offline into square lon/lat grid cells at several zoom
+levels (cell side 360 / 2**zoom degrees), once for the whole country and
+once per state. The web application only reads the cells of the requested
+zoom that fall inside the viewport, so the browser never receives the
+individual pincodes, and no tile server is involved:
+
+    python -m src.tiling --data-path data/processed
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .features import build_clustering_data, load_pincode_geo
+
+DATA_PATH = Path("data/processed")
+EXTERNAL_PATH = Path("data/external")
+TILES_FILE = "map_tiles.parquet"
+
+ZOOM_LEVELS = [5, 6, 7, 8, 9, 10]
+
+# Viewport of the whole country: (lat_min, lat_max, lon_min, lon_max)
+INDIA_BOUNDS = (6.0, 37.5, 68.0, 98.0)
+
+ALL_STATES = ''
+
+TILE_COLUMNS = ['layer', 'zoom', 'state', 'cell_x', 'cell_y', 'latitude', 'longitude',
+                'count', 'weight', 'enrolment', 'coverage_rate']
+
+
+def cell_size(zoom):
+    """Cell side in degrees"""
+    return 360.0 / 2**zoom
+
+
+def cell_bounds(cell_x, cell_y, zoom):
+    """(lat_min, lat_max, lon_min, lon_max) of grid cells"""
+    size = cell_size(zoom)
+    lat_min = np.asarray(cell_y) * size - 90.0
+    lon_min = np.asarray(cell_x) * size - 180.0
+    return lat_min, lat_min + size, lon_min, lon_min + size
+
+
+# ============================================================================
+# BINNING
+# ============================================================================
+
+def bin_points(points, zoom, weight_col, enrolment_col=None, by_state=False):
+    """
+    Aggregate points into the grid cells of one zoom level
+
+    Parameters:
+    -----------
+    points : DataFrame
+        latitude, longitude, state and the weight / enrolment columns
+    weight_col : str
+        Summed per cell and used to weight the cell centroid
+    enrolment_col : str, optional
+        Summed per cell; with weight_col (unreached population) it gives the
+        cell coverage rate
+    by_state : bool
+        Bin each state separately (cells never mix states)
+
+    Returns:
+    --------
+    cells : DataFrame
+        One row per non-empty cell (TILE_COLUMNS without layer)
+    """
+    size = cell_size(zoom)
+    lat = points['latitude'].to_numpy(dtype=float)
+    lon = points['longitude'].to_numpy(dtype=float)
+    weight = np.nan_to_num(points[weight_col].to_numpy(dtype=float))
+
+    frame = pd.DataFrame({
+        'state': points['state'].astype(str).to_numpy() if by_state else ALL_STATES,
+        'cell_x': np.floor((lon + 180.0) / size).astype(np.int32),
+        'cell_y': np.floor((lat + 90.0) / size).astype(np.int32),
+        'count': 1,
+        'weight': weight,
+        # Weighted centroid; points without weight count once
+        'centroid_weight': np.where(weight > 0, weight, 1.0),
+    })
+    frame['lat_sum'] = lat * frame['centroid_weight']
+    frame['lon_sum'] = lon * frame['centroid_weight']
+    frame['enrolment'] = (np.nan_to_num(points[enrolment_col].to_numpy(dtype=float))
+                          if enrolment_col else 0.0)
+
+    cells = frame.groupby(['state', 'cell_x', 'cell_y'], as_index=False, sort=True).sum()
+    cells['latitude'] = cells['lat_sum'] / cells['centroid_weight']
+    cells['longitude'] = cells['lon_sum'] / cells['centroid_weight']
+    if enrolment_col:
+        # Enrolled share of the cell's reachable population (enrolled + unreached)
+        reachable = cells['enrolment'] + cells['weight']
+        cells['coverage_rate'] = (cells['enrolment'] / reachable.where(reachable > 0) * 100).round(2)
+    else:
+        cells['coverage_rate'] = np.nan
+    cells['zoom'] = zoom
+    return cells[TILE_COLUMNS[1:]]
+
+
+def build_tiles(camps_df, pincode_points=None, zoom_levels=ZOOM_LEVELS):
+    """
+    Tile table for every layer, zoom level and state
+
+    Parameters:
+    -----------
+    camps_df : DataFrame
+        mobile_camp_locations.csv (weight: coverage_population)
+    pincode_points : DataFrame, optional
+        Located pincodes with total_enrolment and estimated_unreached
+        (see src.features.build_clustering_data)
+
+    Returns:
+    --------
+    tiles : DataFrame
+        TILE_COLUMNS, sorted by layer, zoom, state and cell
+    """
+    layers = [('camps', camps_df, 'coverage_population', None)]
+    if pincode_points is not None:
+        layers.append(('pincodes', pincode_points, 'estimated_unreached', 'total_enrolment'))
+
+    parts = []
+    for layer, points, weight_col, enrolment_col in layers:
+        points = points.dropna(subset=['latitude', 'longitude'])
+        for zoom in zoom_levels:
+            for by_state in (False, True):
+                cells = bin_points(points, zoom, weight_col, enrolment_col, by_state)
+                cells.insert(0, 'layer', layer)
+                parts.append(cells)
+
+    tiles = pd.concat(parts, ignore_index=True)
+    tiles = tiles.astype({'zoom': np.int8, 'count': np.int32, 'weight': np.int64,
+                          'enrolment': np.int64, 'latitude': np.float32,
+                          'longitude': np.float32, 'coverage_rate': np.float32})
+    return tiles.sort_values(['layer', 'zoom', 'state', 'cell_y', 'cell_x']).reset_index(drop=True)
+
+
+# ============================================================================
+# VIEWPORT QUERIES (web application side)
+# ============================================================================
+
+class TileIndex:
+    """
+    Tile table split by (layer, zoom, state) for viewport queries
+
+    Parameters:
+    -----------
+    tiles : DataFrame
+        Output of build_tiles()
+    """
+
+    def __init__(self, tiles):
+        self.zoom_levels = sorted(tiles['zoom'].unique().tolist())
+        self.layers = sorted(tiles['layer'].unique().tolist())
+        self._groups = {
+            (layer, int(zoom), state): group.reset_index(drop=True)
+            for (layer, zoom, state), group in tiles.groupby(['layer', 'zoom', 'state'], sort=False)
+        }
+
+        # State extents from the finest camp / pincode cells
+        finest = tiles[(tiles['zoom'] == self.zoom_levels[-1]) & (tiles['state'] != ALL_STATES)]
+        self._extents = finest.groupby('state').agg(
+            lat_min=('latitude', 'min'), lat_max=('latitude', 'max'),
+            lon_min=('longitude', 'min'), lon_max=('longitude', 'max')
+        )
+
+    def bounds(self, state=None, margin=0.5):
+        """Viewport (lat_min, lat_max, lon_min, lon_max) of a state or the country"""
+        if not state or state not in self._extents.index:
+            return INDIA_BOUNDS
+        extent = self._extents.loc[state]
+        return (float(extent['lat_min']) - margin, float(extent['lat_max']) + margin,
+                float(extent['lon_min']) - margin, float(extent['lon_max']) + margin)
+
+    def query(self, layer, zoom, state=None, bounds=None):
+        """
+        Cells of one layer and zoom level inside the viewport
+
+        Parameters:
+        -----------
+        layer : str
+            'camps' or 'pincodes'
+        zoom : int
+            Zoom level (one of zoom_levels)
+        state : str, optional
+            Only this state's points
+        bounds : tuple, optional
+            (lat_min, lat_max, lon_min, lon_max); defaults to the state /
+            country viewport
+        """
+        cells = self._groups.get((layer, int(zoom), state or ALL_STATES))
+        if cells is None:
+            return pd.DataFrame(columns=TILE_COLUMNS)
+        if bounds is None:
+            bounds = self.bounds(state)
+
+        lat_min, lat_max, lon_min, lon_max = bounds
+        cell_lat_min, cell_lat_max, cell_lon_min, cell_lon_max = cell_bounds(
+            cells['cell_x'].to_numpy(), cells['cell_y'].to_numpy(), zoom
+        )
+        visible = ((cell_lat_max > lat_min) & (cell_lat_min < lat_max) &
+                   (cell_lon_max > lon_min) & (cell_lon_min < lon_max))
+        return cells[visible]
+
+
+def load_tiles(data_path=DATA_PATH):
+    """Tile table, or None if it was never built"""
+    path = Path(data_path) / TILES_FILE
+    if not path.exists():
+        return None
+    return pd.read_parquet(path)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute multi-zoom map tiles")
+    parser.add_argument("--data-path", type=Path, default=DATA_PATH)
+    parser.add_argument("--external-path", type=Path, default=EXTERNAL_PATH)
+    args = parser.parse_args(argv)
+
+    camps_df = pd.read_csv(args.data_path / "mobile_camp_locations.csv")
+
+    pincode_points = None
+    pincode_geo = load_pincode_geo(args.external_path)
+    pincode_path = args.data_path / "pincode_enrolment.csv"
+    if pincode_geo is not None and pincode_path.exists():
+        gap_df = pd.read_csv(args.data_path / "district_gap_analysis.csv")
+        pincode_points = build_clustering_data(pd.read_csv(pincode_path), gap_df, pincode_geo)
+    else:
+        print("⚠️  Pincode coordinates or enrolment not found - camps layer only")
+
+    tiles = build_tiles(camps_df, pincode_points)
+    tiles.to_parquet(args.data_path / TILES_FILE, index=False)
+    print(f"✅ Saved: {TILES_FILE} ({len(tiles):,} cells)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+LAST MILE CONNECT - Uncertainty Analysis
+Monte Carlo confidence bands for camp and scenario coverage and cost.
+
+The camp cost model (setup + days x daily cost + enrolments x per-enrolment
+cost, days = coverage / enrolment rate) is evaluated on sampled inputs:
+
+- population: each camp's coverage_population times a log-normal projection
+  error (one national factor shared by all camps, one per camp)
+- enrolment rate: triangular around ENROLLMENT_CAPACITY_PER_DAY, per camp
+- daily, per-enrolment and setup costs: triangular, shared by all camps of
+  a draw (market rates)
+
+Draws are vectorised over (draws x camps) blocks and split into fixed-size
+tasks, each seeded from one SeedSequence and run in a process pool, so the
+result depends on the seed but not on the number of workers:
+
+    python -m src.uncertainty --draws 100000 --workers 8
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .clustering import (
+    COST_PER_CAMP_OPERATION_DAY, COST_PER_CAMP_SETUP, COST_PER_ENROLLMENT,
+    ENROLLMENT_CAPACITY_PER_DAY,
+)
+from .optimizer import CRORE, DAYS_PER_MONTH, SCENARIOS, optimize_camp_deployment
+
+DATA_PATH = Path("data/processed")
+CAMP_FILE = "camp_uncertainty.csv"
+SCENARIO_FILE = "scenario_uncertainty.csv"
+
+NUM_DRAWS = 100_000
+RANDOM_STATE = 42
+
+# Draws per pool task (fixed, so results do not depend on the worker count)
+DRAWS_PER_TASK = 10_000
+
+# Largest draws x camps block evaluated at once
+MAX_BLOCK_CELLS = 2_000_000
+
+QUANTILES = {'p10': 0.10, 'p50': 0.50, 'p90': 0.90}
+
+# Input distributions: log-normal sigmas, and triangular (low, mode, high)
+# multipliers of the point estimates in src.clustering
+UNCERTAINTY = {
+    'national_population_sigma': 0.05,
+    'camp_population_sigma': 0.15,
+    'enrollment_rate': (0.7, 1.0, 1.2),
+    'daily_cost': (0.9, 1.0, 1.3),
+    'enrollment_cost': (0.9, 1.0, 1.2),
+    'setup_cost': (0.9, 1.0, 1.2),
+}
+
+# Per-camp bands are histograms of log(draw / point estimate): mergeable
+# across tasks, resolution 2 * LOG_RANGE / HIST_BINS (0.25%)
+LOG_RANGE = 1.5
+HIST_BINS = 1200
+
+CAMP_METRICS = ['coverage', 'cost', 'days']
+
+
+# ============================================================================
+# SAMPLING
+# ============================================================================
+
+def sample_block(coverage, rng, n_draws, params=UNCERTAINTY):
+    """
+    Coverage, cost (INR) and days of every camp for n_draws draws
+
+    Returns:
+    --------
+    samples : dict of ndarray
+        coverage, cost and days, each (n_draws, N)
+    """
+    n_camps = len(coverage)
+    population = coverage * np.exp(
+        rng.normal(0.0, params['national_population_sigma'], (n_draws, 1)) +
+        rng.normal(0.0, params['camp_population_sigma'], (n_draws, n_camps))
+    )
+    rate = ENROLLMENT_CAPACITY_PER_DAY * rng.triangular(*params['enrollment_rate'], (n_draws, n_camps))
+    daily_cost = COST_PER_CAMP_OPERATION_DAY * rng.triangular(*params['daily_cost'], (n_draws, 1))
+    enrollment_cost = COST_PER_ENROLLMENT * rng.triangular(*params['enrollment_cost'], (n_draws, 1))
+    setup_cost = COST_PER_CAMP_SETUP * rng.triangular(*params['setup_cost'], (n_draws, 1))
+
+    population = np.round(population)
+    days = np.ceil(population / rate)
+    cost = setup_cost + days * daily_cost + population * enrollment_cost
+    return {'coverage': population, 'cost': cost, 'days': days}
+
+
+def _log_ratio_bins(values, point):
+    """Histogram bin of each value relative to its camp's point estimate"""
+    ratio = np.log(np.maximum(values, 1.0) / point)
+    bins = ((ratio + LOG_RANGE) * (HIST_BINS / (2 * LOG_RANGE))).astype(np.int64)
+    return bins.clip(0, HIST_BINS - 1)
+
+
+def _run_task(coverage, points, selection, seed_seq, n_draws, params):
+    """
+    Worker task: n_draws draws from seed_seq
+
+    Returns:
+    --------
+    histograms : dict
+        Per camp metric, (N, HIST_BINS) counts
+    totals : dict
+        Per scenario coverage, cost and timeline days, (n_draws, K)
+    """
+    rng = np.random.default_rng(seed_seq)
+    n_camps = len(coverage)
+    offsets = (np.arange(n_camps) * HIST_BINS)[None, :]
+    histograms = {metric: np.zeros(n_camps * HIST_BINS, dtype=np.int64) for metric in CAMP_METRICS}
+    totals = {'coverage': [], 'cost': [], 'days': []}
+
+    block = max(MAX_BLOCK_CELLS // max(n_camps, 1), 1)
+    for first in range(0, n_draws, block):
+        samples = sample_block(coverage, rng, min(block, n_draws - first), params)
+        for metric in CAMP_METRICS:
+            flat = (_log_ratio_bins(samples[metric], points[metric]) + offsets).ravel()
+            histograms[metric] += np.bincount(flat, minlength=n_camps * HIST_BINS)
+
+        totals['coverage'].append(samples['coverage'] @ selection.T)
+        totals['cost'].append(samples['cost'] @ selection.T)
+        totals['days'].append(np.column_stack([
+            np.where(mask, samples['days'], 0).max(axis=1) for mask in selection.astype(bool)
+        ]) if len(selection) else np.empty((len(samples['days']), 0)))
+
+    return ({metric: counts.reshape(n_camps, HIST_BINS) for metric, counts in histograms.items()},
+            {name: np.vstack(parts) for name, parts in totals.items()})
+
+
+def _histogram_quantiles(counts, point, quantiles):
+    """Quantiles (N, len(quantiles)) from per-camp log-ratio histograms"""
+    cdf = np.cumsum(counts, axis=1)
+    targets = cdf[:, -1:] * np.asarray(quantiles)[None, :]
+    # First bin whose cumulative count reaches each target, per camp
+    bins = (cdf[:, None, :] < targets[:, :, None]).sum(axis=2)
+    centres = -LOG_RANGE + (bins + 0.5) * (2 * LOG_RANGE / HIST_BINS)
+    return point[:, None] * np.exp(centres)
+
+
+# ============================================================================
+# MONTE CARLO
+# ============================================================================
+
+def scenario_selections(camps_df, scenarios=SCENARIOS):
+    """
+    Camps selected in each scenario (greedy optimiser of notebook 05)
+
+    Returns:
+    --------
+    selection : ndarray
+        (K, N) 0/1 matrix aligned with camps_df rows
+    """
+    selection = np.zeros((len(scenarios), len(camps_df)))
+    for k, params in enumerate(scenarios.values()):
+        _, selected = optimize_camp_deployment(
+            camps_df, params['budget_crores'], params['timeline_months'],
+            params['priority_filter'], verbose=False
+        )
+        if len(selected):
+            selection[k] = camps_df.index.isin(selected.index)
+    return selection
+
+
+def monte_carlo(camps_df, scenarios=SCENARIOS, num_draws=NUM_DRAWS, workers=-1,
+                seed=RANDOM_STATE, params=UNCERTAINTY):
+    """
+    P10 / P50 / P90 coverage, cost and duration per camp and per scenario
+
+    Parameters:
+    -----------
+    camps_df : DataFrame
+        mobile_camp_locations.csv
+    scenarios : dict
+        Optimisation scenarios (src.optimizer.SCENARIOS layout)
+    num_draws : int
+        Monte Carlo draws
+    workers : int
+        Worker processes (-1: all CPUs, 1: in-process)
+    seed : int
+        Root of the SeedSequence
+
+    Returns:
+    --------
+    camp_bands : DataFrame
+        camp_id and <metric>_p10/p50/p90 for coverage, cost and days
+    scenario_bands : DataFrame
+        Per scenario: coverage, cost (Crores) and timeline (months) bands,
+        and the probability that the cost exceeds the budget
+    """
+    camps_df = camps_df.reset_index(drop=True)
+    coverage = camps_df['coverage_population'].to_numpy(dtype=float)
+    points = {
+        'coverage': np.maximum(coverage, 1.0),
+        'cost': camps_df['total_cost'].to_numpy(dtype=float),
+        'days': np.maximum(camps_df['estimated_days'].to_numpy(dtype=float), 1.0),
+    }
+    selection = scenario_selections(camps_df, scenarios)
+
+    sizes = [min(DRAWS_PER_TASK, num_draws - first) for first in range(0, num_draws, DRAWS_PER_TASK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(coverage, points, selection, seed_seq, size, params) for seed_seq, size in zip(seeds, sizes)]
+
+    workers = os.cpu_count() if workers in (None, -1) else max(1, workers)
+    workers = min(workers, len(args))
+    if workers == 1:
+        results = [_run_task(*task) for task in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_run_task, *zip(*args)))
+
+    histograms = {metric: sum(hist[metric] for hist, _ in results) for metric in CAMP_METRICS}
+    totals = {name: np.vstack([total[name] for _, total in results]) for name in results[0][1]}
+
+    labels, levels = list(QUANTILES), list(QUANTILES.values())
+    camp_bands = pd.DataFrame({'camp_id': camps_df['camp_id'].to_numpy()})
+    for metric in CAMP_METRICS:
+        bands = _histogram_quantiles(histograms[metric], points[metric], levels)
+        for i, label in enumerate(labels):
+            values = bands[:, i] / CRORE if metric == 'cost' else bands[:, i]
+            camp_bands[f"{metric}{'_crores' if metric == 'cost' else ''}_{label}"] = (
+                values.round(2) if metric == 'cost' else np.round(values).astype(np.int64)
+            )
+
+    budgets = np.array([params_['budget_crores'] for params_ in scenarios.values()], dtype=float)
+    scenario_bands = pd.DataFrame({'Scenario': list(scenarios),
+                                   'Budget (Cr)': budgets,
+                                   'Camps': selection.sum(axis=1).astype(int)})
+    quantiles = {name: np.quantile(values, levels, axis=0) for name, values in totals.items()}
+    for i, label in enumerate(labels):
+        scenario_bands[f'coverage_{label}'] = np.round(quantiles['coverage'][i]).astype(np.int64)
+    for i, label in enumerate(labels):
+        scenario_bands[f'cost_crores_{label}'] = (quantiles['cost'][i] / CRORE).round(2)
+    for i, label in enumerate(labels):
+        scenario_bands[f'timeline_months_{label}'] = np.ceil(quantiles['days'][i] / DAYS_PER_MONTH).astype(int)
+    scenario_bands['prob_over_budget'] = (totals['cost'] > budgets * CRORE).mean(axis=0).round(4)
+    return camp_bands, scenario_bands
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo coverage and cost bands")
+    parser.add_argument("--data-path", type=Path, default=DATA_PATH)
+    parser.add_argument("--draws", type=int, default=NUM_DRAWS)
+    parser.add_argument("--workers", type=int, default=-1, help="Worker processes")
+    parser.add_argument("--seed", type=int, default=RANDOM_STATE)
+    args = parser.parse_args(argv)
+
+    camps_df = pd.read_csv(args.data_path / "mobile_camp_locations.csv")
+    camp_bands, scenario_bands = monte_carlo(camps_df, num_draws=args.draws,
+                                             workers=args.workers, seed=args.seed)
+
+    print(f"\n📊 SCENARIO BANDS ({args.draws:,} draws):")
+    print(scenario_bands.to_string(index=False))
+
+    camp_bands.to_csv(args.data_path / CAMP_FILE, index=False)
+    scenario_bands.to_csv(args.data_path / SCENARIO_FILE, index=False)
+    print(f"\n✅ Saved: {CAMP_FILE}")
+    print(f"✅ Saved: {SCENARIO_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""
+LAST MILE CONNECT - Data Validation
+Declarative data-quality rules for the processed tables (notebooks 05/06
+checks without Jupyter).
+
+Rules are tables of constants, evaluated in one vectorised pass per table:
+
+- SCHEMAS: required columns, their kind (str / int / number) and no nulls
+- RANGES / ALLOWED / UNIQUE_KEYS: value bounds, categories and keys
+- REFERENCES: every (state, district) / camp_id exists in the parent table
+- ROLLUPS / IDENTITIES: state rows equal their district sums, derived
+  columns equal their formulas
+- model checks (notebook 06): capacity alignment, state allocation, cost
+  per enrolment
+
+Failures of the first four groups are errors (the pipeline's validate stage
+fails and blocks convert); model checks are warnings:
+
+    python -m src.validation --data-path data/processed
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .gap_analysis import PRIORITY_LEVELS, state_rollup
+
+DATA_PATH = Path("data/processed")
+VALIDATION_FILE = "model_validation.csv"
+
+TABLES = ['district_gap_analysis', 'state_gap_analysis', 'mobile_camp_locations',
+          'pincode_enrolment', 'pincode_camp_assignments']
+
+# Required columns and kinds ('str', 'int', 'number')
+SCHEMAS = {
+    'district_gap_analysis': {
+        'state': 'str', 'district': 'str', 'total_enrolment': 'int', 'population_2025': 'number',
+        'coverage_rate': 'number', 'unreached_population': 'int', 'coverage_gap_pct': 'number',
+        'priority_level': 'str', 'priority_score': 'number', 'priority_rank': 'int',
+    },
+    'state_gap_analysis': {
+        'state': 'str', 'population': 'number', 'enrolled': 'int', 'unreached': 'int',
+        'num_districts': 'int', 'coverage_rate': 'number', 'gap_pct': 'number',
+    },
+    'mobile_camp_locations': {
+        'camp_id': 'int', 'state': 'str', 'district': 'str', 'latitude': 'number',
+        'longitude': 'number', 'coverage_population': 'int', 'camp_priority': 'str',
+        'estimated_days': 'number', 'total_cost': 'number',
+    },
+    'pincode_enrolment': {
+        'state': 'str', 'district': 'str', 'pincode': 'int', 'total_enrolment': 'int',
+    },
+    'pincode_camp_assignments': {
+        'state': 'str', 'district': 'str', 'pincode': 'int', 'camp_id': 'int',
+    },
+}
+
+# Inclusive (low, high) bounds, None = unbounded
+RANGES = {
+    'district_gap_analysis': {
+        'total_enrolment': (0, None), 'population_2025': (0, None), 'coverage_rate': (0, 100),
+        'unreached_population': (0, None), 'coverage_gap_pct': (0, 100),
+        'priority_score': (0, 100), 'priority_rank': (1, None),
+    },
+    'state_gap_analysis': {
+        'population': (0, None), 'enrolled': (0, None), 'unreached': (0, None),
+        'num_districts': (1, None), 'coverage_rate': (0, 100), 'gap_pct': (0, 100),
+    },
+    'mobile_camp_locations': {
+        'latitude': (6, 38), 'longitude': (68, 98),  # India bounding box
+        'coverage_population': (0, None), 'estimated_days': (0, None), 'total_cost': (0, None),
+    },
+    'pincode_enrolment': {'pincode': (100000, 999999), 'total_enrolment': (0, None)},
+    'pincode_camp_assignments': {'pincode': (100000, 999999)},
+}
+
+ALLOWED = {
+    'district_gap_analysis': {'priority_level': PRIORITY_LEVELS},
+    'mobile_camp_locations': {'camp_priority': PRIORITY_LEVELS},
+}
+
+UNIQUE_KEYS = {
+    'district_gap_analysis': ['state', 'district'],
+    'state_gap_analysis': ['state'],
+    'mobile_camp_locations': ['camp_id'],
+    'pincode_enrolment': ['state', 'district', 'pincode'],
+    'pincode_camp_assignments': ['state', 'district', 'pincode'],
+}
+
+# (table, columns, parent table, parent columns)
+REFERENCES = [
+    ('mobile_camp_locations', ['state', 'district'], 'district_gap_analysis', ['state', 'district']),
+    ('pincode_enrolment', ['state', 'district'], 'district_gap_analysis', ['state', 'district']),
+    ('pincode_camp_assignments', ['state', 'district'], 'district_gap_analysis', ['state', 'district']),
+    ('pincode_camp_assignments', ['camp_id'], 'mobile_camp_locations', ['camp_id']),
+    ('state_gap_analysis', ['state'], 'district_gap_analysis', ['state']),
+]
+
+# State columns that must equal the state_rollup() of the district table
+ROLLUPS = ['population', 'enrolled', 'unreached', 'num_districts']
+
+# Row identities of the district table: column, formula, tolerance
+IDENTITIES = [
+    ('coverage_gap_pct', lambda df: 100 - df['coverage_rate'], 0.011),
+    ('unreached_population', lambda df: (df['population_2025'] - df['total_enrolment']).clip(lower=0), 1),
+]
+
+# Absolute tolerance of rollup comparisons (population is rounded per district)
+ROLLUP_TOLERANCE = 1
+
+# Notebook 06 checks
+COST_BENCHMARK = 100  # ₹ per enrolment
+ALIGNMENT_RANGE = (80, 120)  # camp capacity as % of unreached demand
+
+KIND_CHECKS = {
+    'str': lambda s: pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s),
+    'int': pd.api.types.is_integer_dtype,
+    'number': lambda s: pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s),
+}
+
+
+class ValidationError(Exception):
+    """Raised by validate_or_raise when error-level rules fail"""
+
+
+def _result(table, rule, check, value, expected, passed, severity='error'):
+    return {'table': table, 'rule': rule, 'check': check, 'value': value,
+            'expected': expected, 'passed': bool(passed), 'severity': severity}
+
+
+# ============================================================================
+# TABLE RULES
+# ============================================================================
+
+def check_table(name, df):
+    """
+    Schema, null, range, category and key rules of one table
+
+    Range and null counts are taken over one (rows x columns) array per
+    table rather than per column.
+    """
+    results = []
+    schema = SCHEMAS.get(name, {})
+    missing = [col for col in schema if col not in df.columns]
+    results.append(_result(name, 'schema', 'required_columns', len(missing),
+                           'none missing' if not missing else f"missing {missing}", not missing))
+    present = [col for col in schema if col in df.columns]
+
+    wrong = [col for col in present if not KIND_CHECKS[schema[col]](df[col])]
+    results.append(_result(name, 'schema', 'column_types', len(wrong),
+                           'as declared' if not wrong else f"wrong type {wrong}", not wrong))
+
+    nulls = df[present].isna().to_numpy().sum(axis=0) if present else np.zeros(0, dtype=int)
+    results.append(_result(name, 'schema', 'null_values', int(nulls.sum()), 0, nulls.sum() == 0))
+
+    bounds = {col: bound for col, bound in RANGES.get(name, {}).items()
+              if col in present and col not in wrong}
+    if bounds:
+        values = df[list(bounds)].to_numpy(dtype=float)
+        low = np.array([-np.inf if lo is None else lo for lo, _ in bounds.values()])
+        high = np.array([np.inf if hi is None else hi for _, hi in bounds.values()])
+        outside = ((values < low) | (values > high)).sum(axis=0)
+        for (col, (lo, hi)), count in zip(bounds.items(), outside):
+            results.append(_result(name, 'range', col, int(count),
+                                   f"{'-inf' if lo is None else lo} to {'inf' if hi is None else hi}",
+                                   count == 0))
+
+    for col, values in ALLOWED.get(name, {}).items():
+        if col in present:
+            count = int((~df[col].isin(values)).sum())
+            results.append(_result(name, 'allowed', col, count, f"in {list(values)}", count == 0))
+
+    key = UNIQUE_KEYS.get(name)
+    if key and all(col in df.columns for col in key):
+        count = int(df.duplicated(key).sum())
+        results.append(_result(name, 'unique', '+'.join(key), count, 0, count == 0))
+    return results
+
+
+def check_references(tables):
+    """Every child key exists in its parent table"""
+    results = []
+    for child, columns, parent, parent_columns in REFERENCES:
+        if child not in tables or parent not in tables:
+            continue
+        child_df, parent_df = tables[child], tables[parent]
+        if not all(col in child_df.columns for col in columns) or \
+                not all(col in parent_df.columns for col in parent_columns):
+            continue
+        keys = pd.MultiIndex.from_frame(child_df[columns])
+        parent_keys = pd.MultiIndex.from_frame(parent_df[parent_columns])
+        count = int((~keys.isin(parent_keys)).sum())
+        results.append(_result(child, 'reference', f"{'+'.join(columns)} -> {parent}", count, 0,
+                               count == 0))
+    return results
+
+
+def check_consistency(tables):
+    """State rows against their district sums, derived district columns"""
+    results = []
+    gap_df = tables.get('district_gap_analysis')
+    state_df = tables.get('state_gap_analysis')
+    if gap_df is None:
+        return results
+
+    if state_df is not None:
+        rollup = state_rollup(gap_df).set_index('state')[ROLLUPS]
+        stored = state_df.set_index('state').reindex(rollup.index)[ROLLUPS]
+        diff = (stored.to_numpy(dtype=float) - rollup.to_numpy(dtype=float))
+        mismatched = (np.isnan(diff) | (np.abs(diff) > ROLLUP_TOLERANCE)).sum(axis=0)
+        for col, count in zip(ROLLUPS, mismatched):
+            results.append(_result('state_gap_analysis', 'consistency', f"{col} = district sum",
+                                   int(count), 0, count == 0))
+
+    for col, formula, tolerance in IDENTITIES:
+        count = int((np.abs(gap_df[col] - formula(gap_df)) > tolerance).sum())
+        results.append(_result('district_gap_analysis', 'consistency', f"{col} formula", count, 0,
+                               count == 0))
+    return results
+
+
+# ============================================================================
+# MODEL CHECKS (notebook 06)
+# ============================================================================
+
+def model_checks(camps_df, gap_df):
+    """
+    Notebook 06 checks: camp capacity against unreached demand, camps per
+    state against unreached population, and cost per enrolment
+
+    Returns:
+    --------
+    checks : DataFrame
+        check, value, expected and passed
+    """
+    capacity = camps_df['coverage_population'].sum()
+    alignment = capacity / gap_df['unreached_population'].sum() * 100
+    correlation = camps_df.groupby('state').size().corr(
+        gap_df.groupby('state')['unreached_population'].sum()
+    )
+    cost_per_person = camps_df['total_cost'].sum() / capacity
+
+    low, high = ALIGNMENT_RANGE
+    return pd.DataFrame([
+        {'check': 'capacity_alignment_pct', 'value': round(alignment, 2),
+         'expected': f'{low}-{high}', 'passed': bool(low <= alignment <= high)},
+        {'check': 'state_allocation_correlation', 'value': round(correlation, 3),
+         'expected': '> 0', 'passed': bool(correlation > 0)},
+        {'check': 'cost_per_enrolment', 'value': round(cost_per_person, 2),
+         'expected': f'<= {COST_BENCHMARK}', 'passed': bool(cost_per_person <= COST_BENCHMARK)},
+    ])
+
+
+# ============================================================================
+# SUITE
+# ============================================================================
+
+def validate(tables):
+    """
+    Run every rule on the given tables
+
+    Parameters:
+    -----------
+    tables : dict
+        Table name (TABLES) -> DataFrame; rules on absent tables are skipped
+
+    Returns:
+    --------
+    report : DataFrame
+        table, rule, check, value, expected, passed and severity
+    """
+    results = []
+    for name, df in tables.items():
+        results.extend(check_table(name, df))
+    results.extend(check_references(tables))
+    results.extend(check_consistency(tables))
+
+    camps_df, gap_df = tables.get('mobile_camp_locations'), tables.get('district_gap_analysis')
+    if camps_df is not None and gap_df is not None and len(camps_df) and \
+            {'state', 'coverage_population', 'total_cost'} <= set(camps_df.columns) and \
+            {'state', 'unreached_population'} <= set(gap_df.columns):
+        for check in model_checks(camps_df, gap_df).to_dict('records'):
+            results.append(_result('mobile_camp_locations', 'model', check['check'], check['value'],
+                                   check['expected'], check['passed'], severity='warning'))
+    return pd.DataFrame(results)
+
+
+def load_tables(data_path=DATA_PATH, tables=TABLES):
+    """Processed tables present in data_path"""
+    data_path = Path(data_path)
+    return {name: pd.read_csv(data_path / f"{name}.csv")
+            for name in tables if (data_path / f"{name}.csv").exists()}
+
+
+def errors(report):
+    """Failed error-level rules"""
+    return report[~report['passed'] & (report['severity'] == 'error')]
+
+
+def validate_or_raise(report):
+    """Raise ValidationError listing the failed error-level rules"""
+    failed = errors(report)
+    if len(failed):
+        lines = [f"{row['table']}: {row['rule']} {row['check']} ({row['value']}, expected {row['expected']})"
+                 for row in failed.to_dict('records')]
+        raise ValidationError(f"{len(failed)} validation rule(s) failed:\n  " + "\n  ".join(lines))
+
+
+def run_validation(data_path=DATA_PATH):
+    """Validate the processed tables, write VALIDATION_FILE, return the report"""
+    report = validate(load_tables(data_path))
+    report.to_csv(Path(data_path) / VALIDATION_FILE, index=False)
+    return report
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate the processed tables")
+    parser.add_argument("--data-path", type=Path, default=DATA_PATH)
+    args = parser.parse_args(argv)
+
+    report = run_validation(args.data_path)
+    failed = report[~report['passed']]
+    print(f"\n📋 {len(report)} checks, {len(errors(report))} errors, "
+          f"{len(failed) - len(errors(report))} warnings")
+    if len(failed):
+        print(failed.to_string(index=False))
+    print(f"✅ Saved: {VALIDATION_FILE}")
+    if len(errors(report)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()